@@ -0,0 +1,83 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from app.core.config import settings
+from app.core.database import Base
+
+# Import all models so SQLAlchemy registers them
+from app.models import user  # noqa: F401
+from app.models import project  # noqa: F401
+from app.models import project_member  # noqa: F401
+from app.models import ticket  # noqa: F401
+from app.models import comment  # noqa: F401
+from app.models import project_stats  # noqa: F401
+from app.models import project_version  # noqa: F401
+from app.models import ticket_tombstone  # noqa: F401
+from app.models import ticket_event  # noqa: F401
+from app.models import ticket_flow  # noqa: F401
+from app.models import project_daily_flow  # noqa: F401
+from app.models import analytics_watermark  # noqa: F401
+from app.models import archived_ticket  # noqa: F401
+from app.models import archived_comment  # noqa: F401
+from app.models import job  # noqa: F401
+from app.models import notification  # noqa: F401
+from app.models import import_ref  # noqa: F401
+
+# =========================
+# Migration environment
+# =========================
+#
+# Runs on its own connection without the app's pool or
+# DB_STATEMENT_TIMEOUT_MS: index builds can take longer than any request.
+
+config = context.config
+if config.config_file_name is not None:
+    # Keep the app's loggers when run from scripts/create_tables.py
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    """
+    Print the SQL instead of running it (alembic upgrade head --sql).
+    """
+    context.configure(
+        url=settings.database_url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_on(connection):
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite can't ALTER most things: rebuild the table instead
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    # A caller can hand over its own connection (tests)
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run_on(connection)
+        return
+
+    engine = create_engine(settings.database_url, poolclass=pool.NullPool)
+    with engine.connect() as connection:
+        run_on(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
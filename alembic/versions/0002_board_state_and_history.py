@@ -0,0 +1,253 @@
+"""board state and history
+
+What the board features added to the original schema:
+
+- tickets: card rank and version columns, timestamps made NOT NULL
+  (missing values backfilled), keyset / column / version indexes
+- comments: thread index; project_members: one row per (user, project)
+- new tables: project_ticket_counts (backfilled from the tickets),
+  project_versions, ticket_tombstones, ticket_events, ticket_flow,
+  project_daily_flow, analytics_watermarks, archived_tickets,
+  archived_comments
+- full-text search indexes (Postgres only)
+
+Indexes on the existing tables are built online (see
+app.core.migrations).
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 19:21:40.118402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.migrations import create_index_online, drop_index_online
+
+# The tickets table created these types already (Postgres)
+ticket_status = postgresql.ENUM(
+    'todo', 'in_progress', 'done', name='ticket_status_enum', create_type=False
+)
+ticket_priority = postgresql.ENUM(
+    'low', 'medium', 'high', 'critical', name='ticket_priority_enum', create_type=False
+)
+ticket_type = postgresql.ENUM(
+    'bug', 'task', 'feature', name='ticket_type_enum', create_type=False
+)
+
+RANK = sa.String(length=64).with_variant(sa.String(length=64, collation='C'), 'postgresql')
+
+# On the existing tables, so built online
+INDEXES = (
+    ('ix_tickets_project_created', 'tickets', ['project_id', 'created_at', 'id']),
+    ('ix_tickets_project_updated', 'tickets', ['project_id', 'updated_at', 'id']),
+    ('ix_tickets_project_version', 'tickets', ['project_id', 'version']),
+    ('ix_tickets_project_status_rank', 'tickets', ['project_id', 'status', 'rank']),
+    ('ix_comments_ticket_parent_created', 'comments', ['ticket_id', 'parent_id', 'created_at']),
+    ('ix_project_members_project', 'project_members', ['project_id']),
+)
+
+# Full-text search (Postgres only): must match app.core.search.search_vector
+TICKET_VECTOR = "to_tsvector('english', (coalesce(title, '') || ' ') || coalesce(description, ''))"
+COMMENT_VECTOR = "to_tsvector('english', coalesce(content, ''))"
+SEARCH_INDEXES = (
+    ('ix_tickets_search', 'tickets', TICKET_VECTOR),
+    ('ix_comments_search', 'comments', COMMENT_VECTOR),
+    ('ix_archived_tickets_search', 'archived_tickets', TICKET_VECTOR),
+    ('ix_archived_comments_search', 'archived_comments', COMMENT_VECTOR),
+)
+
+# Dashboard counters: (dimension, value expression) as app.core.stats keys them
+COUNTED = (
+    ('status', 'CAST(status AS VARCHAR(64))'),
+    ('priority', 'CAST(priority AS VARCHAR(64))'),
+    ('type', 'CAST(type AS VARCHAR(64))'),
+    ('assignee_id', "COALESCE(CAST(assignee_id AS VARCHAR(64)), 'unassigned')"),
+)
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_tables() -> None:
+    op.create_table('analytics_watermarks',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('last_event_id', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_table('archived_tickets',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('status', ticket_status, nullable=False),
+    sa.Column('priority', ticket_priority, nullable=False),
+    sa.Column('type', ticket_type, nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('reporter_id', sa.Integer(), nullable=False),
+    sa.Column('assignee_id', sa.Integer(), nullable=True),
+    sa.Column('rank', RANK, nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('archived_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['assignee_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.ForeignKeyConstraint(['reporter_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_archived_tickets_project_created', 'archived_tickets', ['project_id', 'created_at', 'id'])
+    op.create_index('ix_archived_tickets_project_updated', 'archived_tickets', ['project_id', 'updated_at', 'id'])
+
+    op.create_table('archived_comments',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('ticket_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('parent_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['ticket_id'], ['archived_tickets.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_archived_comments_ticket_created', 'archived_comments', ['ticket_id', 'created_at'])
+
+    op.create_table('project_daily_flow',
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(length=32), nullable=False),
+    sa.Column('entered', sa.Integer(), nullable=False),
+    sa.Column('exited', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.PrimaryKeyConstraint('project_id', 'day', 'status')
+    )
+    op.create_table('project_ticket_counts',
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('dimension', sa.String(length=32), nullable=False),
+    sa.Column('value', sa.String(length=64), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.PrimaryKeyConstraint('project_id', 'dimension', 'value')
+    )
+    op.create_table('project_versions',
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('pruned_version', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.PrimaryKeyConstraint('project_id')
+    )
+    op.create_table('ticket_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('ticket_id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('actor_id', sa.Integer(), nullable=True),
+    sa.Column('action', sa.String(length=32), nullable=False),
+    sa.Column('field', sa.String(length=32), nullable=True),
+    sa.Column('old_value', sa.Text(), nullable=True),
+    sa.Column('new_value', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['actor_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_ticket_events_ticket_created', 'ticket_events', ['ticket_id', 'created_at', 'id'])
+
+    op.create_table('ticket_flow',
+    sa.Column('ticket_id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('done_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('lead_seconds', sa.Integer(), nullable=True),
+    sa.Column('cycle_seconds', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.PrimaryKeyConstraint('ticket_id')
+    )
+    op.create_index('ix_ticket_flow_project_done', 'ticket_flow', ['project_id', 'done_at'])
+
+    op.create_table('ticket_tombstones',
+    sa.Column('ticket_id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.PrimaryKeyConstraint('ticket_id')
+    )
+    op.create_index('ix_ticket_tombstones_project_version', 'ticket_tombstones', ['project_id', 'version'])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _create_tables()
+
+    # Timestamps were optional: fill the gaps before requiring them
+    op.execute("UPDATE tickets SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL")
+    op.execute("UPDATE tickets SET updated_at = created_at WHERE updated_at IS NULL")
+    # Existing cards share the default rank, so a column orders by id
+    # until its first move respaces it
+    with op.batch_alter_table('tickets') as batch_op:
+        batch_op.add_column(sa.Column('rank', RANK, server_default='i', nullable=False))
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='0', nullable=False))
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(timezone=True),
+                              existing_server_default=sa.func.now(), nullable=False)
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(timezone=True),
+                              server_default=sa.func.now(), nullable=False)
+
+    # Duplicate memberships could be added before; keep the first of each
+    op.execute(
+        "DELETE FROM project_members WHERE id NOT IN "
+        "(SELECT MIN(id) FROM project_members GROUP BY user_id, project_id)"
+    )
+
+    for dimension, value in COUNTED:
+        op.execute(
+            "INSERT INTO project_ticket_counts (project_id, dimension, value, count) "
+            f"SELECT project_id, '{dimension}', {value}, COUNT(*) "
+            f"FROM tickets GROUP BY project_id, {value}"
+        )
+
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            create_index_online(name, table, columns)
+        create_index_online(
+            'ux_project_members_user_project', 'project_members', ['user_id', 'project_id'],
+            unique=True,
+        )
+        if op.get_bind().dialect.name == 'postgresql':
+            for name, table, expression in SEARCH_INDEXES:
+                create_index_online(name, table, [sa.text(expression)], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        if op.get_bind().dialect.name == 'postgresql':
+            for name, table, _ in SEARCH_INDEXES:
+                drop_index_online(name, table)
+        drop_index_online('ux_project_members_user_project', 'project_members')
+        for name, table, _ in INDEXES:
+            drop_index_online(name, table)
+
+    with op.batch_alter_table('tickets') as batch_op:
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(timezone=True),
+                              server_default=None, nullable=True)
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(timezone=True),
+                              existing_server_default=sa.func.now(), nullable=True)
+        batch_op.drop_column('version')
+        batch_op.drop_column('rank')
+
+    op.drop_table('ticket_tombstones')
+    op.drop_table('ticket_flow')
+    op.drop_table('ticket_events')
+    op.drop_table('project_versions')
+    op.drop_table('project_ticket_counts')
+    op.drop_table('project_daily_flow')
+    op.drop_table('archived_comments')
+    op.drop_table('archived_tickets')
+    op.drop_table('analytics_watermarks')
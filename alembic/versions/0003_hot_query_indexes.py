@@ -0,0 +1,53 @@
+"""hot query indexes
+
+Composite indexes for the board filters and the comment list, plus the
+foreign keys that had none. Built concurrently on Postgres.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 19:40:12.512904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.core.migrations import create_index_online, drop_index_online
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ('ix_tickets_project_status_priority', 'tickets', ['project_id', 'status', 'priority']),
+    ('ix_tickets_project_assignee', 'tickets', ['project_id', 'assignee_id']),
+    ('ix_tickets_reporter', 'tickets', ['reporter_id']),
+    ('ix_comments_ticket_created', 'comments', ['ticket_id', 'created_at', 'id']),
+    ('ix_comments_parent', 'comments', ['parent_id']),
+)
+
+# Leading column of every board index now
+SUPERSEDED = (
+    ('ix_tickets_project_id', 'tickets', ['project_id']),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            create_index_online(name, table, columns)
+        for name, table, _ in SUPERSEDED:
+            drop_index_online(name, table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in SUPERSEDED:
+            create_index_online(name, table, columns)
+        for name, table, _ in INDEXES:
+            drop_index_online(name, table)
@@ -0,0 +1,35 @@
+"""archived ticket counts
+
+Archived tickets keep an "archived_status" cell in project_ticket_counts
+so the dashboard totals include them. Backfills it for the tickets
+archived so far.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 10:05:31.448120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "INSERT INTO project_ticket_counts (project_id, dimension, value, count) "
+        "SELECT project_id, 'archived_status', CAST(status AS VARCHAR(64)), COUNT(*) "
+        "FROM archived_tickets GROUP BY project_id, status"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM project_ticket_counts WHERE dimension = 'archived_status'")
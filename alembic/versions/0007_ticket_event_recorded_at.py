@@ -0,0 +1,37 @@
+"""ticket event recorded_at
+
+When each activity event was written, so analytics waits for the
+events of slower writers by insert time rather than request time.
+Existing events keep NULL (long settled).
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-20 14:27:51.880316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, Sequence[str], None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Added bare, then given its default: SQLite can't ADD COLUMN with
+    # now() (batch mode copies the table there; Postgres only alters it)
+    op.add_column('ticket_events', sa.Column('recorded_at', sa.DateTime(timezone=True), nullable=True))
+    with op.batch_alter_table('ticket_events') as batch:
+        batch.alter_column('recorded_at', server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('ticket_events') as batch:
+        batch.drop_column('recorded_at')
@@ -0,0 +1,33 @@
+"""project resync version
+
+The last project version written in bulk outside the request path
+(archival, imports), so API workers drop their search indexes and
+resync their event streams after a scheduled archive run.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-20 16:12:09.507413
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, Sequence[str], None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('project_versions', sa.Column('resync_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('project_versions') as batch:
+        batch.drop_column('resync_version')
@@ -0,0 +1,281 @@
+import enum
+import logging
+import queue
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.ticket import utcnow
+from app.models.ticket_event import TicketEvent
+
+# =========================
+# Ticket activity log
+# =========================
+#
+# Routes call ``record`` after committing; it only enqueues. One writer
+# thread per process drains the queue and inserts each batch with a
+# single executemany, so history costs a hot write path no round trip.
+# A batch is written once it is full or ``flush_seconds`` after its
+# first event, so /activity can lag by about that much.
+#
+# Flow events (created, deleted and status changes) feed the analytics
+# rollups, so they are never dropped for a full buffer: recording one
+# waits up to ``flow_timeout`` for room, then writes it from the
+# request's thread. Other events are dropped after ``enqueue_timeout``.
+# A batch that fails to write is retried, then written one event at a
+# time, so only the events the database keeps refusing are lost. A
+# writer thread that died is restarted by the next ``record``. The
+# buffer of a process that dies is lost; every loss is logged and
+# counted (GET /metrics, activity_writer_*), and lost flow events mean
+# analytics undercounts until ``scripts.refresh_analytics --rebuild``.
+
+logger = logging.getLogger("app.activity")
+
+_STOP = object()
+
+FLOW_ACTIONS = ("created", "deleted")
+REBUILD_HINT = "analytics is off until python -m scripts.refresh_analytics --rebuild"
+
+WRITE_ATTEMPTS = 3
+RETRY_SECONDS = 0.2  # doubled after every failed attempt
+
+
+def _is_flow(event: dict) -> bool:
+    # The events app.core.analytics.refresh replays
+    return event["action"] in FLOW_ACTIONS or event["field"] == "status"
+
+
+def _text(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, enum.Enum):
+        return value.value
+    return str(value)
+
+
+class ActivityWriter:
+    """
+    Bounded buffer in front of the ticket_events table. When
+    ``max_queue`` events are waiting, callers block (backpressure): for
+    flow events up to ``flow_timeout`` seconds, then they write the
+    event themselves; for the rest up to ``enqueue_timeout`` seconds,
+    then the event is dropped and counted rather than failing the
+    request.
+    """
+
+    def __init__(
+        self,
+        max_queue: int,
+        batch_size: int,
+        flush_seconds: float,
+        enqueue_timeout: float,
+        flow_timeout: float,
+    ):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.enqueue_timeout = enqueue_timeout
+        self.flow_timeout = flow_timeout
+        self.queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.inline = 0  # flow events written by the caller, buffer full
+        self.retried = 0
+        self.failed = 0
+        self.flow_lost = 0  # of the failed ones, those analytics replays
+        self.restarts = 0
+
+    def _ensure_started(self):
+        # Started on first use, so scripts that never record stay thread-free
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            if self._thread is not None:
+                # Died on an unexpected error; what it buffered is still queued
+                self.restarts += 1
+                logger.error("Activity writer thread died, restarting it")
+            self._thread = threading.Thread(
+                target=self._run, name="activity-writer", daemon=True
+            )
+            self._thread.start()
+
+    def record(
+        self,
+        ticket_id: int,
+        project_id: int,
+        actor_id: Optional[int],
+        action: str,
+        field: Optional[str] = None,
+        old_value=None,
+        new_value=None,
+    ):
+        self._ensure_started()
+        event = {
+            "ticket_id": ticket_id,
+            "project_id": project_id,
+            "actor_id": actor_id,
+            "action": action,
+            "field": field,
+            "old_value": _text(old_value),
+            "new_value": _text(new_value),
+            "created_at": utcnow(),
+        }
+        if _is_flow(event):
+            try:
+                self.queue.put(event, timeout=self.flow_timeout)
+            except queue.Full:
+                with self._lock:
+                    self.inline += 1
+                logger.warning("Activity queue full, writing %s on ticket %s inline", action, ticket_id)
+                self._write([event])
+            return
+        try:
+            self.queue.put(event, timeout=self.enqueue_timeout)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            logger.warning("Activity queue full, dropped %s on ticket %s", action, ticket_id)
+
+    def record_changes(
+        self,
+        ticket_id: int,
+        project_id: int,
+        actor_id: int,
+        action: str,
+        before: dict,
+        after: dict,
+    ):
+        """
+        One event per field whose value differs between the two dicts.
+        """
+        for field, new_value in after.items():
+            old_value = before.get(field)
+            if old_value != new_value:
+                self.record(
+                    ticket_id, project_id, actor_id, action,
+                    field, old_value, new_value,
+                )
+
+    def _next_batch(self) -> tuple[list[dict], bool]:
+        first = self.queue.get()
+        if first is _STOP:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.flush_seconds
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                event = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if event is _STOP:
+                return batch, True
+            batch.append(event)
+        return batch, False
+
+    def _insert(self, events: list[dict]):
+        with SessionLocal() as db:
+            db.execute(insert(TicketEvent), events)
+            db.commit()
+
+    def _write(self, batch: list[dict]):
+        for attempt in range(WRITE_ATTEMPTS):
+            try:
+                self._insert(batch)
+            except Exception:
+                logger.warning(
+                    "Failed to write %d activity events (attempt %d of %d)",
+                    len(batch), attempt + 1, WRITE_ATTEMPTS, exc_info=True,
+                )
+                if attempt + 1 < WRITE_ATTEMPTS:
+                    with self._lock:
+                        self.retried += 1
+                    time.sleep(RETRY_SECONDS * 2 ** attempt)
+            else:
+                with self._lock:
+                    self.written += len(batch)
+                    self.batches += 1
+                return
+
+        # Still failing: one at a time, so a bad event loses only itself
+        lost = []
+        for event in batch:
+            try:
+                self._insert([event])
+            except Exception:
+                lost.append(event)
+        flow = sum(1 for event in lost if _is_flow(event))
+        with self._lock:
+            self.written += len(batch) - len(lost)
+            self.batches += 1
+            self.failed += len(lost)
+            self.flow_lost += flow
+        if lost:
+            logger.error("Lost %d of %d activity events", len(lost), len(batch))
+        if flow:
+            logger.warning("Lost %d flow events, %s", flow, REBUILD_HINT)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch, stopping = self._next_batch()
+            try:
+                if batch:
+                    self._write(batch)
+            finally:
+                for _ in range(len(batch) + stopping):
+                    self.queue.task_done()
+
+    def flush(self):
+        """
+        Block until every event recorded so far has been written.
+        """
+        if self._thread is not None:
+            self._ensure_started()
+            self.queue.join()
+
+    def close(self):
+        """
+        Write out what is buffered and stop the writer (app shutdown).
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self.queue.put(_STOP)
+            thread.join()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_queue": self.max_queue,
+                "queued": self.queue.qsize(),
+                "alive": int(self._thread is not None and self._thread.is_alive()),
+                "restarts": self.restarts,
+                "written": self.written,
+                "batches": self.batches,
+                "dropped": self.dropped,
+                "inline": self.inline,
+                "retried": self.retried,
+                "failed": self.failed,
+                "flow_lost": self.flow_lost,
+            }
+
+
+activity_writer = ActivityWriter(
+    max_queue=settings.activity_queue_size,
+    batch_size=settings.activity_batch_size,
+    flush_seconds=settings.activity_flush_seconds,
+    enqueue_timeout=settings.activity_enqueue_timeout,
+    flow_timeout=settings.activity_flow_timeout,
+)
@@ -0,0 +1,445 @@
+from collections import Counter
+from datetime import date, datetime, time, timedelta, timezone
+
+from sqlalchemy import func, or_, select
+
+from app.core.database import dialect_insert
+from app.core.stats import ARCHIVED
+from app.models.analytics_watermark import AnalyticsWatermark
+from app.models.archived_ticket import ArchivedTicket
+from app.models.project_stats import ProjectTicketCount
+from app.models.project_daily_flow import ProjectDailyFlow
+from app.models.ticket import Ticket, TicketStatus, utcnow
+from app.models.ticket_event import TicketEvent
+from app.models.ticket_flow import TicketFlow
+
+# =========================
+# Flow analytics (cumulative flow, throughput, lead/cycle time)
+# =========================
+#
+# ``refresh`` replays new ticket_events into two rollups, meant to run
+# on a schedule (scripts/refresh_analytics.py):
+#   - project_daily_flow: tickets entering / leaving each status per day
+#   - ticket_flow: each ticket's status and start / done timestamps
+# ``project_analytics`` answers from those alone, so its cost follows
+# the requested window, not the size of the tickets or events tables.
+#
+# The rollups are only as complete as the activity log: an event lost
+# on its way there (see app.core.activity), or tickets created without
+# one (imports), skew them until ``rebuild``. ``reconcile`` compares
+# them with the project counters to find out. Archived tickets stay in
+# the rollups, in their last status.
+#
+# The watermark is an event id, and ids are handed out before a batch
+# commits: a slow writer's batch can become visible below ids already
+# consumed. So only events recorded (by the database clock, at insert)
+# more than SETTLE_SECONDS ago are consumed, in id order, stopping at
+# the first newer one; by then every batch holding lower ids has long
+# committed.
+
+ROLLUP = "ticket_flow"
+STATUSES = tuple(status.value for status in TicketStatus)
+STARTED = TicketStatus.in_progress.value
+DONE = TicketStatus.done.value
+DELETED = "deleted"
+PERCENTILES = (50, 85, 95)
+
+REFRESH_BATCH_SIZE = 5000
+# Far longer than a batch insert's transaction
+SETTLE_SECONDS = 60
+
+
+def _utc(moment: datetime) -> datetime:
+    # SQLite hands back naive datetimes (stored as UTC)
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def _day(moment: datetime) -> date:
+    return _utc(moment).date()
+
+
+def _seconds(start, end):
+    if start is None or end is None:
+        return None
+    return int((end - start).total_seconds())
+
+
+def _apply_flow(db, deltas: Counter):
+    """
+    Add (project_id, day, status, "entered" | "exited") counts to
+    project_daily_flow in one upsert.
+    """
+    cells = {}
+    for (project_id, day, status, direction), count in deltas.items():
+        cell = cells.setdefault(
+            (project_id, day, status),
+            {"project_id": project_id, "day": day, "status": status, "entered": 0, "exited": 0},
+        )
+        cell[direction] += count
+    if not cells:
+        return
+
+    stmt = dialect_insert(db, ProjectDailyFlow).values(list(cells.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["project_id", "day", "status"],
+        set_={
+            "entered": ProjectDailyFlow.entered + stmt.excluded.entered,
+            "exited": ProjectDailyFlow.exited + stmt.excluded.exited,
+        },
+    )
+    db.execute(stmt)
+
+
+def _enter(flow: TicketFlow, status: str, moment: datetime):
+    """
+    Move a flow to ``status`` at ``moment``, keeping its start / done
+    timestamps and lead / cycle times in step.
+    """
+    flow.status = status
+    if status == STARTED and flow.started_at is None:
+        flow.started_at = moment
+    if status == DONE:
+        flow.done_at = moment
+        flow.lead_seconds = _seconds(flow.created_at, flow.done_at)
+        flow.cycle_seconds = _seconds(flow.started_at, flow.done_at)
+    elif flow.done_at is not None:
+        # Reopened: it counts again when it is next done
+        flow.done_at = flow.lead_seconds = flow.cycle_seconds = None
+
+
+def _true_up(db, cutoff: datetime):
+    """
+    After a replay of the whole log: bring the rollups in line with the
+    tickets it missed. A ticket the log never saw created (imported,
+    or from before the log) enters its current status on the day it was
+    created; one whose last status change was lost moves at its last
+    update; one whose delete was lost leaves today. Tickets changed
+    since ``cutoff`` are left to their events, not replayed yet.
+    """
+    deltas = Counter()
+    today = utcnow()
+    for model in (Ticket, ArchivedTicket):
+        tickets = db.query(
+            model.id, model.project_id, model.status, model.created_at, model.updated_at
+        ).order_by(model.id)
+        last_id = 0
+        while True:
+            batch = tickets.filter(model.id > last_id).limit(REFRESH_BATCH_SIZE).all()
+            if not batch:
+                break
+            last_id = batch[-1].id
+            flows = {
+                flow.ticket_id: flow for flow in db.query(TicketFlow).filter(
+                    TicketFlow.ticket_id.in_([ticket.id for ticket in batch])
+                )
+            }
+            for ticket in batch:
+                status = ticket.status.value
+                flow = flows.get(ticket.id)
+                if _utc(ticket.updated_at) > cutoff or (flow is not None and flow.status == status):
+                    continue
+                if flow is None or flow.status == DELETED:
+                    if flow is None:
+                        flow = TicketFlow(ticket_id=ticket.id)
+                        db.add(flow)
+                    flow.project_id = ticket.project_id
+                    flow.created_at = ticket.created_at
+                    flow.started_at = flow.done_at = None
+                    flow.lead_seconds = flow.cycle_seconds = None
+                    _enter(flow, status, ticket.updated_at)
+                    deltas[(ticket.project_id, _day(ticket.created_at), status, "entered")] += 1
+                    continue
+                day = _day(ticket.updated_at)
+                deltas[(flow.project_id, day, flow.status, "exited")] += 1
+                _enter(flow, status, ticket.updated_at)
+                deltas[(flow.project_id, day, status, "entered")] += 1
+            db.flush()
+
+    gone = db.query(TicketFlow).filter(
+        TicketFlow.status != DELETED,
+        TicketFlow.ticket_id.not_in(select(Ticket.id)),
+        TicketFlow.ticket_id.not_in(select(ArchivedTicket.id)),
+    )
+    for flow in gone:
+        deltas[(flow.project_id, _day(today), flow.status, "exited")] += 1
+        flow.status = DELETED
+
+    db.flush()
+    _apply_flow(db, deltas)
+    db.commit()
+
+
+def _replay(db, flows: dict, event, deltas: Counter):
+    """
+    Apply one created / status change / deleted event.
+    """
+    day = _day(event.created_at)
+    flow = flows.get(event.ticket_id)
+
+    if event.action == "created":
+        if flow is None:
+            flow = TicketFlow(ticket_id=event.ticket_id)
+            db.add(flow)
+            flows[event.ticket_id] = flow
+        elif flow.status != DELETED:
+            return  # already counted by a true-up (see rebuild)
+        # (a deleted flow here means SQLite reused the ticket's id)
+        flow.project_id = event.project_id
+        flow.status = TicketStatus.todo.value
+        flow.created_at = event.created_at
+        flow.started_at = flow.done_at = None
+        flow.lead_seconds = flow.cycle_seconds = None
+        deltas[(event.project_id, day, flow.status, "entered")] += 1
+        return
+
+    if flow is None:
+        # A ticket the log never saw created (imported): track it from
+        # here on, without an exit from a status it was never counted in
+        if event.action == "deleted":
+            return
+        flow = TicketFlow(
+            ticket_id=event.ticket_id,
+            project_id=event.project_id,
+            status=event.new_value,
+            created_at=event.created_at,
+        )
+        db.add(flow)
+        flows[event.ticket_id] = flow
+        deltas[(event.project_id, day, flow.status, "entered")] += 1
+    else:
+        if flow.status == DELETED:
+            return
+        deltas[(flow.project_id, day, flow.status, "exited")] += 1
+        if event.action == "deleted":
+            # Kept: a finished ticket is still a lead/cycle time sample
+            flow.status = DELETED
+            return
+        flow.status = event.new_value
+        deltas[(flow.project_id, day, flow.status, "entered")] += 1
+
+    _enter(flow, flow.status, event.created_at)
+
+
+def _settled_before(db, settle_seconds: float) -> datetime:
+    # By the database clock, the one recorded_at comes from
+    return _utc(db.scalar(select(func.now()))) - timedelta(seconds=settle_seconds)
+
+
+def refresh(db, batch_size: int = REFRESH_BATCH_SIZE, settle_seconds: float = SETTLE_SECONDS) -> int:
+    """
+    Roll up ticket_events past the watermark, committing after every
+    batch. Returns how many events were consumed. The first run builds
+    the rollups from the whole log (``rebuild``).
+    """
+    watermark = db.get(AnalyticsWatermark, ROLLUP)
+    if watermark is None:
+        return rebuild(db, batch_size, settle_seconds)
+    cutoff = _settled_before(db, settle_seconds)
+    consumed = 0
+
+    while True:
+        events = (
+            db.query(
+                TicketEvent.id,
+                TicketEvent.ticket_id,
+                TicketEvent.project_id,
+                TicketEvent.action,
+                TicketEvent.new_value,
+                TicketEvent.created_at,
+                TicketEvent.recorded_at,
+            )
+            .filter(
+                TicketEvent.id > watermark.last_event_id,
+                or_(
+                    TicketEvent.action.in_(("created", "deleted")),
+                    TicketEvent.field == "status",
+                ),
+            )
+            .order_by(TicketEvent.id)
+            .limit(batch_size)
+            .all()
+        )
+        # Stop at the first unsettled event, even if later ones are older
+        for i, event in enumerate(events):
+            if event.recorded_at is not None and _utc(event.recorded_at) > cutoff:
+                events = events[:i]
+                break
+        if not events:
+            return consumed
+
+        flows = {
+            flow.ticket_id: flow
+            for flow in db.query(TicketFlow).filter(
+                TicketFlow.ticket_id.in_({event.ticket_id for event in events})
+            )
+        }
+        deltas = Counter()
+        for event in events:
+            _replay(db, flows, event, deltas)
+        db.flush()
+        _apply_flow(db, deltas)
+
+        watermark.last_event_id = events[-1].id
+        db.commit()
+        consumed += len(events)
+        if len(events) < batch_size:
+            return consumed
+
+
+def rebuild(db, batch_size: int = REFRESH_BATCH_SIZE, settle_seconds: float = SETTLE_SECONDS) -> int:
+    """
+    Drop both rollups and replay the whole activity log, so the
+    cumulative flow keeps its history, then true them up with the
+    tickets for what the log missed (repair). Returns how many events
+    were consumed.
+    """
+    # Tickets carry the app's clock, not the database's
+    cutoff = utcnow() - timedelta(seconds=settle_seconds)
+    for model in (ProjectDailyFlow, TicketFlow, AnalyticsWatermark):
+        db.query(model).delete(synchronize_session=False)
+    db.add(AnalyticsWatermark(name=ROLLUP, last_event_id=0))
+    db.commit()
+
+    consumed = refresh(db, batch_size, settle_seconds)
+    _true_up(db, cutoff)
+    return consumed
+
+
+def reconcile(db) -> list[dict]:
+    """
+    Compare how many tickets each rollup has in every status with the
+    project counters, archived ones included. Returns the mismatches;
+    events recorded in the last SETTLE_SECONDS, not rolled up yet, show
+    as one until the next refresh.
+    """
+    if db.get(AnalyticsWatermark, ROLLUP) is None:
+        return []
+
+    tickets = Counter()
+    for project_id, status, count in db.query(
+        ProjectTicketCount.project_id, ProjectTicketCount.value, ProjectTicketCount.count
+    ).filter(ProjectTicketCount.dimension.in_(("status", ARCHIVED))):
+        tickets[(project_id, status)] += count
+
+    rollups = {
+        "project_daily_flow": db.query(
+            ProjectDailyFlow.project_id,
+            ProjectDailyFlow.status,
+            func.sum(ProjectDailyFlow.entered - ProjectDailyFlow.exited),
+        ).group_by(ProjectDailyFlow.project_id, ProjectDailyFlow.status),
+        "ticket_flow": db.query(
+            TicketFlow.project_id, TicketFlow.status, func.count()
+        ).filter(TicketFlow.status != DELETED).group_by(TicketFlow.project_id, TicketFlow.status),
+    }
+
+    gaps = []
+    for rollup, rows in rollups.items():
+        counted = Counter({(project_id, status): count for project_id, status, count in rows})
+        for project_id, status in sorted(set(tickets) | set(counted)):
+            if counted[(project_id, status)] != tickets[(project_id, status)]:
+                gaps.append({
+                    "rollup": rollup,
+                    "project_id": project_id,
+                    "status": status,
+                    "rolled_up": counted[(project_id, status)],
+                    "tickets": tickets[(project_id, status)],
+                })
+    return gaps
+
+
+# =========================
+# Reads
+# =========================
+
+
+def _percentiles(np, seconds) -> dict:
+    values = seconds[~np.isnan(seconds)] / 3600
+    if not values.size:
+        return {"count": 0, **{f"p{p}": None for p in PERCENTILES}}
+    results = np.percentile(values, PERCENTILES)
+    return {
+        "count": int(values.size),
+        **{f"p{p}": round(float(value), 2) for p, value in zip(PERCENTILES, results)},
+    }
+
+
+def project_analytics(db, project_id: int, days: int) -> dict:
+    """
+    Cumulative flow and throughput per day, plus lead / cycle time
+    percentiles (hours) for tickets finished in the last ``days`` days.
+    """
+    import numpy as np  # only this endpoint needs it; keeps app import fast
+
+    end = utcnow().date()
+    start = end - timedelta(days=days - 1)
+    columns = {status: i for i, status in enumerate(STATUSES)}
+
+    # Tickets in each status when the window opens
+    baseline = np.zeros(len(STATUSES), dtype=np.int64)
+    for status, count in (
+        db.query(
+            ProjectDailyFlow.status,
+            func.sum(ProjectDailyFlow.entered - ProjectDailyFlow.exited),
+        )
+        .filter(ProjectDailyFlow.project_id == project_id, ProjectDailyFlow.day < start)
+        .group_by(ProjectDailyFlow.status)
+    ):
+        baseline[columns[status]] = count
+
+    rows = (
+        db.query(
+            ProjectDailyFlow.day,
+            ProjectDailyFlow.status,
+            ProjectDailyFlow.entered,
+            ProjectDailyFlow.exited,
+        )
+        .filter(
+            ProjectDailyFlow.project_id == project_id,
+            ProjectDailyFlow.day >= start,
+            ProjectDailyFlow.day <= end,
+        )
+        .all()
+    )
+    net = np.zeros((days, len(STATUSES)), dtype=np.int64)
+    entered = np.zeros((days, len(STATUSES)), dtype=np.int64)
+    if rows:
+        day_index = np.array([(row.day - start).days for row in rows])
+        status_index = np.array([columns[row.status] for row in rows])
+        entered_counts = np.array([row.entered for row in rows], dtype=np.int64)
+        np.add.at(entered, (day_index, status_index), entered_counts)
+        np.add.at(
+            net, (day_index, status_index),
+            entered_counts - np.array([row.exited for row in rows], dtype=np.int64),
+        )
+    flow = baseline + np.cumsum(net, axis=0)
+    completed = entered[:, columns[DONE]]
+
+    window_start = datetime.combine(start, time.min, tzinfo=timezone.utc)
+    # (lead, cycle) seconds per finished ticket; None (unknown) -> NaN
+    samples = np.array(
+        db.query(TicketFlow.lead_seconds, TicketFlow.cycle_seconds)
+        .filter(
+            TicketFlow.project_id == project_id,
+            TicketFlow.done_at >= window_start,
+        )
+        .all(),
+        dtype=np.float64,
+    ).reshape(-1, 2)
+
+    return {
+        "start": start,
+        "end": end,
+        "cumulative_flow": [
+            {
+                "day": start + timedelta(days=i),
+                "counts": dict(zip(STATUSES, flow[i].tolist())),
+                "completed": int(completed[i]),
+            }
+            for i in range(days)
+        ],
+        "throughput": int(completed.sum()),
+        "lead_time_hours": _percentiles(np, samples[:, 0]),
+        "cycle_time_hours": _percentiles(np, samples[:, 1]),
+    }
@@ -0,0 +1,198 @@
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import delete, insert, literal, select
+
+from app.core import events, stats
+from app.core.activity import activity_writer
+from app.core.config import settings
+from app.core.ranking import last_rank, rank_after
+from app.core.search import search_index
+from app.core.versioning import bump_project_version, bump_resync_version, record_tombstones
+from app.models.archived_comment import ArchivedComment
+from app.models.archived_ticket import ArchivedTicket
+from app.models.comment import Comment
+from app.models.ticket import Ticket, TicketStatus, utcnow
+from app.models.ticket_tombstone import TicketTombstone
+
+# =========================
+# Archival of done tickets
+# =========================
+#
+# ``archive_done_tickets`` moves tickets done for more than
+# ARCHIVE_AFTER_DAYS days, with their comments, into archived_tickets /
+# archived_comments, one committed batch at a time (meant to run on a
+# schedule, see scripts/archive_tickets.py). To the board an archived
+# ticket is gone: the counters move it to their archived cells and delta
+# sync gets a tombstone.
+# ``include_archived`` reads and ``restore_ticket`` still reach it.
+#
+# The scheduled run is its own process, so the resync it publishes and
+# the search indexes it drops are its own. The API workers learn of it
+# from the project's resync version (``bump_resync_version``): each
+# search and each open event stream checks it.
+#
+# Tickets carry no "done at", so a done ticket's last update stands in
+# for it: any edit pushes its archival back.
+
+ARCHIVE_BATCH_SIZE = 500
+
+# Same columns on both sides, so rows move with INSERT ... SELECT
+TICKET_COLUMNS = [column.key for column in Ticket.__table__.columns]
+COMMENT_COLUMNS = [column.key for column in Comment.__table__.columns]
+
+
+def _copy(db, source, target, columns: list[str], where, **overrides):
+    """
+    INSERT INTO target SELECT columns FROM source WHERE ..., with some
+    columns replaced by constants.
+    """
+    names = columns + [name for name in overrides if name not in columns]
+    selected = [
+        literal(overrides[name], getattr(target, name).type) if name in overrides
+        else getattr(source, name)
+        for name in names
+    ]
+    db.execute(insert(target).from_select(names, select(*selected).where(where)))
+
+
+def _archive_batch(db, cutoff, batch_size: int) -> list:
+    # Rows being edited right now are skipped, and picked up next run
+    tickets = (
+        db.query(
+            Ticket.id,
+            Ticket.project_id,
+            Ticket.status,
+            Ticket.priority,
+            Ticket.type,
+            Ticket.assignee_id,
+        )
+        .filter(Ticket.status == TicketStatus.done, Ticket.updated_at < cutoff)
+        .order_by(Ticket.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    if not tickets:
+        return tickets
+
+    ids = [ticket.id for ticket in tickets]
+    _copy(db, Ticket, ArchivedTicket, TICKET_COLUMNS, Ticket.id.in_(ids), archived_at=utcnow())
+    _copy(db, Comment, ArchivedComment, COMMENT_COLUMNS, Comment.ticket_id.in_(ids))
+    db.execute(
+        delete(Comment).where(Comment.ticket_id.in_(ids)),
+        execution_options={"synchronize_session": False},
+    )
+    db.execute(
+        delete(Ticket).where(Ticket.id.in_(ids)),
+        execution_options={"synchronize_session": False},
+    )
+
+    by_project = defaultdict(list)
+    for ticket in tickets:
+        by_project[ticket.project_id].append(ticket)
+    # Projects in id order: concurrent runs take the version locks alike
+    for project_id in sorted(by_project):
+        deltas = Counter()
+        for ticket in by_project[project_id]:
+            deltas.subtract(stats.ticket_counts(ticket))
+            deltas.update(stats.archived_counts(ticket))
+        stats.apply_deltas(db, project_id, deltas)
+        record_tombstones(
+            db, project_id,
+            [ticket.id for ticket in by_project[project_id]],
+            bump_resync_version(db, project_id),
+        )
+    return tickets
+
+
+def archive_done_tickets(
+    db,
+    older_than_days: int = settings.archive_after_days,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+) -> int:
+    """
+    Archive every ticket done (last updated) more than ``older_than_days``
+    days ago, committing after each batch. Returns how many were moved.
+    """
+    cutoff = utcnow() - timedelta(days=older_than_days)
+    archived = 0
+
+    while True:
+        tickets = _archive_batch(db, cutoff, batch_size)
+        db.commit()
+        if not tickets:
+            return archived
+        archived += len(tickets)
+
+        projects = set()
+        for ticket in tickets:
+            projects.add(ticket.project_id)
+            activity_writer.record(ticket.id, ticket.project_id, None, "archived")
+        for project_id in projects:
+            # Many cards left at once: boards refetch instead. Reaches
+            # this process only; other workers see the resync version.
+            search_index.invalidate(project_id)
+            events.publish(project_id, "resync", None)
+
+        if len(tickets) < batch_size:
+            return archived
+
+
+def restore_ticket(db, ticket_id: int) -> int:
+    """
+    Move an archived ticket and its comments back to the end of its
+    board column, inside the caller's transaction. Counts as an update,
+    so it is not archived again for another ARCHIVE_AFTER_DAYS days.
+    Returns the ticket's project id.
+    """
+    archived = (
+        db.query(
+            ArchivedTicket.id,
+            ArchivedTicket.project_id,
+            ArchivedTicket.status,
+            ArchivedTicket.priority,
+            ArchivedTicket.type,
+            ArchivedTicket.assignee_id,
+        )
+        .filter(ArchivedTicket.id == ticket_id)
+        .with_for_update()
+        .first()
+    )
+    if archived is None:
+        raise HTTPException(status_code=404, detail="Archived ticket not found")
+
+    # Only SQLite hands a deleted row's id out again
+    comment_ids = select(ArchivedComment.id).where(ArchivedComment.ticket_id == ticket_id)
+    taken = (
+        db.query(Ticket.id).filter(Ticket.id == ticket_id).first()
+        or db.query(Comment.id).filter(Comment.id.in_(comment_ids)).first()
+    )
+    if taken:
+        raise HTTPException(status_code=409, detail="Ticket id is in use again")
+
+    project_id = archived.project_id
+    _copy(
+        db, ArchivedTicket, Ticket, TICKET_COLUMNS, ArchivedTicket.id == ticket_id,
+        rank=rank_after(last_rank(db, project_id, archived.status)),
+        version=bump_project_version(db, project_id),
+        updated_at=utcnow(),
+    )
+    _copy(db, ArchivedComment, Comment, COMMENT_COLUMNS, ArchivedComment.ticket_id == ticket_id)
+    db.execute(
+        delete(ArchivedComment).where(ArchivedComment.ticket_id == ticket_id),
+        execution_options={"synchronize_session": False},
+    )
+    db.execute(
+        delete(ArchivedTicket).where(ArchivedTicket.id == ticket_id),
+        execution_options={"synchronize_session": False},
+    )
+    db.execute(
+        delete(TicketTombstone).where(TicketTombstone.ticket_id == ticket_id),
+        execution_options={"synchronize_session": False},
+    )
+    deltas = stats.ticket_counts(archived)
+    deltas.subtract(stats.archived_counts(archived))
+    stats.apply_deltas(db, project_id, deltas)
+    return project_id
@@ -0,0 +1,119 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+# =========================
+# In-process TTL/LRU cache
+# =========================
+
+
+class CacheBackend:
+    """
+    Shared second-level store (Redis, memcached, ...) so several workers
+    can reuse each other's entries. Values must be picklable.
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: float):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+
+class LocalBackend(CacheBackend):
+    """
+    Stand-in shared backend living in this process (dev/test).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data: dict[str, tuple[float, Any]] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+
+class TTLCache:
+    """
+    Bounded LRU with per-entry expiry, optionally backed by a shared
+    CacheBackend. Explicit invalidate() clears both levels; other
+    workers' local copies age out within ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        namespace: str,
+        backend: Optional[CacheBackend] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.namespace = namespace
+        self.backend = backend
+        self._lock = threading.Lock()
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def _backend_key(self, key: Hashable) -> str:
+        return f"{self.namespace}:{key}"
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at >= now:
+                    self._data.move_to_end(key)
+                    return value
+                del self._data[key]
+
+        if self.backend is None:
+            return None
+
+        value = self.backend.get(self._backend_key(key))
+        if value is not None:
+            self._store(key, value, now)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        self._store(key, value, time.monotonic())
+        if self.backend is not None:
+            self.backend.set(self._backend_key(key), value, self.ttl)
+
+    def _store(self, key: Hashable, value: Any, now: float):
+        with self._lock:
+            self._data[key] = (now + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+        if self.backend is not None:
+            self.backend.delete(self._backend_key(key))
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,121 @@
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from dotenv import load_dotenv
+
+# =========================
+# Settings
+# =========================
+#
+# Read from the environment (and .env) once, on first import. Every
+# module takes its configuration from ``settings`` instead of calling
+# os.getenv itself.
+
+
+def _bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() == "true"
+
+
+@dataclass(frozen=True)
+class Settings:
+    # Database
+    database_url: Optional[str]
+    db_pool_size: int
+    db_max_overflow: int
+    db_pool_timeout: float
+    db_pool_recycle: int
+    db_pool_pre_ping: bool
+    db_statement_timeout_ms: int
+    async_db: bool
+
+    # Auth
+    secret_key: Optional[str]
+    algorithm: Optional[str]
+    access_token_expire_minutes: int
+    bcrypt_rounds: int
+    password_hash_workers: int
+    password_hash_max_queue: int
+    principal_cache_size: int
+    principal_cache_ttl_seconds: float
+    principal_cache_backend: Optional[str]
+
+    # Import
+    import_chunk_size: int
+
+    # Ticket activity log
+    activity_queue_size: int
+    activity_batch_size: int
+    activity_flush_seconds: float
+    activity_enqueue_timeout: float
+    activity_flow_timeout: float
+
+    # Delta sync
+    tombstone_retention_days: int
+
+    # Archival
+    archive_after_days: int
+
+    # Background jobs
+    job_workers: int
+    job_poll_seconds: float
+    job_lease_seconds: float
+    job_max_attempts: int
+    job_retry_base_seconds: float
+
+    # Responses
+    fast_serialization: bool
+
+    # Instrumentation
+    slow_query_ms: float
+    slow_query_log_params: bool
+    server_timing: bool
+    metrics_token: Optional[str]
+    metrics_public: bool
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        load_dotenv()
+        return cls(
+            database_url=os.getenv("DATABASE_URL"),
+            db_pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+            db_max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+            db_pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+            db_pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+            db_pool_pre_ping=_bool("DB_POOL_PRE_PING", "true"),
+            db_statement_timeout_ms=int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0")),
+            async_db=_bool("ASYNC_DB", "false"),
+            secret_key=os.getenv("SECRET_KEY"),
+            algorithm=os.getenv("ALGORITHM"),
+            access_token_expire_minutes=int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")),
+            bcrypt_rounds=int(os.getenv("BCRYPT_ROUNDS", "12")),
+            password_hash_workers=int(os.getenv("PASSWORD_HASH_WORKERS", "2")),
+            password_hash_max_queue=int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "256")),
+            principal_cache_size=int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000")),
+            principal_cache_ttl_seconds=float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60")),
+            principal_cache_backend=os.getenv("PRINCIPAL_CACHE_BACKEND"),
+            import_chunk_size=int(os.getenv("IMPORT_CHUNK_SIZE", "1000")),
+            activity_queue_size=int(os.getenv("ACTIVITY_QUEUE_SIZE", "10000")),
+            activity_batch_size=int(os.getenv("ACTIVITY_BATCH_SIZE", "500")),
+            activity_flush_seconds=float(os.getenv("ACTIVITY_FLUSH_SECONDS", "0.5")),
+            activity_enqueue_timeout=float(os.getenv("ACTIVITY_ENQUEUE_TIMEOUT", "0.05")),
+            activity_flow_timeout=float(os.getenv("ACTIVITY_FLOW_TIMEOUT", "1")),
+            tombstone_retention_days=int(os.getenv("TOMBSTONE_RETENTION_DAYS", "30")),
+            archive_after_days=int(os.getenv("ARCHIVE_AFTER_DAYS", "30")),
+            job_workers=int(os.getenv("JOB_WORKERS", "2")),
+            job_poll_seconds=float(os.getenv("JOB_POLL_SECONDS", "1")),
+            job_lease_seconds=float(os.getenv("JOB_LEASE_SECONDS", "300")),
+            job_max_attempts=int(os.getenv("JOB_MAX_ATTEMPTS", "5")),
+            job_retry_base_seconds=float(os.getenv("JOB_RETRY_BASE_SECONDS", "5")),
+            fast_serialization=_bool("FAST_SERIALIZATION", "false"),
+            slow_query_ms=float(os.getenv("SLOW_QUERY_MS", "500")),
+            # Off by default: bound values and per-request timings can
+            # leak data to logs and clients
+            slow_query_log_params=_bool("SLOW_QUERY_LOG_PARAMS", "false"),
+            server_timing=_bool("SERVER_TIMING", "false"),
+            metrics_token=os.getenv("METRICS_TOKEN"),
+            metrics_public=_bool("METRICS_PUBLIC", "false"),
+        )
+
+
+settings = Settings.from_env()
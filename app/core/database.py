@@ -1,18 +1,262 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
-from dotenv import load_dotenv
-import os
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from app.core.config import settings
+from app.core.instrumentation import instrument_engine, record_pool_wait
+import threading
+import time
 
-load_dotenv()
+# Async drivers for DATABASE_URL's backend
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
 
-DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+class PoolMetrics:
+    """
+    Connection pool counters: checkouts, connections in use and the
+    time callers spent waiting for a free connection.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checked_out = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.total_wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def on_connect(self, *args):
+        with self._lock:
+            self.connects += 1
+
+    def on_checkout(self, *args):
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+
+    def on_checkin(self, *args):
+        with self._lock:
+            self.checked_out -= 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checked_out": self.checked_out,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": self.total_wait_seconds / max(self.checkouts, 1) * 1000,
+                "max_wait_ms": self.max_wait_seconds * 1000,
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class TimedPoolMixin:
+    """
+    Measures how long each checkout waits on the pool queue.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except Exception:
+            pool_metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            record_pool_wait(time.perf_counter() - start)
+            raise
+        waited = time.perf_counter() - start
+        pool_metrics.record_wait(waited)
+        record_pool_wait(waited)
+        return entry
+
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(url: str, is_async: bool = False) -> dict:
+    """
+    create_engine kwargs for DATABASE_URL. SQLite keeps SQLAlchemy's
+    default pool; server databases get the tunable, instrumented one.
+    """
+    backend = make_url(url).get_backend_name()
+    if backend == "sqlite":
+        return {}
+
+    options = {
+        "poolclass": TimedAsyncQueuePool if is_async else TimedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+    timeout_ms = settings.db_statement_timeout_ms
+    if backend == "postgresql" and timeout_ms:
+        if is_async:
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(timeout_ms)}
+            }
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={timeout_ms}"
+            }
+    return options
+
+
+def instrument_pool(pool):
+    event.listen(pool, "connect", pool_metrics.on_connect)
+    event.listen(pool, "checkout", pool_metrics.on_checkout)
+    event.listen(pool, "checkin", pool_metrics.on_checkin)
+
+
+# =========================
+# Engine (created on first use)
+# =========================
+#
+# Importing this module doesn't load the DB driver or touch the network;
+# the engine is built by the first session or ``get_engine()`` call.
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                url = settings.database_url
+                new_engine = create_engine(url, **engine_options(url))
+                instrument_pool(new_engine.pool)
+                instrument_engine(new_engine)
+                SessionLocal.configure(bind=new_engine)
+                _engine = new_engine
+    return _engine
+
+
+class LazySessionMaker(sessionmaker):
+    def __call__(self, **kwargs):
+        get_engine()
+        return super().__call__(**kwargs)
+
+
+SessionLocal = LazySessionMaker(autocommit=False, autoflush=False)
 Base = declarative_base()
+
+
+def __getattr__(name):
+    # ``from app.core.database import engine`` keeps working
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def dialect_insert(db, model):
+    """
+    INSERT construct with ``on_conflict_do_update`` support for the
+    session's backend (Postgres and SQLite both have it).
+    """
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    return dialect.insert(model)
+
+
+# =========================
+# Async engine (optional)
+# =========================
+#
+# Routes opt in with ``db: AsyncSession = Depends(get_async_db)``.
+# The engine is built on first use, so the async driver (asyncpg /
+# aiosqlite, requirements-async.txt) is only required by deployments
+# that use it.
+#
+# Read routes that should not take a threadpool slot per request take
+# ``Depends(get_read_db)`` and run their statements with ``read``: on
+# the async engine with ASYNC_DB=true, otherwise on a plain Session in
+# the threadpool, as sync routes do.
+
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def async_database_url(url: str) -> str:
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise RuntimeError(f"No async driver configured for {parsed.get_backend_name()}")
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(
+        hide_password=False
+    )
+
+
+def get_async_engine():
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+        url = async_database_url(settings.database_url)
+        _async_engine = create_async_engine(url, **engine_options(url, is_async=True))
+        instrument_pool(_async_engine.sync_engine.pool)
+        instrument_engine(_async_engine.sync_engine)
+        _AsyncSessionLocal = async_sessionmaker(
+            _async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_engine
+
+
+async def get_async_db():
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_read_db():
+    if settings.async_db:
+        async for db in get_async_db():
+            yield db
+        return
+    from fastapi.concurrency import run_in_threadpool
+
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        await run_in_threadpool(db.close)
+
+
+async def read(db, statement):
+    """
+    Execute a statement on a session from ``get_read_db``.
+    """
+    if settings.async_db:
+        return await db.execute(statement)
+    from fastapi.concurrency import run_in_threadpool
+
+    return await run_in_threadpool(db.execute, statement)
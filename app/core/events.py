@@ -0,0 +1,118 @@
+import asyncio
+import json
+import threading
+from dataclasses import dataclass, field
+
+# =========================
+# Project event stream
+# =========================
+#
+# Write routes call ``publish(project_id, type, data)`` after committing.
+# The broker carries the event to every worker; each worker's hub fans it
+# out to the SSE subscribers connected to that worker.
+
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+@dataclass(eq=False)
+class Subscriber:
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    )
+    overflowed: bool = False
+
+    def offer(self, event: dict):
+        # Runs on the subscriber's event loop
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Client fell behind: tell it to refetch instead of growing
+            # the queue without bound.
+            self.overflowed = True
+            self.queue.get_nowait()
+            self.queue.put_nowait({"type": "resync", "data": None})
+
+
+class EventHub:
+    """
+    In-process fan-out: project id -> connected subscribers.
+    Safe to call dispatch() from any thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: dict[int, set[Subscriber]] = {}
+
+    def subscribe(self, project_id: int) -> Subscriber:
+        subscriber = Subscriber(loop=asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(project_id, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, project_id: int, subscriber: Subscriber):
+        with self._lock:
+            subscribers = self._subscribers.get(project_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._subscribers[project_id]
+
+    def dispatch(self, project_id: int, event: dict):
+        with self._lock:
+            subscribers = list(self._subscribers.get(project_id, ()))
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.offer, event)
+            except RuntimeError:
+                # Loop already closed; the stream's finally will unsubscribe
+                pass
+
+    def subscriber_count(self, project_id: int | None = None) -> int:
+        with self._lock:
+            if project_id is not None:
+                return len(self._subscribers.get(project_id, ()))
+            return sum(len(s) for s in self._subscribers.values())
+
+
+class EventBroker:
+    """
+    Carries events between workers. A Redis/NATS/Postgres LISTEN broker
+    publishes to its channel and calls ``hub.dispatch`` for each message
+    it receives.
+    """
+
+    def __init__(self, hub: EventHub):
+        self.hub = hub
+
+    def publish(self, project_id: int, event: dict):
+        raise NotImplementedError
+
+
+class LocalBroker(EventBroker):
+    """
+    Single-worker broker: deliver straight to this process's hub.
+    """
+
+    def publish(self, project_id: int, event: dict):
+        self.hub.dispatch(project_id, event)
+
+
+hub = EventHub()
+broker: EventBroker = LocalBroker(hub)
+
+
+def set_broker(new_broker: EventBroker):
+    global broker
+    broker = new_broker
+
+
+def publish(project_id: int, event_type: str, data: dict):
+    broker.publish(project_id, {"type": event_type, "data": data})
+
+
+def format_sse(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
@@ -0,0 +1,426 @@
+import csv
+import json
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import islice
+from types import SimpleNamespace
+from typing import Callable, Iterable, Iterator, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+
+from app.core import events, stats
+from app.core.config import settings
+from app.core.ranking import last_rank, rank_after
+from app.core.search import search_index
+from app.core.versioning import bump_resync_version
+from app.models.comment import Comment
+from app.models.import_ref import ImportRef
+from app.models.ticket import Ticket, utcnow
+from app.models.user import User
+from app.schemas.comment import CommentImportRow
+from app.schemas.ticket import TicketImportRow
+
+# =========================
+# Bulk import (tickets / comments)
+# =========================
+#
+# Rows are read lazily, validated a chunk at a time and written with one
+# executemany INSERT per chunk. Every chunk is its own transaction, so
+# ``next_offset`` is a safe point to resume from after a failure.
+#
+# Rows may carry a ``ref`` (their id in the source tracker). The new ids
+# are stored in import_refs with the chunk, which is how comments find
+# their ticket (``ticket_ref``) and parent (``parent_ref``), including
+# across chunks, resumed runs and separate ticket / comment imports.
+
+logger = logging.getLogger("app.import")
+
+IMPORT_FORMATS = ("ndjson", "csv")
+IMPORT_CHUNK_SIZE = settings.import_chunk_size
+MAX_REPORTED_ERRORS = 100
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+    next_offset: int = 0
+    seconds: float = 0.0
+    # {"row", "error"} of the row a write failed on; the import stopped there
+    aborted: Optional[dict] = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return (self.imported + self.failed) / self.seconds if self.seconds else 0.0
+
+    def add_error(self, row: int, error: str):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "error": error})
+
+    def as_dict(self) -> dict:
+        return {
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": sorted(self.errors, key=lambda error: error["row"]),
+            "next_offset": self.next_offset,
+            "aborted": self.aborted,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+def read_rows(stream, format: str) -> Iterator:
+    """
+    Rows of a text stream as dicts. Malformed NDJSON lines are passed
+    through as-is and fail validation like any other bad row.
+    """
+    if format == "csv":
+        for row in csv.DictReader(stream):
+            yield {key: value for key, value in row.items() if value != ""}
+        return
+
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            yield line
+
+
+def _describe(exc: ValidationError) -> str:
+    error = exc.errors()[0]
+    location = ".".join(str(part) for part in error["loc"])
+    return f"{location}: {error['msg']}" if location else error["msg"]
+
+
+def _validate(model, chunk: list, first: int, report: ImportReport) -> list:
+    valid = []
+    for offset, raw in enumerate(chunk, first):
+        try:
+            valid.append((offset, model.model_validate(raw)))
+        except ValidationError as exc:
+            report.add_error(offset, _describe(exc))
+    return valid
+
+
+def _existing(db, column, ids: set) -> set:
+    if not ids:
+        return set()
+    return set(db.scalars(select(column).where(column.in_(ids))))
+
+
+def _stored_refs(db, project_id: int, kind: str, refs: set) -> dict:
+    if not refs:
+        return {}
+    return dict(db.execute(
+        select(ImportRef.ref, ImportRef.target_id).where(
+            ImportRef.project_id == project_id,
+            ImportRef.kind == kind,
+            ImportRef.ref.in_(refs),
+        )
+    ).all())
+
+
+def _store_refs(db, project_id: int, kind: str, refs: dict):
+    if refs:
+        db.execute(insert(ImportRef), [
+            {"project_id": project_id, "kind": kind, "ref": ref, "target_id": target_id}
+            for ref, target_id in refs.items()
+        ])
+
+
+def _insert(db, model, rows: list[dict]) -> list[int]:
+    return db.execute(
+        insert(model).returning(model.id, sort_by_parameter_order=True), rows
+    ).scalars().all()
+
+
+def _describe_failure(exc: Exception) -> str:
+    # The DBAPI error, without the statement and its parameters
+    return str(getattr(exc, "orig", None) or exc).strip()
+
+
+def run_import(
+    db,
+    rows: Iterable,
+    load_chunk: Callable,
+    start: int = 0,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    on_chunk: Optional[Callable[[ImportReport], None]] = None,
+    id_map: Optional[dict] = None,
+) -> ImportReport:
+    """
+    Feed ``rows`` (skipping the first ``start``) to ``load_chunk`` in
+    chunks, committing after each one. ``load_chunk`` may return the
+    ``ref -> id`` pairs it inserted; they go into ``id_map`` once committed,
+    so it holds the refs of this run's committed rows.
+
+    A chunk that fails to write is rolled back and replayed a row at a
+    time up to the row at fault. The import stops there and the report
+    says so in ``aborted``, with ``next_offset`` pointing at that row.
+    """
+    report = ImportReport(next_offset=start)
+    started = time.perf_counter()
+    rows = islice(rows, start, None)
+
+    def write(chunk, first):
+        imported, failed, errors = report.imported, report.failed, len(report.errors)
+        try:
+            refs = load_chunk(db, chunk, first, report)
+            db.commit()
+        except Exception:
+            db.rollback()
+            report.imported, report.failed = imported, failed
+            del report.errors[errors:]
+            raise
+        if refs and id_map is not None:
+            id_map.update(refs)
+
+    while not report.aborted:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        try:
+            write(chunk, report.next_offset)
+            report.next_offset += len(chunk)
+        except Exception:
+            logger.warning("Import chunk at row %d failed, retrying row by row", report.next_offset)
+            for offset, raw in enumerate(chunk, report.next_offset):
+                try:
+                    write([raw], offset)
+                except Exception as exc:
+                    logger.exception("Import stopped at row %d", offset)
+                    report.aborted = {"row": offset, "error": _describe_failure(exc)}
+                    break
+                report.next_offset = offset + 1
+        report.seconds = time.perf_counter() - started
+        if on_chunk is not None:
+            on_chunk(report)
+
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def _finish(project_id: int, report: ImportReport):
+    if report.imported:
+        # Too many rows for per-ticket events: boards refetch instead
+        # (other processes: see bump_resync_version)
+        search_index.invalidate(project_id)
+        events.publish(project_id, "resync", None)
+
+
+# --------------------------------------------------------
+# Tickets
+# --------------------------------------------------------
+def import_tickets(
+    db,
+    project_id: int,
+    reporter_id: int,
+    rows: Iterable,
+    start: int = 0,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    on_chunk: Optional[Callable[[ImportReport], None]] = None,
+    id_map: Optional[dict] = None,
+) -> ImportReport:
+    """
+    Import ticket rows into a project. Refs are stored for comment
+    imports; when ``id_map`` is given it is also filled with
+    ``ref -> new ticket id`` for the committed rows that carry one.
+    """
+
+    def load_chunk(db, chunk, first, report):
+        valid = _validate(TicketImportRow, chunk, first, report)
+        assignees = _existing(
+            db, User.id, {item.assignee_id for _, item in valid if item.assignee_id}
+        )
+        taken = set(_stored_refs(db, project_id, "ticket", {item.ref for _, item in valid if item.ref}))
+
+        rows, refs = [], []
+        now = utcnow()
+        for offset, item in valid:
+            if item.assignee_id is not None and item.assignee_id not in assignees:
+                report.add_error(offset, "Assignee not found")
+                continue
+            if item.ref is not None:
+                if item.ref in taken:
+                    report.add_error(offset, "Duplicate ref")
+                    continue
+                taken.add(item.ref)
+            created_at = item.created_at or now
+            rows.append({
+                "title": item.title,
+                "description": item.description,
+                "status": item.status,
+                "priority": item.priority,
+                "type": item.type,
+                "project_id": project_id,
+                "reporter_id": reporter_id,
+                "assignee_id": item.assignee_id,
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+            refs.append(item.ref)
+
+        if not rows:
+            return
+
+        version = bump_resync_version(db, project_id)
+        # Imported cards go below the existing ones, in file order
+        ranks = {}
+        for row in rows:
+            row["version"] = version
+            status = row["status"]
+            if status not in ranks:
+                ranks[status] = last_rank(db, project_id, status)
+            row["rank"] = ranks[status] = rank_after(ranks[status])
+
+        inserted = None
+        if any(ref is not None for ref in refs):
+            ids = _insert(db, Ticket, rows)
+            inserted = {ref: ticket_id for ref, ticket_id in zip(refs, ids) if ref is not None}
+            _store_refs(db, project_id, "ticket", inserted)
+        else:
+            db.execute(insert(Ticket), rows)
+
+        deltas = Counter()
+        for row in rows:
+            deltas.update(stats.ticket_counts(SimpleNamespace(**row)))
+        stats.apply_deltas(db, project_id, deltas)
+        report.imported += len(rows)
+        return inserted
+
+    report = run_import(db, rows, load_chunk, start, chunk_size, on_chunk, id_map)
+    _finish(project_id, report)
+    return report
+
+
+# --------------------------------------------------------
+# Comments
+# --------------------------------------------------------
+def import_comments(
+    db,
+    project_id: int,
+    user_id: int,
+    rows: Iterable,
+    start: int = 0,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    on_chunk: Optional[Callable[[ImportReport], None]] = None,
+    id_map: Optional[dict] = None,
+) -> ImportReport:
+    """
+    Import comment rows for tickets of a project. Rows point at their
+    ticket by ``ticket_id`` or by the ``ticket_ref`` of a ticket import,
+    and at their parent by ``parent_id`` or by the ``parent_ref`` of an
+    earlier row, in this import or a previous one. ``id_map`` is filled
+    like the ticket import's, with comment refs.
+    """
+
+    def load_chunk(db, chunk, first, report):
+        valid = _validate(CommentImportRow, chunk, first, report)
+        ticket_refs = _stored_refs(
+            db, project_id, "ticket", {item.ticket_ref for _, item in valid if item.ticket_ref}
+        )
+        comment_refs = _stored_refs(
+            db, project_id, "comment",
+            {ref for _, item in valid for ref in (item.ref, item.parent_ref) if ref},
+        )
+
+        resolved = []
+        for offset, item in valid:
+            ticket_id = item.ticket_id
+            if ticket_id is None and item.ticket_ref is not None:
+                ticket_id = ticket_refs.get(item.ticket_ref)
+            if ticket_id is None:
+                report.add_error(offset, "Ticket not found")
+                continue
+            parent_id = item.parent_id
+            if parent_id is None and item.parent_ref is not None:
+                parent_id = comment_refs.get(item.parent_ref)
+            resolved.append((offset, item, ticket_id, parent_id))
+
+        ticket_ids = {ticket_id for _, _, ticket_id, _ in resolved}
+        tickets = set(db.scalars(
+            select(Ticket.id).where(Ticket.id.in_(ticket_ids), Ticket.project_id == project_id)
+        )) if ticket_ids else set()
+        users = _existing(db, User.id, {item.user_id for _, item, _, _ in resolved if item.user_id})
+        parent_ids = {parent_id for _, _, _, parent_id in resolved if parent_id}
+        parents = dict(db.execute(
+            select(Comment.id, Comment.ticket_id).where(Comment.id.in_(parent_ids))
+        ).all()) if parent_ids else {}
+
+        # Replies to rows of this chunk wait until their parent has an id
+        ready, waiting = [], []
+        chunk_refs = set()
+        now = utcnow()
+        for offset, item, ticket_id, parent_id in resolved:
+            if ticket_id not in tickets:
+                report.add_error(offset, "Ticket not found")
+                continue
+            if item.user_id is not None and item.user_id not in users:
+                report.add_error(offset, "User not found")
+                continue
+            if item.ref is not None and (item.ref in comment_refs or item.ref in chunk_refs):
+                report.add_error(offset, "Duplicate ref")
+                continue
+            is_reply = item.parent_id is not None or item.parent_ref is not None
+            waits = parent_id is None and item.parent_ref in chunk_refs
+            if is_reply and not waits and parents.get(parent_id) != ticket_id:
+                report.add_error(offset, "Parent comment not found")
+                continue
+            if item.ref is not None:
+                chunk_refs.add(item.ref)
+            row = {
+                "content": item.content,
+                "ticket_id": ticket_id,
+                "user_id": item.user_id or user_id,
+                "parent_id": parent_id,
+                "created_at": item.created_at or now,
+            }
+            (waiting if waits else ready).append((offset, item, row))
+
+        if not ready:
+            for offset, _, _ in waiting:
+                report.add_error(offset, "Parent comment not found")
+            return
+
+        bump_resync_version(db, project_id)
+        inserted = {}
+        while ready:
+            if waiting or any(item.ref is not None for _, item, _ in ready):
+                ids = _insert(db, Comment, [row for _, _, row in ready])
+                for (_, item, row), comment_id in zip(ready, ids):
+                    parents[comment_id] = row["ticket_id"]
+                    if item.ref is not None:
+                        inserted[item.ref] = comment_id
+            else:
+                db.execute(insert(Comment), [row for _, _, row in ready])
+            report.imported += len(ready)
+
+            pending, ready, waiting = waiting, [], []
+            for offset, item, row in pending:
+                parent_id = inserted.get(item.parent_ref)
+                if parent_id is None:
+                    waiting.append((offset, item, row))
+                elif parents[parent_id] != row["ticket_id"]:
+                    report.add_error(offset, "Parent comment not found")
+                else:
+                    row["parent_id"] = parent_id
+                    ready.append((offset, item, row))
+
+        # Their parent was rejected
+        for offset, _, _ in waiting:
+            report.add_error(offset, "Parent comment not found")
+
+        _store_refs(db, project_id, "comment", inserted)
+        return inserted
+
+    report = run_import(db, rows, load_chunk, start, chunk_size, on_chunk, id_map)
+    _finish(project_id, report)
+    return report
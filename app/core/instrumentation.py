@@ -0,0 +1,139 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import event
+
+from app.core.config import settings
+
+# =========================
+# SQL statement counting
+# =========================
+
+
+class QueryCounter:
+    """
+    Collects every statement an engine executes while active.
+    """
+
+    def __init__(self):
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(engine):
+    """
+    Usage:
+
+        with count_queries(engine) as counter:
+            client.get("/tickets/projects/1")
+        assert counter.count == 2
+    """
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
+
+
+# =========================
+# Per-request performance stats
+# =========================
+#
+# The timing middleware opens a RequestStats for every request; the
+# engine and pool hooks below add to whichever one is current. Sync
+# routes run in a worker thread with a copy of the context, so they see
+# (and update) the same object.
+
+slow_query_logger = logging.getLogger("app.slow_query")
+
+
+@dataclass
+class RequestStats:
+    started: float = field(default_factory=time.perf_counter)
+    route: Optional[str] = None
+    sql_count: int = 0
+    db_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+    handler_seconds: float = 0.0
+    handler_finished: Optional[float] = None
+    serialize_seconds: float = 0.0
+
+
+_current_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+class SlowQueryCounter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def increment(self):
+        with self._lock:
+            self.count += 1
+
+
+slow_queries = SlowQueryCounter()
+
+
+def begin_request() -> tuple[RequestStats, Token]:
+    stats = RequestStats()
+    return stats, _current_stats.set(stats)
+
+
+def end_request(token: Token):
+    _current_stats.reset(token)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _current_stats.get()
+
+
+def record_pool_wait(seconds: float):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.pool_wait_seconds += seconds
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_started
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.sql_count += 1
+        stats.db_seconds += elapsed
+
+    if settings.slow_query_ms and elapsed * 1000 >= settings.slow_query_ms:
+        slow_queries.increment()
+        slow_query_logger.warning(
+            "slow query (%.1f ms) on %s: %s%s",
+            elapsed * 1000,
+            stats.route if stats is not None and stats.route else "-",
+            statement,
+            f" params={parameters!r}" if settings.slow_query_log_params else "",
+        )
+
+
+def instrument_engine(engine):
+    """
+    Time every statement ``engine`` runs (sync engines, or an async
+    engine's ``sync_engine``).
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
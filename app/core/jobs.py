@@ -0,0 +1,270 @@
+import logging
+import threading
+from datetime import timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import delete, event, update
+
+from app.core.config import settings
+from app.core.database import SessionLocal, dialect_insert
+from app.models.job import Job
+from app.models.ticket import utcnow
+
+# =========================
+# Background jobs (notifications, cleanup)
+# =========================
+#
+# Routes call ``enqueue`` before committing: the job row is written in
+# the request's own transaction, so it exists exactly when the change
+# does, and the commit wakes the workers. A pool of worker threads per
+# process (JOB_WORKERS, started with the app) claims due jobs from the
+# jobs table: SELECT ... FOR UPDATE SKIP LOCKED on Postgres, so any
+# number of processes share it; a conditional UPDATE on SQLite. A claim
+# is a lease: a job whose worker died is taken again once it expires.
+#
+# Handlers are registered with ``@job_queue.handler(name)`` next to the
+# routes that enqueue them. Each runs in a transaction that also deletes
+# the job, so its writes land once. Failures retry with exponential
+# backoff, then the job stays in the table as "failed".
+
+logger = logging.getLogger("app.jobs")
+
+QUEUED = "queued"
+RUNNING = "running"
+FAILED = "failed"
+
+MAX_RETRY_SECONDS = 3600
+
+
+class JobQueue:
+    """
+    Durable queue on the jobs table plus the worker threads draining it.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        poll_seconds: float,
+        lease_seconds: float,
+        max_attempts: int,
+        retry_base_seconds: float,
+    ):
+        self.workers = workers
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.handlers: dict[str, tuple[Callable, int]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition()
+        self._generation = 0  # bumped by every wake-up
+        self._stopping = False
+        self._threads: list[threading.Thread] = []
+        self.succeeded = 0
+        self.retried = 0
+        self.failed = 0
+
+    def handler(self, name: str, max_attempts: Optional[int] = None):
+        """
+        Register ``func(db, payload)`` for jobs called ``name``. It must
+        not commit; raising rolls its writes back and retries the job.
+        """
+        def register(func):
+            if name in self.handlers:
+                raise ValueError(f"Job handler {name!r} is already registered")
+            self.handlers[name] = (func, max_attempts or self.max_attempts)
+            return func
+        return register
+
+    def enqueue(
+        self,
+        db,
+        name: str,
+        payload: dict,
+        dedup_key: Optional[str] = None,
+        delay_seconds: float = 0,
+    ):
+        """
+        Add a job in the caller's transaction. While a job with the same
+        ``dedup_key`` is still queued, this one is dropped.
+        """
+        _, max_attempts = self.handlers.get(name, (None, self.max_attempts))
+        stmt = dialect_insert(db, Job).values(
+            name=name,
+            payload=payload,
+            max_attempts=max_attempts,
+            run_at=utcnow() + timedelta(seconds=delay_seconds),
+            dedup_key=dedup_key,
+        )
+        if dedup_key is not None:
+            stmt = stmt.on_conflict_do_nothing(index_elements=["dedup_key"])
+        db.execute(stmt)
+        db.info["jobs_enqueued"] = True
+
+    def wake(self):
+        with self._wakeup:
+            self._generation += 1
+            self._wakeup.notify_all()
+
+    def _claim(self, db):
+        while True:
+            now = utcnow()
+            # Queued jobs that are due, and running ones whose lease ran out
+            due = (
+                db.query(Job.id, Job.run_at)
+                .filter(Job.run_at <= now)
+                .order_by(Job.run_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+                .first()
+            )
+            if due is None:
+                db.commit()
+                return None
+            job = db.execute(
+                update(Job)
+                .where(Job.id == due.id, Job.run_at == due.run_at)
+                .values(
+                    status=RUNNING,
+                    attempts=Job.attempts + 1,
+                    run_at=now + timedelta(seconds=self.lease_seconds),
+                    # Changes from here on need a new job
+                    dedup_key=None,
+                )
+                .returning(Job.id, Job.name, Job.payload, Job.attempts, Job.max_attempts)
+            ).first()
+            db.commit()
+            if job is not None:
+                return job
+            # Another worker got there first (SQLite has no SKIP LOCKED)
+
+    def _execute(self, db, job):
+        try:
+            if job.attempts > job.max_attempts:
+                raise RuntimeError("Lease expired on every attempt")
+            func, _ = self.handlers.get(job.name, (None, None))
+            if func is None:
+                raise LookupError(f"No handler registered for {job.name!r}")
+            func(db, job.payload)
+            db.execute(delete(Job).where(Job.id == job.id))
+            db.commit()
+        except Exception as exc:
+            db.rollback()
+            self._retry_or_fail(db, job, exc)
+        else:
+            with self._lock:
+                self.succeeded += 1
+
+    def _retry_or_fail(self, db, job, exc: Exception):
+        error = f"{type(exc).__name__}: {exc}"
+        if job.attempts >= job.max_attempts:
+            logger.error(
+                "Job %s #%d failed for good after %d attempts",
+                job.name, job.id, job.attempts, exc_info=exc,
+            )
+            values = {"status": FAILED, "run_at": None}
+            with self._lock:
+                self.failed += 1
+        else:
+            delay = min(self.retry_base_seconds * 2 ** (job.attempts - 1), MAX_RETRY_SECONDS)
+            logger.warning(
+                "Job %s #%d failed (attempt %d/%d), retrying in %.0fs: %s",
+                job.name, job.id, job.attempts, job.max_attempts, delay, error,
+            )
+            values = {"status": QUEUED, "run_at": utcnow() + timedelta(seconds=delay)}
+            with self._lock:
+                self.retried += 1
+        db.execute(update(Job).where(Job.id == job.id).values(last_error=error, **values))
+        db.commit()
+
+    def _run_one(self) -> bool:
+        """
+        Claim and run one due job. False if there was none.
+        """
+        with SessionLocal() as db:
+            job = self._claim(db)
+            if job is None:
+                return False
+            self._execute(db, job)
+            return True
+
+    def run_pending(self) -> int:
+        """
+        Run every due job in the calling thread. Returns how many ran.
+        """
+        ran = 0
+        while self._run_one():
+            ran += 1
+        return ran
+
+    def _run(self):
+        while not self._stopping:
+            seen = self._generation
+            try:
+                if self._run_one():
+                    continue
+            except Exception:
+                # Database unreachable and the like: the lease brings it back
+                logger.exception("Job worker error")
+            with self._wakeup:
+                if self._generation == seen and not self._stopping:
+                    self._wakeup.wait(self.poll_seconds)
+
+    def start(self, workers: Optional[int] = None):
+        """
+        Start the worker threads (app startup). JOB_WORKERS=0 leaves the
+        jobs to scripts/run_jobs.py.
+        """
+        workers = self.workers if workers is None else workers
+        with self._lock:
+            if self._threads:
+                return
+            self._stopping = False
+            self._threads = [
+                threading.Thread(target=self._run, name=f"job-worker-{i}", daemon=True)
+                for i in range(workers)
+            ]
+            threads = list(self._threads)
+        for thread in threads:
+            thread.start()
+
+    def stop(self):
+        """
+        Let running jobs finish and stop the workers (app shutdown).
+        Queued jobs stay in the table for the next start.
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+        self._stopping = True
+        self.wake()
+        for thread in threads:
+            thread.join()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": len(self._threads),
+                "succeeded": self.succeeded,
+                "retried": self.retried,
+                "failed": self.failed,
+            }
+
+
+job_queue = JobQueue(
+    workers=settings.job_workers,
+    poll_seconds=settings.job_poll_seconds,
+    lease_seconds=settings.job_lease_seconds,
+    max_attempts=settings.job_max_attempts,
+    retry_base_seconds=settings.job_retry_base_seconds,
+)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _wake_workers(session):
+    if session.info.pop("jobs_enqueued", False):
+        job_queue.wake()
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _forget_enqueued(session):
+    session.info.pop("jobs_enqueued", None)
@@ -0,0 +1,206 @@
+import functools
+import inspect
+import threading
+import time
+from collections import defaultdict
+
+from fastapi import Request
+from fastapi.routing import APIRoute
+
+from app.core.config import settings
+from app.core.instrumentation import (
+    begin_request,
+    end_request,
+    current_request_stats,
+    slow_queries,
+)
+
+# =========================
+# Request metrics (Prometheus text format)
+# =========================
+#
+# Counters are per worker process; Prometheus sums them across workers.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RouteMetrics:
+    """
+    Per (method, route template) totals, so the label set stays bounded.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.responses = defaultdict(int)  # (method, route, status) -> count
+        self.buckets = defaultdict(lambda: [0] * len(LATENCY_BUCKETS))
+        self.totals = defaultdict(lambda: defaultdict(float))
+
+    def observe(self, method: str, route: str, status_code: int, seconds: float, stats):
+        key = (method, route)
+        with self._lock:
+            self.responses[(method, route, str(status_code))] += 1
+            buckets = self.buckets[key]
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    buckets[i] += 1
+            totals = self.totals[key]
+            totals["count"] += 1
+            totals["duration"] += seconds
+            totals["handler"] += stats.handler_seconds
+            totals["serialize"] += stats.serialize_seconds
+            totals["db"] += stats.db_seconds
+            totals["pool_wait"] += stats.pool_wait_seconds
+            totals["sql"] += stats.sql_count
+
+    def render(self) -> list[str]:
+        lines = [
+            "# TYPE http_requests_total counter",
+        ]
+        with self._lock:
+            for (method, route, status_code), count in sorted(self.responses.items()):
+                lines.append(
+                    f'http_requests_total{{method="{method}",route="{route}",status="{status_code}"}} {count}'
+                )
+
+            lines.append("# TYPE http_request_duration_seconds histogram")
+            for (method, route), buckets in sorted(self.buckets.items()):
+                labels = f'method="{method}",route="{route}"'
+                for bound, count in zip(LATENCY_BUCKETS, buckets):
+                    lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                totals = self.totals[(method, route)]
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {int(totals["count"])}')
+                lines.append(f"http_request_duration_seconds_sum{{{labels}}} {totals['duration']:.6f}")
+                lines.append(f"http_request_duration_seconds_count{{{labels}}} {int(totals['count'])}")
+
+            for name, total, help_text in (
+                ("http_request_handler_seconds_total", "handler", "time in the route function"),
+                ("http_request_serialize_seconds_total", "serialize", "response validation and encoding"),
+                ("http_request_db_seconds_total", "db", "time executing SQL"),
+                ("http_request_pool_wait_seconds_total", "pool_wait", "time waiting for a pooled connection"),
+                ("http_request_sql_statements_total", "sql", "SQL statements executed"),
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for (method, route), totals in sorted(self.totals.items()):
+                    lines.append(f'{name}{{method="{method}",route="{route}"}} {totals[total]:g}')
+        return lines
+
+
+route_metrics = RouteMetrics()
+
+
+def _gauges(prefix: str, values: dict) -> list[str]:
+    lines = []
+    for key, value in values.items():
+        lines.append(f"# TYPE {prefix}_{key} gauge")
+        lines.append(f"{prefix}_{key} {value:g}")
+    return lines
+
+
+def render_metrics() -> str:
+    from app.core.activity import activity_writer
+    from app.core.jobs import job_queue
+    from app.core.database import pool_metrics
+    from app.core.events import hub
+    from app.core.security import password_hasher
+
+    lines = route_metrics.render()
+    lines += [
+        "# TYPE db_slow_queries_total counter",
+        f"db_slow_queries_total {slow_queries.count}",
+    ]
+    lines += _gauges("db_pool", pool_metrics.stats())
+    lines += _gauges("password_hasher", password_hasher.stats())
+    lines += _gauges("activity_writer", activity_writer.stats())
+    lines += _gauges("jobs", job_queue.stats())
+    lines += _gauges("events", {"subscribers": hub.subscriber_count()})
+    return "\n".join(lines) + "\n"
+
+
+# =========================
+# Handler vs. serialization timing
+# =========================
+
+
+def _handler_finished(started: float):
+    stats = current_request_stats()
+    if stats is not None:
+        now = time.perf_counter()
+        stats.handler_seconds += now - started
+        stats.handler_finished = now
+
+
+def timed_endpoint(endpoint):
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _handler_finished(started)
+    else:
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                _handler_finished(started)
+    return wrapper
+
+
+class TimedRoute(APIRoute):
+    """
+    Route class that splits request time into the route function and the
+    response serialization after it. Routers opt in with
+    ``APIRouter(route_class=TimedRoute)``.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request):
+            stats = current_request_stats()
+            if stats is not None:
+                stats.route = self.path_format
+            response = await handler(request)
+            if stats is not None and stats.handler_finished is not None:
+                stats.serialize_seconds = time.perf_counter() - stats.handler_finished
+            return response
+
+        return timed_handler
+
+
+def server_timing(stats, total_seconds: float) -> str:
+    return ", ".join([
+        f"total;dur={total_seconds * 1000:.1f}",
+        f"handler;dur={stats.handler_seconds * 1000:.1f}",
+        f"serialize;dur={stats.serialize_seconds * 1000:.1f}",
+        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.sql_count} queries"',
+        f"pool;dur={stats.pool_wait_seconds * 1000:.1f}",
+    ])
+
+
+async def timing_middleware(request: Request, call_next):
+    stats, token = begin_request()
+    try:
+        response = await call_next(request)
+    finally:
+        end_request(token)
+
+    total_seconds = time.perf_counter() - stats.started
+    route_metrics.observe(
+        request.method,
+        stats.route or UNMATCHED_ROUTE,
+        response.status_code,
+        total_seconds,
+        stats,
+    )
+    if settings.server_timing:
+        response.headers["Server-Timing"] = server_timing(stats, total_seconds)
+    return response
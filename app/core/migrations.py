@@ -0,0 +1,43 @@
+from alembic import op
+from sqlalchemy import text
+
+# =========================
+# Online index changes for migrations
+# =========================
+#
+# On Postgres these build and drop indexes CONCURRENTLY, so the table
+# keeps taking writes meanwhile. That can't run inside a transaction:
+# call them within ``op.get_context().autocommit_block()``. Other
+# databases get plain CREATE / DROP INDEX.
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _drop_invalid(name: str):
+    # A failed concurrent build leaves an INVALID index behind, which
+    # IF NOT EXISTS would then take for the finished one
+    if op.get_context().as_sql:
+        return  # --sql: nothing to inspect
+    invalid = op.get_bind().execute(
+        text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name},
+    ).first()
+    if invalid:
+        op.drop_index(name, postgresql_concurrently=True)
+
+
+def create_index_online(name: str, table: str, columns: list, **kwargs):
+    if _is_postgres():
+        _drop_invalid(name)
+        kwargs["postgresql_concurrently"] = True
+    op.create_index(name, table, columns, if_not_exists=True, **kwargs)
+
+
+def drop_index_online(name: str, table: str):
+    kwargs = {"postgresql_concurrently": True} if _is_postgres() else {}
+    op.drop_index(name, table_name=table, if_exists=True, **kwargs)
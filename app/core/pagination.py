@@ -0,0 +1,36 @@
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException
+
+# =========================
+# Keyset (cursor) pagination
+# =========================
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(sort_value: datetime | str, row_id: int) -> str:
+    """
+    Build an opaque cursor from the last row of a page.
+    """
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, parse=datetime.fromisoformat) -> tuple:
+    """
+    Turn a cursor back into the (sort value, id) pair it was built from,
+    ``parse`` restoring the sort value (``str`` for text columns).
+    Raises 400 if the client sent something we did not issue.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return parse(sort_value), int(row_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -1,4 +1,12 @@
-from fastapi import HTTPException
+from fastapi import Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache, LocalBackend
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.security import get_current_user
+from app.models.project_member import ProjectMember
+
 
 def require_role(allowed_roles: list[str]):
     def role_checker(current_user):
@@ -9,3 +17,99 @@ def require_role(allowed_roles: list[str]):
             )
         return current_user
     return role_checker
+
+
+# =========================
+# Ticket rules (shared by single and bulk routes)
+# =========================
+
+def ticket_update_error(current_user, assignee_id, reassigning: bool):
+    """
+    Why current_user may not update a ticket currently assigned to
+    ``assignee_id``, or None if allowed.
+    """
+    if current_user.role == "admin":
+        return None  # admin can update anything
+
+    if current_user.role == "developer":
+        # Developer can only update tickets assigned to them
+        if assignee_id != current_user.id:
+            return "Not allowed"
+        # Developer cannot reassign
+        if reassigning:
+            return "Only admin can reassign tickets"
+        return None
+
+    return "Not allowed"  # viewer
+
+
+def ticket_assign_error(current_user, assignee_id):
+    """
+    Only admin can assign tickets when creating them.
+    """
+    if assignee_id is not None and current_user.role != "admin":
+        return "Only admin can assign tickets"
+    return None
+
+
+# =========================
+# Project membership
+# =========================
+
+# user_id -> frozenset of project ids. Sized, aged and shared like the
+# principal cache, so access checks cost one query per user per TTL.
+membership_cache = TTLCache(
+    maxsize=settings.principal_cache_size,
+    ttl=settings.principal_cache_ttl_seconds,
+    namespace="memberships",
+    backend=LocalBackend() if settings.principal_cache_backend == "local" else None,
+)
+
+
+def user_project_ids(db: Session, user_id: int) -> frozenset[int]:
+    project_ids = membership_cache.get(user_id)
+    if project_ids is None:
+        project_ids = frozenset(
+            project_id for (project_id,) in
+            db.query(ProjectMember.project_id).filter(ProjectMember.user_id == user_id)
+        )
+        membership_cache.set(user_id, project_ids)
+    return project_ids
+
+
+def invalidate_memberships(user_id: int):
+    """
+    Call whenever a user joins or leaves a project.
+    """
+    membership_cache.invalidate(user_id)
+
+
+def project_access_error(db: Session, current_user, project_id: int):
+    """
+    Why current_user may not work in ``project_id``, or None if allowed.
+    """
+    if current_user.role == "admin":
+        return None  # admin can access every project
+
+    if project_id not in user_project_ids(db, current_user.id):
+        return "Not a member of this project"
+    return None
+
+
+def check_project_access(db: Session, current_user, project_id: int):
+    error = project_access_error(db, current_user, project_id)
+    if error:
+        raise HTTPException(status_code=403, detail=error)
+
+
+def require_project_member(
+    project_id: int,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    """
+    Dependency for routes taking ``project_id`` (path or query):
+    returns the current user if they may access that project.
+    """
+    check_project_access(db, current_user, project_id)
+    return current_user
@@ -0,0 +1,146 @@
+from typing import Optional
+
+from sqlalchemy import func, update
+
+from app.core import events
+from app.core.database import SessionLocal
+from app.core.versioning import bump_project_version
+from app.models.ticket import Ticket
+
+# =========================
+# Kanban card order (fractional ranks)
+# =========================
+#
+# A rank is a base-36 fraction written without the leading "0."
+# ("i" = 0.5): plain string comparison orders them, and there is always
+# a rank between two others, so a move rewrites only the moved card.
+# Ranks never end in "0" ("a" and "a0" would be the same number).
+# Repeated moves into one spot make ranks longer; past
+# RANK_REBALANCE_LENGTH the column is respaced in the background.
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+MID_RANK = DIGITS[BASE // 2]
+
+# Appends step by one unit at this width, so creating cards one after
+# another does not grow their ranks
+STEP_WIDTH = 4
+RANK_MAX_LENGTH = 64  # Ticket.rank column size
+RANK_REBALANCE_LENGTH = 24
+
+
+def _encode(value: int, width: int) -> str:
+    digits = []
+    for _ in range(width):
+        value, digit = divmod(value, BASE)
+        digits.append(DIGITS[digit])
+    return "".join(reversed(digits)).rstrip("0")
+
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    A rank strictly between ``before`` and ``after`` (None = open end).
+    """
+    before = before or ""
+    if after is not None:
+        if before >= after:
+            raise ValueError(f"{before!r} is not below {after!r}")
+        # Keep the shared prefix ("" pads with zeros) and split after it
+        n = 0
+        while n < len(after) and (before[n] if n < len(before) else "0") == after[n]:
+            n += 1
+        if n:
+            return after[:n] + rank_between(before[n:], after[n:])
+
+    low = DIGITS.index(before[0]) if before else 0
+    high = DIGITS.index(after[0]) if after is not None else BASE
+    if high - low > 1:
+        return DIGITS[(low + high) // 2]
+    # Adjacent first digits: a longer ``after`` is already above its own
+    # first digit, otherwise keep ``before``'s digit and go one deeper
+    if after is not None and len(after) > 1:
+        return after[0]
+    return DIGITS[low] + rank_between(before[1:], None)
+
+
+def rank_after(rank: Optional[str]) -> str:
+    """
+    Rank for a card appended below ``rank`` (the column's last card).
+    """
+    if rank is None:
+        return MID_RANK
+    value = int(rank[:STEP_WIDTH].ljust(STEP_WIDTH, "0"), BASE) + 1
+    if value < BASE ** STEP_WIDTH:
+        return _encode(value, STEP_WIDTH)
+    return rank_between(rank, None)
+
+
+def ranks_after(rank: Optional[str], count: int) -> list[str]:
+    ranks = []
+    for _ in range(count):
+        rank = rank_after(rank)
+        ranks.append(rank)
+    return ranks
+
+
+def spaced_ranks(count: int) -> list[str]:
+    """
+    ``count`` evenly spaced ranks of one width, with room for a couple
+    of digits of moves between neighbours.
+    """
+    width = STEP_WIDTH
+    while BASE ** width < (count + 1) * BASE ** 2:
+        width += 1
+    step = BASE ** width // (count + 1)
+    return [_encode(step * (i + 1), width) for i in range(count)]
+
+
+def needs_rebalance(rank: str) -> bool:
+    return len(rank) > RANK_REBALANCE_LENGTH
+
+
+def last_rank(db, project_id: int, status) -> Optional[str]:
+    return (
+        db.query(func.max(Ticket.rank))
+        .filter(Ticket.project_id == project_id, Ticket.status == status)
+        .scalar()
+    )
+
+
+# =========================
+# Rebalancing
+# =========================
+
+
+def rebalance_column(db, project_id: int, status) -> int:
+    """
+    Respace the ranks of one column, keeping its order. Bumps the
+    project version (which also locks out concurrent moves) and stamps
+    the rewritten tickets with it so clients pick up the new ranks.
+    Returns that version.
+    """
+    version = bump_project_version(db, project_id)
+    ids = [
+        ticket_id for (ticket_id,) in
+        db.query(Ticket.id)
+        .filter(Ticket.project_id == project_id, Ticket.status == status)
+        .order_by(Ticket.rank, Ticket.id)
+    ]
+    if ids:
+        # ORM bulk UPDATE by primary key: one executemany
+        db.execute(update(Ticket), [
+            {"id": ticket_id, "rank": rank, "version": version}
+            for ticket_id, rank in zip(ids, spaced_ranks(len(ids)))
+        ])
+    return version
+
+
+def rebalance_in_background(project_id: int, status):
+    """
+    BackgroundTasks entry point: respace a column after the response.
+    """
+    with SessionLocal() as db:
+        rebalance_column(db, project_id, status)
+        db.commit()
+    # Every card in the column changed: boards refetch instead
+    events.publish(project_id, "resync", None)
@@ -0,0 +1,342 @@
+import html
+import re
+import threading
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+from sqlalchemy import and_, func, literal_column, or_
+from sqlalchemy.dialects import postgresql  # noqa: F401 (registers to_tsvector & co.)
+
+# =========================
+# Full-text search
+# =========================
+#
+# Postgres: GIN expression indexes over to_tsvector(...) (declared on the
+# models with ``search_vector``) are maintained by the database itself.
+#
+# Everything else (SQLite dev/test setups): a per-process inverted index,
+# built lazily per project on first search and kept current by the
+# ``index_*`` hooks called from the write routes. Archived tickets are
+# left out of it and matched with LIKE instead (``contains_terms``).
+
+SEARCH_CONFIG = "english"
+# Snippets are HTML: the indexed text is escaped, then these wrap matches
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+SNIPPET_WORDS = 12
+
+# What html.escape replaces, "&" first
+HTML_ENTITIES = (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#x27;"))
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def search_vector(*columns):
+    """
+    tsvector expression shared by the GIN index DDL and the queries.
+    Only literal SQL is used so Postgres can match it to the index.
+    """
+    document = func.coalesce(columns[0], literal_column("''"))
+    for column in columns[1:]:
+        document = document.op("||")(literal_column("' '")).op("||")(
+            func.coalesce(column, literal_column("''"))
+        )
+    return func.to_tsvector(literal_column(f"'{SEARCH_CONFIG}'"), document)
+
+
+def html_escaped(text):
+    """
+    SQL for html.escape(text), so ts_headline's markers are the only
+    markup in a snippet. (The Postgres parser reads entities as
+    separate tokens, so matching is unaffected.)
+    """
+    for char, entity in HTML_ENTITIES:
+        text = func.replace(text, char, entity)
+    return text
+
+
+def tokenize(text: str | None) -> list[str]:
+    return TOKEN_RE.findall(text.lower()) if text else []
+
+
+def build_tsquery(text: str) -> str | None:
+    """
+    'login crash' -> 'login:* & crash:*' (every term, prefix matched).
+    """
+    terms = tokenize(text)
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def is_postgres(db) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def ticket_match_filter(db, project_id: int, text: str, archived: bool = False):
+    """
+    WHERE clause for the board's ``search`` filter that can use an index
+    (unlike ILIKE '%x%'). Returns None when the text has no searchable terms.
+    """
+    from app.models.archived_ticket import ArchivedTicket
+    from app.models.ticket import Ticket
+
+    model = ArchivedTicket if archived else Ticket
+    terms = tokenize(text)
+    if not terms:
+        return None
+
+    if is_postgres(db):
+        query = func.to_tsquery(
+            literal_column(f"'{SEARCH_CONFIG}'"), build_tsquery(text)
+        )
+        return search_vector(model.title, model.description).op("@@")(query)
+
+    if archived:
+        return contains_terms(terms, model.title, model.description)
+
+    matches = search_index.search(db, project_id, terms)
+    ids = [key[1] for key in matches if key[0] == "ticket"]
+    return Ticket.id.in_(ids)
+
+
+def contains_terms(terms: list[str], *columns):
+    """
+    Every term appears in one of the columns (a scan, for tables without
+    an inverted index; looser than the index's word prefixes).
+    """
+    return and_(*(
+        or_(*(column.ilike(f"%{term}%") for column in columns))
+        for term in terms
+    ))
+
+
+def highlight(text: str, terms: list[str]) -> str:
+    """
+    Cut a short window around the first match and wrap matches in
+    <mark>. The words are HTML-escaped, so only the marks are markup.
+    """
+    words = text.split()
+    matched = [
+        i for i, word in enumerate(words)
+        if any(t.startswith(term) for t in tokenize(word) for term in terms)
+    ]
+    if not matched:
+        return " ".join(html.escape(word) for word in words[:SNIPPET_WORDS])
+
+    start = max(matched[0] - SNIPPET_WORDS // 3, 0)
+    window = words[start:start + SNIPPET_WORDS]
+    out = []
+    for i, word in enumerate(window, start):
+        word = html.escape(word)
+        out.append(f"{HIGHLIGHT_START}{word}{HIGHLIGHT_STOP}" if i in matched else word)
+    return " ".join(out)
+
+
+class InvertedIndex:
+    """
+    Token -> postings map for one project, with a sorted vocabulary so
+    prefix lookups are a bisect instead of a scan.
+    """
+
+    def __init__(self):
+        self.postings: dict[str, dict[tuple, int]] = defaultdict(dict)
+        self.vocabulary: list[str] = []
+        self.documents: dict[tuple, tuple[int, str]] = {}
+
+    def add(self, key: tuple, ticket_id: int, text: str):
+        self.remove(key)
+        counts: dict[str, int] = defaultdict(int)
+        for token in tokenize(text):
+            counts[token] += 1
+        for token, count in counts.items():
+            if token not in self.postings:
+                insort(self.vocabulary, token)
+            self.postings[token][key] = count
+        self.documents[key] = (ticket_id, text)
+
+    def remove(self, key: tuple):
+        document = self.documents.pop(key, None)
+        if document is None:
+            return
+        for token in set(tokenize(document[1])):
+            posting = self.postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(key, None)
+            if not posting:
+                del self.postings[token]
+                self.vocabulary.pop(bisect_left(self.vocabulary, token))
+
+    def expand(self, prefix: str) -> list[str]:
+        i = bisect_left(self.vocabulary, prefix)
+        tokens = []
+        while i < len(self.vocabulary) and self.vocabulary[i].startswith(prefix):
+            tokens.append(self.vocabulary[i])
+            i += 1
+        return tokens
+
+    def search(self, terms: list[str]) -> dict[tuple, float]:
+        """
+        AND of prefix-matched terms, scored by summed term frequency
+        weighted by how rare each matched token is.
+        """
+        scores: dict[tuple, float] | None = None
+        total = max(len(self.documents), 1)
+        for term in terms:
+            term_scores: dict[tuple, float] = defaultdict(float)
+            for token in self.expand(term):
+                posting = self.postings[token]
+                weight = 1.0 + total / len(posting)
+                for key, count in posting.items():
+                    term_scores[key] += count * weight
+            if scores is None:
+                scores = dict(term_scores)
+            else:
+                scores = {
+                    key: score + term_scores[key]
+                    for key, score in scores.items()
+                    if key in term_scores
+                }
+            if not scores:
+                return {}
+        return scores or {}
+
+    def matches(self, terms: list[str]) -> dict[tuple, tuple[float, int, str]]:
+        """
+        search(), with each match's score, ticket id and text copied out,
+        so callers don't read the index after it is released.
+        """
+        return {
+            key: (score, *self.documents[key])
+            for key, score in self.search(terms).items()
+        }
+
+
+class SearchIndexRegistry:
+    """
+    Lazily built inverted indexes, one per project.
+
+    The indexes are shared and changed in place by the write hooks, so
+    they are only read or written under ``lock``. ``writes`` counts the
+    hook calls: an index built while it moved may have missed one, and
+    is used for that search but not cached. Bulk writes from other
+    processes (archival, imports) reach no hook here; an index older
+    than its project's resync version is rebuilt.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.projects: dict[int, InvertedIndex] = {}
+        self.ticket_projects: dict[int, int] = {}
+        self.resyncs: dict[int, int] = {}  # project -> resync version built at
+        self.writes = 0
+
+    def search(self, db, project_id: int, terms: list[str]) -> dict[tuple, tuple[float, int, str]]:
+        index = self.get(db, project_id)
+        with self.lock:
+            return index.matches(terms)
+
+    def get(self, db, project_id: int) -> InvertedIndex:
+        from app.core.versioning import resync_version
+
+        resync = resync_version(db, project_id)
+        with self.lock:
+            index = self.projects.get(project_id)
+            if index is not None and self.resyncs[project_id] >= resync:
+                return index
+            writes = self.writes
+
+        # Queried without the lock, so searches and writes in other
+        # projects don't wait on this one's build
+        index, ticket_projects = self._build(db, project_id)
+
+        with self.lock:
+            cached = self.projects.get(project_id)
+            if cached is not None and self.resyncs[project_id] >= resync:
+                return cached  # another request built it first
+            if self.writes == writes:
+                self.projects[project_id] = index
+                self.resyncs[project_id] = resync
+                self.ticket_projects.update(ticket_projects)
+            return index
+
+    def _build(self, db, project_id: int) -> tuple[InvertedIndex, dict[int, int]]:
+        from app.models.ticket import Ticket
+        from app.models.comment import Comment
+
+        index = InvertedIndex()
+        ticket_projects = {}
+        tickets = db.query(Ticket.id, Ticket.title, Ticket.description).filter(
+            Ticket.project_id == project_id
+        )
+        for ticket_id, title, description in tickets:
+            index.add(("ticket", ticket_id), ticket_id, ticket_text(title, description))
+            ticket_projects[ticket_id] = project_id
+
+        comments = (
+            db.query(Comment.id, Comment.ticket_id, Comment.content)
+            .join(Ticket, Ticket.id == Comment.ticket_id)
+            .filter(Ticket.project_id == project_id)
+        )
+        for comment_id, ticket_id, content in comments:
+            index.add(("comment", comment_id), ticket_id, content)
+        return index, ticket_projects
+
+    def index_ticket(self, ticket):
+        with self.lock:
+            self.writes += 1
+            index = self.projects.get(ticket.project_id)
+            if index is None:
+                return
+            index.add(
+                ("ticket", ticket.id),
+                ticket.id,
+                ticket_text(ticket.title, ticket.description),
+            )
+            self.ticket_projects[ticket.id] = ticket.project_id
+
+    def remove_ticket(self, ticket_id: int):
+        with self.lock:
+            self.writes += 1
+            project_id = self.ticket_projects.pop(ticket_id, None)
+            index = self.projects.get(project_id)
+            if index is None:
+                return
+            for key, (owner_id, _) in list(index.documents.items()):
+                if owner_id == ticket_id:
+                    index.remove(key)
+
+    def index_comment(self, comment):
+        with self.lock:
+            self.writes += 1
+            index = self.projects.get(self.ticket_projects.get(comment.ticket_id))
+            if index is None:
+                return
+            index.add(("comment", comment.id), comment.ticket_id, comment.content)
+
+    def remove_comment(self, comment_id: int, ticket_id: int):
+        with self.lock:
+            self.writes += 1
+            index = self.projects.get(self.ticket_projects.get(ticket_id))
+            if index is not None:
+                index.remove(("comment", comment_id))
+
+    def invalidate(self, project_id: int | None = None):
+        """
+        Drop cached indexes after writes that bypass the hooks
+        (bulk statements, imports); they are rebuilt on next search.
+        """
+        with self.lock:
+            self.writes += 1
+            if project_id is None:
+                self.projects.clear()
+            else:
+                self.projects.pop(project_id, None)
+
+
+def ticket_text(title: str | None, description: str | None) -> str:
+    return " ".join(part for part in (title, description) if part)
+
+
+search_index = SearchIndexRegistry()
@@ -1,29 +1,36 @@
-from passlib.context import CryptContext
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import cache
+import asyncio
+import threading
+import time
 from jose import jwt
-from dotenv import load_dotenv
-import os
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
+from app.core.cache import TTLCache, LocalBackend
+from app.core.config import settings
+from app.core.database import get_db
+from app.models.user import User
 
 
-# Load environment variables from .env
-load_dotenv()
-
-# JWT settings
-SECRET_KEY = os.getenv("SECRET_KEY")
-ALGORITHM = os.getenv("ALGORITHM")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
 security = HTTPBearer()
 
 
+# Password hashing context (bcrypt), built on first use so importing the
+# app doesn't pay for passlib and the bcrypt backend.
+# Hashes made with a different cost are flagged for update and
+# transparently rehashed on the next successful login.
+@cache
+def pwd_context():
+    from passlib.context import CryptContext
 
-
-# Password hashing context (bcrypt)
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto"
-)
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=settings.bcrypt_rounds
+    )
 
 # =========================
 # Password Hashing
@@ -34,7 +41,7 @@ def hash_password(password: str) -> str:
     Convert plain password into hashed password.
     Used during signup.
     """
-    return pwd_context.hash(password)
+    return pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -42,7 +49,91 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Verify plain password against hashed password.
     Used during login.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return pwd_context().verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str):
+    """
+    Verify a password and, if the stored hash uses outdated cost settings,
+    return a fresh hash to store. Returns (valid, new_hash_or_None).
+    """
+    return pwd_context().verify_and_update(plain_password, hashed_password)
+
+
+# =========================
+# Password Hashing Executor
+# =========================
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated thread pool so a login burst queues
+    here instead of pinning every request worker. Rejects with 503 once
+    ``max_queue`` callers are already waiting.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="password-hasher"
+        )
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.total_hash_seconds = 0.0
+
+    async def run(self, func, *args):
+        with self._lock:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many sign-ins in progress, retry shortly",
+                )
+            self.queued += 1
+
+        submitted = time.perf_counter()
+
+        def task():
+            started = time.perf_counter()
+            with self._lock:
+                self.queued -= 1
+                self.in_flight += 1
+                self.total_wait_seconds += started - submitted
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+                    self.completed += 1
+                    self.total_hash_seconds += time.perf_counter() - started
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, task)
+
+    def stats(self) -> dict:
+        with self._lock:
+            done = max(self.completed, 1)
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self.queued,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": self.total_wait_seconds / done * 1000,
+                "avg_hash_ms": self.total_hash_seconds / done * 1000,
+            }
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_max_queue,
+)
 
 
 # =========================
@@ -56,31 +147,65 @@ def create_access_token(data: dict) -> str:
     to_encode = data.copy()
 
     expire = datetime.utcnow() + timedelta(
-        minutes=ACCESS_TOKEN_EXPIRE_MINUTES
+        minutes=settings.access_token_expire_minutes
     )
 
     to_encode.update({"exp": expire})
 
     encoded_jwt = jwt.encode(
         to_encode,
-        SECRET_KEY,
-        algorithm=ALGORITHM
+        settings.secret_key,
+        algorithm=settings.algorithm
     )
 
     return encoded_jwt
 
-from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.models.user import User
+
+
+# =========================
+# Principal Cache
+# =========================
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    The authenticated user as routes see it (no password hash, no session).
+    """
+    id: int
+    email: str
+    role: str
+
+
+# Multi-worker deployments can assign a shared CacheBackend
+# (principal_cache.backend = ...); "local" is an in-process stand-in.
+#
+# Nothing in the API changes a user's role or deletes a user, so entries
+# are never invalidated: a role changed in the database (or a deleted
+# user) takes effect within PRINCIPAL_CACHE_TTL_SECONDS. Keep the TTL
+# short; a route that edits users must call principal_cache.invalidate.
+principal_cache = TTLCache(
+    maxsize=settings.principal_cache_size,
+    ttl=settings.principal_cache_ttl_seconds,
+    namespace="principal",
+    backend=LocalBackend() if settings.principal_cache_backend == "local" else None,
+)
+
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ):
-    token = credentials.credentials
+    return principal_from_token(credentials.credentials, db)
+
 
+def principal_from_token(token: str, db: Session) -> Principal:
+    """
+    Resolve a raw JWT to its Principal. Shared by the Authorization
+    header dependency and endpoints that take the token elsewhere
+    (e.g. EventSource streams, which cannot send headers).
+    """
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
         user_id = payload.get("sub")
         if user_id is None:
             raise HTTPException(
@@ -93,11 +218,22 @@ def get_current_user(
             detail="Invalid or expired token",
         )
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user_id = int(user_id)
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    user = (
+        db.query(User.id, User.email, User.role)
+        .filter(User.id == user_id)
+        .first()
+    )
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
 
-    return user
+    principal = Principal(id=user.id, email=user.email, role=user.role)
+    principal_cache.set(user_id, principal)
+    return principal
@@ -0,0 +1,26 @@
+from fastapi import Response
+from pydantic import TypeAdapter
+
+# =========================
+# Pre-encoded JSON responses
+# =========================
+
+
+def json_response(adapter: TypeAdapter, data, response: Response | None = None) -> Response:
+    """
+    Encode ``data`` straight to JSON bytes with a prebuilt TypeAdapter,
+    bypassing FastAPI's response_model validation. Only for data the
+    route built itself from database rows. Headers already set on the
+    route's injected ``response`` (ETag, ...) are carried over.
+    """
+    headers = None
+    if response is not None:
+        headers = {
+            key: value for key, value in response.headers.items()
+            if key != "content-length"
+        }
+    return Response(
+        content=adapter.dump_json(data),
+        media_type="application/json",
+        headers=headers,
+    )
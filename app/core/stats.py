@@ -0,0 +1,135 @@
+import enum
+from collections import Counter
+
+from sqlalchemy import func
+
+from app.core.database import dialect_insert
+from app.models.archived_ticket import ArchivedTicket
+from app.models.project_stats import ProjectTicketCount
+from app.models.ticket import Ticket
+
+# =========================
+# Project ticket counters
+# =========================
+#
+# Board tickets count in every dimension. Archived tickets leave those
+# and keep only an "archived_status" cell, which the totals still add.
+
+DIMENSIONS = ("status", "priority", "type", "assignee_id")
+ARCHIVED = "archived_status"
+UNASSIGNED = "unassigned"
+
+
+def _key(value) -> str:
+    if value is None:
+        return UNASSIGNED
+    if isinstance(value, enum.Enum):
+        return value.value
+    return str(value)
+
+
+def ticket_counts(ticket) -> Counter:
+    """
+    The counter cells one ticket contributes to.
+    """
+    return Counter(
+        {(dimension, _key(getattr(ticket, dimension))): 1 for dimension in DIMENSIONS}
+    )
+
+
+def archived_counts(ticket) -> Counter:
+    """
+    The counter cell an archived ticket keeps.
+    """
+    return Counter({(ARCHIVED, _key(ticket.status)): 1})
+
+
+def apply_deltas(db, project_id: int, deltas: Counter):
+    """
+    Add ``deltas`` to the project's counters in one upsert statement.
+    Runs inside the caller's transaction.
+    """
+    rows = [
+        {"project_id": project_id, "dimension": dimension, "value": value, "count": delta}
+        for (dimension, value), delta in deltas.items()
+        if delta
+    ]
+    if not rows:
+        return
+
+    stmt = dialect_insert(db, ProjectTicketCount).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["project_id", "dimension", "value"],
+        set_={"count": ProjectTicketCount.count + stmt.excluded.count},
+    )
+    db.execute(stmt)
+
+
+def record_created(db, ticket):
+    apply_deltas(db, ticket.project_id, ticket_counts(ticket))
+
+
+def record_deleted(db, ticket):
+    deltas = Counter()
+    deltas.subtract(ticket_counts(ticket))
+    apply_deltas(db, ticket.project_id, deltas)
+
+
+def record_updated(db, project_id: int, before: Counter, after: Counter):
+    deltas = Counter(after)
+    deltas.subtract(before)
+    apply_deltas(db, project_id, deltas)
+
+
+def rebuild_project_stats(db, project_id: int | None = None):
+    """
+    Recompute counters from the tickets and archived_tickets tables
+    (backfill / repair).
+    """
+    delete = db.query(ProjectTicketCount)
+    if project_id is not None:
+        delete = delete.filter(ProjectTicketCount.project_id == project_id)
+    delete.delete(synchronize_session=False)
+
+    cells = [(dimension, Ticket, getattr(Ticket, dimension)) for dimension in DIMENSIONS]
+    cells.append((ARCHIVED, ArchivedTicket, ArchivedTicket.status))
+    for dimension, model, column in cells:
+        grouped = db.query(model.project_id, column, func.count())
+        if project_id is not None:
+            grouped = grouped.filter(model.project_id == project_id)
+        grouped = grouped.group_by(model.project_id, column)
+
+        db.add_all(
+            ProjectTicketCount(
+                project_id=pid, dimension=dimension, value=_key(value), count=count
+            )
+            for pid, value, count in grouped
+        )
+    db.flush()
+
+
+def project_stats(db, project_id: int) -> dict:
+    """
+    Board counts per dimension, plus archived tickets by status. The
+    total counts both, so archiving does not shrink it.
+    """
+    stats = {f"by_{dimension.replace('_id', '')}": {} for dimension in DIMENSIONS}
+    stats["archived_by_status"] = {}
+    rows = db.query(
+        ProjectTicketCount.dimension,
+        ProjectTicketCount.value,
+        ProjectTicketCount.count,
+    ).filter(
+        ProjectTicketCount.project_id == project_id,
+        ProjectTicketCount.count != 0,
+    )
+    for dimension, value, count in rows:
+        if dimension == ARCHIVED:
+            stats["archived_by_status"][value] = count
+        else:
+            stats[f"by_{dimension.replace('_id', '')}"][value] = count
+
+    stats["active"] = sum(stats["by_status"].values())
+    stats["archived"] = sum(stats["archived_by_status"].values())
+    stats["total"] = stats["active"] + stats["archived"]
+    return stats
@@ -0,0 +1,146 @@
+import hashlib
+
+from fastapi import Request, Response
+from sqlalchemy import func
+
+from app.core.database import dialect_insert
+from app.models.project_version import ProjectVersion
+from app.models.ticket import Ticket
+from app.models.ticket_tombstone import TicketTombstone
+
+# =========================
+# Project change tokens / ETags
+# =========================
+
+
+def bump_project_version(db, project_id: int) -> int:
+    """
+    Increment the project's version inside the caller's transaction and
+    return the new value. The row lock this takes also orders concurrent
+    writers, so versions become visible in commit order.
+    """
+    stmt = dialect_insert(db, ProjectVersion).values(project_id=project_id, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["project_id"],
+        set_={"version": ProjectVersion.version + 1},
+    ).returning(ProjectVersion.version)
+    return db.execute(stmt).scalar_one()
+
+
+def bump_resync_version(db, project_id: int) -> int:
+    """
+    ``bump_project_version`` for a bulk write made without the per-row
+    hooks and events (archival, imports), possibly in another process:
+    the new version is also the project's resync version, which every
+    API worker checks (``resync_version``) to drop its search index and
+    send its event streams a resync.
+    """
+    stmt = dialect_insert(db, ProjectVersion).values(
+        project_id=project_id, version=1, resync_version=1
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["project_id"],
+        set_={
+            "version": ProjectVersion.version + 1,
+            "resync_version": ProjectVersion.version + 1,
+        },
+    ).returning(ProjectVersion.version)
+    return db.execute(stmt).scalar_one()
+
+
+def resync_version(db, project_id: int) -> int:
+    version = (
+        db.query(ProjectVersion.resync_version)
+        .filter(ProjectVersion.project_id == project_id)
+        .scalar()
+    )
+    return version or 0
+
+
+def record_tombstones(db, project_id: int, ticket_ids: list[int], version: int):
+    """
+    Mark tickets as deleted at ``version`` (one upsert for any number).
+    """
+    stmt = dialect_insert(db, TicketTombstone).values([
+        {"ticket_id": ticket_id, "project_id": project_id, "version": version}
+        for ticket_id in ticket_ids
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["ticket_id"],
+        set_={
+            "project_id": stmt.excluded.project_id,
+            "version": stmt.excluded.version,
+            "deleted_at": stmt.excluded.deleted_at,
+        },
+    )
+    db.execute(stmt)
+
+
+def project_version(db, project_id: int) -> int:
+    version = (
+        db.query(ProjectVersion.version)
+        .filter(ProjectVersion.project_id == project_id)
+        .scalar()
+    )
+    return version or 0
+
+
+def ticket_project_version(db, ticket_id: int) -> tuple[int | None, int]:
+    """
+    (project_id, version) for the project a ticket belongs to, in one query.
+    """
+    row = (
+        db.query(Ticket.project_id, ProjectVersion.version)
+        .outerjoin(ProjectVersion, ProjectVersion.project_id == Ticket.project_id)
+        .filter(Ticket.id == ticket_id)
+        .first()
+    )
+    if row is None:
+        return None, 0
+    return row[0], row[1] or 0
+
+
+def make_etag(request: Request, *parts) -> str:
+    """
+    Weak ETag over the change token(s) plus the query string, since
+    filters and cursors change the payload too.
+    """
+    raw = "|".join([request.url.path, request.url.query, *map(str, parts)])
+    return 'W/"' + hashlib.sha1(raw.encode()).hexdigest()[:20] + '"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Response | None:
+    """
+    Return a 304 if the client already has this version; otherwise set
+    the ETag on the outgoing response and return None.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def prune_tombstones(db, older_than) -> int:
+    """
+    Drop delete tombstones older than ``older_than`` (a datetime) and
+    record per project how far back delta sync can still answer (older
+    sync tokens get a 410). Run on a schedule by scripts/prune_tombstones.py.
+    Returns how many were dropped.
+    """
+    horizons = (
+        db.query(TicketTombstone.project_id, func.max(TicketTombstone.version))
+        .filter(TicketTombstone.deleted_at < older_than)
+        .group_by(TicketTombstone.project_id)
+        .all()
+    )
+    for project_id, version in horizons:
+        db.query(ProjectVersion).filter(
+            ProjectVersion.project_id == project_id,
+            ProjectVersion.pruned_version < version,
+        ).update({"pruned_version": version}, synchronize_session=False)
+
+    return db.query(TicketTombstone).filter(
+        TicketTombstone.deleted_at < older_than
+    ).delete(synchronize_session=False)
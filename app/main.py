@@ -1,11 +1,29 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
-print("🚀 FASTAPI MAIN APP LOADED 🚀")
+from app.routes import (
+    auth, projects, bulk, tickets, search, events, imports, metrics, comment, notifications
+)
+from app.core.activity import activity_writer
+from app.core.jobs import job_queue
+from app.core.metrics import timing_middleware
+
 
-from app.routes import auth, projects, tickets
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Handlers are registered by the route modules imported above
+    job_queue.start()
+    yield
+    # Let running side-effect jobs finish; queued ones wait in the table
+    await run_in_threadpool(job_queue.stop)
+    # Write out buffered ticket activity before the worker exits
+    await run_in_threadpool(activity_writer.close)
 
-app = FastAPI(title="Bug Tracker API")
+
+app = FastAPI(title="Bug Tracker API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -16,14 +34,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+# Per-request timing, SQL count and pool wait -> /metrics + Server-Timing
+app.middleware("http")(timing_middleware)
+
 app.include_router(auth.router)
 app.include_router(projects.router)
+app.include_router(bulk.router)  # before tickets: /tickets/{ticket_id} would shadow it
 app.include_router(tickets.router)
-from app.routes import comment
-
+app.include_router(search.router)
+app.include_router(events.router)
+app.include_router(imports.router)
+app.include_router(metrics.router)
 app.include_router(comment.router)
+app.include_router(notifications.router)
 
 
 @app.get("/")
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String
+from app.core.database import Base
+
+class AnalyticsWatermark(Base):
+    """
+    Last ticket_events id each analytics rollup has consumed.
+    """
+    __tablename__ = "analytics_watermarks"
+
+    name = Column(String(64), primary_key=True)
+    last_event_id = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, Text, ForeignKey, DateTime, Index
+from app.core.database import Base
+from app.core.search import search_vector
+
+class ArchivedComment(Base):
+    """
+    A comment archived together with its ticket (see ArchivedTicket).
+    """
+    __tablename__ = "archived_comments"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    content = Column(Text, nullable=False)
+    created_at = Column(DateTime)
+
+    ticket_id = Column(Integer, ForeignKey("archived_tickets.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"))
+    # Always within the same ticket, so archived and restored together
+    parent_id = Column(Integer, nullable=True)
+
+    __table_args__ = (
+        Index("ix_archived_comments_ticket_created", "ticket_id", "created_at"),
+        # Full-text search (Postgres only, maintained by the database)
+        Index(
+            "ix_archived_comments_search",
+            search_vector(content),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
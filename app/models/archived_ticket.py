@@ -0,0 +1,46 @@
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, DateTime, Index
+from app.core.database import Base
+from app.core.search import search_vector
+from app.models.ticket import TicketPriority, TicketStatus, TicketType, utcnow
+
+class ArchivedTicket(Base):
+    """
+    A done ticket moved out of ``tickets`` by app.core.archive, with the
+    same columns and id, so the board's tables and indexes only hold
+    the working set. Read with ``include_archived``, moved back by
+    restore.
+    """
+    __tablename__ = "archived_tickets"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+
+    title = Column(String(255), nullable=False)
+    description = Column(Text)
+    status = Column(Enum(TicketStatus, name="ticket_status_enum"), nullable=False)
+    priority = Column(Enum(TicketPriority, name="ticket_priority_enum"), nullable=False)
+    type = Column(Enum(TicketType, name="ticket_type_enum"), nullable=False)
+
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    reporter_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+
+    rank = Column(
+        String(64).with_variant(String(64, collation="C"), "postgresql"),
+        nullable=False
+    )
+    version = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    archived_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+
+    __table_args__ = (
+        # include_archived pages, in the board's sort orders
+        Index("ix_archived_tickets_project_created", "project_id", "created_at", "id"),
+        Index("ix_archived_tickets_project_updated", "project_id", "updated_at", "id"),
+        # Full-text search (Postgres only, maintained by the database)
+        Index(
+            "ix_archived_tickets_search",
+            search_vector(title, description),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
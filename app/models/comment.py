@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.database import Base
+from app.core.search import search_vector
 
 class Comment(Base):
     __tablename__ = "comments"
@@ -17,3 +18,18 @@ class Comment(Base):
     ticket = relationship("Ticket", back_populates="comments")
     user = relationship("User")
     replies = relationship("Comment")
+
+    __table_args__ = (
+        # Thread loading: roots (parent_id IS NULL) and children by parent
+        Index("ix_comments_ticket_parent_created", "ticket_id", "parent_id", "created_at"),
+        # A ticket's comments in order (flat list)
+        Index("ix_comments_ticket_created", "ticket_id", "created_at", "id"),
+        # Replies to a comment, checked when it is deleted
+        Index("ix_comments_parent", "parent_id"),
+        # Full-text search (Postgres only, maintained by the database)
+        Index(
+            "ix_comments_search",
+            search_vector(content),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
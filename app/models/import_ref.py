@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from app.core.database import Base
+
+class ImportRef(Base):
+    """
+    The id an imported ticket or comment was given, by the ``ref`` it had
+    in the source tracker. Written in the same transaction as the rows,
+    so later chunks, resumed imports and the comment import that follows
+    a ticket import resolve refs to committed rows only.
+    """
+    __tablename__ = "import_refs"
+
+    project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
+    kind = Column(String(16), primary_key=True)  # "ticket" / "comment"
+    ref = Column(String, primary_key=True)
+    target_id = Column(Integer, nullable=False)
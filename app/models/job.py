@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index
+from app.core.database import Base
+from app.models.ticket import utcnow
+
+class Job(Base):
+    """
+    A queued side effect, run by app.core.jobs. Deleted once it succeeds;
+    kept with status "failed" when it runs out of attempts.
+    """
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(64), nullable=False)
+    payload = Column(JSON, nullable=False)
+    status = Column(String(16), default="queued", nullable=False)  # queued / running / failed
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, nullable=False)
+    # Due time while queued, lease expiry while running, NULL once failed
+    run_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    # At most one queued job per key; released when a worker claims it
+    dedup_key = Column(String(255), nullable=True)
+    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+
+    __table_args__ = (
+        # Workers take the earliest due job
+        Index("ix_jobs_run_at", "run_at"),
+        Index("ux_jobs_dedup_key", "dedup_key", unique=True),
+    )
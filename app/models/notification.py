@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index
+from app.core.database import Base
+from app.models.ticket import utcnow
+
+class Notification(Base):
+    """
+    Something a user should know about (assigned a ticket, mentioned in a
+    comment). Created by background jobs, read from GET /notifications.
+    """
+    __tablename__ = "notifications"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    # No FK on the ticket: it may be archived while the notification stays
+    ticket_id = Column(Integer, nullable=True)
+    actor_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    kind = Column(String(32), nullable=False)  # assigned / mentioned
+    message = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    read_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # A user's notifications, newest first
+        Index("ix_notifications_user_created", "user_id", "created_at", "id"),
+        # Cleanup when a ticket is deleted
+        Index("ix_notifications_ticket", "ticket_id"),
+    )
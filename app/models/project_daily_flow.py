@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, Date, ForeignKey
+from app.core.database import Base
+
+class ProjectDailyFlow(Base):
+    """
+    Daily status transitions per project, rolled up from ticket_events
+    by app.core.analytics: (project 3, 2024-05-02, "done") -> 7 entered,
+    1 exited. The running sum of entered - exited is the number of
+    tickets in that status at the end of the day.
+    """
+    __tablename__ = "project_daily_flow"
+
+    project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    status = Column(String(32), primary_key=True)
+    entered = Column(Integer, nullable=False, default=0)
+    exited = Column(Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index
 from app.core.database import Base
 
 class ProjectMember(Base):
@@ -7,3 +7,10 @@ class ProjectMember(Base):
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     project_id = Column(Integer, ForeignKey("projects.id"))
+
+    __table_args__ = (
+        # One row per (user, project); also serves "projects of user" lookups
+        Index("ux_project_members_user_project", "user_id", "project_id", unique=True),
+        # Member lists by project
+        Index("ix_project_members_project", "project_id"),
+    )
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from app.core.database import Base
+
+class ProjectTicketCount(Base):
+    """
+    Incrementally maintained ticket counters per project, e.g.
+    (project 3, "status", "done") -> 41. Written in the same transaction
+    as the ticket change so the dashboard never has to scan tickets.
+    """
+    __tablename__ = "project_ticket_counts"
+
+    project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
+    dimension = Column(String(32), primary_key=True)
+    value = Column(String(64), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
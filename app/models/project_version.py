@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, ForeignKey
+from app.core.database import Base
+
+class ProjectVersion(Base):
+    """
+    Change counter per project, bumped in the same transaction as every
+    write to its tickets, comments or members. Reads use it as an ETag.
+    """
+    __tablename__ = "project_versions"
+
+    project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    # Tombstones at or below this version have been pruned; delta-sync
+    # clients older than it must reload the project.
+    pruned_version = Column(Integer, nullable=False, default=0, server_default="0")
+    # Last version written in bulk outside the request path (archival,
+    # imports): workers whose caches or event streams predate it catch up.
+    resync_version = Column(Integer, nullable=False, default=0, server_default="0")
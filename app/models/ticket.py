@@ -1,9 +1,15 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, DateTime, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
+from datetime import datetime, timezone
 from app.core.database import Base
+from app.core.search import search_vector
 import enum
 
+
+def utcnow():
+    return datetime.now(timezone.utc)
+
 class TicketStatus(str, enum.Enum):
     todo = "todo"
     in_progress = "in_progress"
@@ -48,11 +54,11 @@ class Ticket(Base):
         nullable=False
     )
 
+    # Every board index leads with it, so no index of its own
     project_id = Column(
         Integer,
         ForeignKey("projects.id"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     reporter_id = Column(
@@ -68,12 +74,55 @@ class Ticket(Base):
         index=True
     )
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Card order within its board column (see app.core.ranking). Byte
+    # order ("C" collation) on Postgres so it sorts like in Python.
+    rank = Column(
+        String(64).with_variant(String(64, collation="C"), "postgresql"),
+        default="i",
+        server_default="i",
+        nullable=False
+    )
+
+    # Project version (see ProjectVersion) of the last write, for delta sync
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Timestamps are set by the app (server_default only covers raw SQL
+    # inserts) so pagination cursors round-trip exactly on every backend.
+    created_at = Column(
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        onupdate=utcnow,
+        nullable=False
+    )
 
     project = relationship("Project", back_populates="tickets")
     reporter = relationship("User", foreign_keys=[reporter_id])
     assignee = relationship("User", foreign_keys=[assignee_id])
     comments = relationship("Comment", back_populates="ticket")
 
-
+    # Keyset pagination indexes (match the ORDER BY of the board queries)
+    __table_args__ = (
+        Index("ix_tickets_project_created", "project_id", "created_at", "id"),
+        Index("ix_tickets_project_updated", "project_id", "updated_at", "id"),
+        Index("ix_tickets_project_version", "project_id", "version"),
+        # Board columns in card order
+        Index("ix_tickets_project_status_rank", "project_id", "status", "rank"),
+        # Board filters (?status= / ?priority= / ?assignee_id=)
+        Index("ix_tickets_project_status_priority", "project_id", "status", "priority"),
+        Index("ix_tickets_project_assignee", "project_id", "assignee_id"),
+        # Foreign key lookups when a user is deleted or merged
+        Index("ix_tickets_reporter", "reporter_id"),
+        # Full-text search (Postgres only, maintained by the database)
+        Index(
+            "ix_tickets_search",
+            search_vector(title, description),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
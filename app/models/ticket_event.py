@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index, func
+from app.core.database import Base
+from app.models.ticket import utcnow
+
+class TicketEvent(Base):
+    """
+    Append-only ticket history: one row per changed field, or one per
+    create / delete / comment. Written in batches by app.core.activity.
+    """
+    __tablename__ = "ticket_events"
+
+    id = Column(Integer, primary_key=True)
+    # No FK on the ticket: its history outlives it
+    ticket_id = Column(Integer, nullable=False)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    actor_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    action = Column(String(32), nullable=False)
+    field = Column(String(32), nullable=True)
+    old_value = Column(Text, nullable=True)
+    new_value = Column(Text, nullable=True)
+    # When it happened, not when the batch was written
+    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    # When the batch was written (its transaction's start, by the
+    # database clock); NULL for events from before it was added
+    recorded_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=True)
+
+    __table_args__ = (
+        Index("ix_ticket_events_ticket_created", "ticket_id", "created_at", "id"),
+    )
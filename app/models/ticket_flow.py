@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
+from app.core.database import Base
+
+class TicketFlow(Base):
+    """
+    Where each ticket is in its workflow, as replayed from ticket_events
+    by app.core.analytics. Completed tickets carry their lead time
+    (created -> done) and cycle time (first started -> done).
+    """
+    __tablename__ = "ticket_flow"
+
+    ticket_id = Column(Integer, primary_key=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    status = Column(String(32), nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    done_at = Column(DateTime(timezone=True), nullable=True)
+    lead_seconds = Column(Integer, nullable=True)
+    cycle_seconds = Column(Integer, nullable=True)
+
+    __table_args__ = (
+        # Completions in a date range, for the percentile window
+        Index("ix_ticket_flow_project_done", "project_id", "done_at"),
+    )
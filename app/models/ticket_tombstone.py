@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
+from app.core.database import Base
+from app.models.ticket import utcnow
+
+class TicketTombstone(Base):
+    """
+    Left behind by delete_ticket so delta-sync clients learn about deletes.
+    """
+    __tablename__ = "ticket_tombstones"
+
+    ticket_id = Column(Integer, primary_key=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    version = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_ticket_tombstones_project_version", "project_id", "version"),
+    )
@@ -1,44 +1,72 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.models.user import User
-from app.schemas.user import UserCreate
-from app.core.security import hash_password
+from app.schemas.user import UserCreate, UserResponse
+from app.core.security import hash_password, password_hasher, get_current_user
+from app.core.metrics import TimedRoute
+
+router = APIRouter(prefix="/auth", tags=["Auth"], route_class=TimedRoute)
+
+# signup/login are async so that, while bcrypt runs (or queues) on the
+# dedicated password_hasher pool, they don't hold a request thread.
+# Blocking DB work is pushed to the threadpool explicitly.
+
+
+def _find_user(db: Session, email: str):
+    return db.query(User).filter(User.email == email).first()
+
+
+def _save(db: Session, obj=None):
+    if obj is not None:
+        db.add(obj)
+    db.commit()
 
-router = APIRouter(prefix="/auth", tags=["Auth"])
 
 @router.post("/signup")
-def signup(user: UserCreate, db: Session = Depends(get_db)):
-    existing_user = db.query(User).filter(User.email == user.email).first()
+async def signup(user: UserCreate, db: Session = Depends(get_db)):
+    existing_user = await run_in_threadpool(_find_user, db, user.email)
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
 
     new_user = User(
         email=user.email,
-        password=hash_password(user.password)
+        password=await password_hasher.run(hash_password, user.password)
     )
 
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await run_in_threadpool(_save, db, new_user)
 
     return {"message": "User created successfully"}
 
-from app.core.security import verify_password, create_access_token
+from app.core.security import verify_and_update_password, create_access_token
 from app.schemas.user import UserLogin
 
 @router.post("/login")
-def login(user: UserLogin, db: Session = Depends(get_db)):
-    db_user = db.query(User).filter(User.email == user.email).first()
+async def login(user: UserLogin, db: Session = Depends(get_db)):
+    db_user = await run_in_threadpool(_find_user, db, user.email)
 
-    if not db_user or not verify_password(user.password, db_user.password):
+    if not db_user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    token = create_access_token({
+    valid, new_hash = await password_hasher.run(
+        verify_and_update_password, user.password, db_user.password
+    )
+    if not valid:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    claims = {
         "sub": str(db_user.id),
         "email": db_user.email,
         "role": db_user.role
-    })
+    }
+
+    # Cost settings changed since this hash was made: store the new one
+    if new_hash:
+        db_user.password = new_hash
+        await run_in_threadpool(_save, db)
+
+    token = create_access_token(claims)
 
     return {
         "access_token": token,
@@ -46,9 +74,6 @@ def login(user: UserLogin, db: Session = Depends(get_db)):
     }
 
 
-from app.core.security import get_current_user
-from app.schemas.user import UserResponse
-
 @router.get("/me", response_model=UserResponse)
 def get_me(current_user: User = Depends(get_current_user)):
     return current_user
@@ -0,0 +1,343 @@
+from collections import Counter, defaultdict
+from types import SimpleNamespace
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import insert, update, delete
+from sqlalchemy.orm import Session
+
+from app.core.activity import activity_writer
+from app.core.database import get_db
+from app.core.security import get_current_user
+from app.core.permissions import (
+    project_access_error,
+    require_project_member,
+    ticket_update_error,
+    ticket_assign_error,
+)
+from app.core.ranking import last_rank, ranks_after
+from app.core.search import search_index
+from app.core.versioning import bump_project_version, record_tombstones
+from app.core import events, stats
+from app.core.metrics import TimedRoute
+from app.models.comment import Comment
+from app.models.project import Project
+from app.models.ticket import Ticket, TicketStatus
+from app.models.user import User
+from app.routes.tickets import (
+    TICKET_LOAD_OPTIONS,
+    enqueue_assignment,
+    enqueue_cleanup,
+    publish_ticket,
+)
+from app.schemas.ticket import (
+    BulkTicketCreate,
+    BulkTicketUpdate,
+    BulkTicketMove,
+    BulkTicketDelete,
+    BulkResult,
+    TicketUpdate,
+)
+
+# Same RBAC as the single-ticket routes, but every accepted item is
+# written with one set-based statement inside a single transaction.
+router = APIRouter(
+    prefix="/tickets/bulk",
+    tags=["Tickets"],
+    route_class=TimedRoute
+)
+
+# The counted fields (see app.core.stats) plus the rest of what a bulk
+# update can change, for the activity log's old values
+COUNTED_COLUMNS = (
+    Ticket.id,
+    Ticket.project_id,
+    Ticket.status,
+    Ticket.priority,
+    Ticket.type,
+    Ticket.assignee_id,
+    Ticket.title,
+    Ticket.description,
+)
+
+
+def _report(results: list[dict]) -> dict:
+    succeeded = sum(1 for r in results if r["ok"])
+    return {
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results,
+    }
+
+
+def _load_for_update(db: Session, current_user, ids: list[int]) -> tuple[dict, dict]:
+    """
+    Bump (and so lock) the version of each project among ``ids`` that the
+    user may work in, in project id order, and only then read the rows:
+    counter diffs start from what concurrent writers committed. Returns
+    (row by ticket id, new version by project id).
+    """
+    project_ids = sorted(
+        project_id for (project_id,) in
+        db.query(Ticket.project_id).filter(Ticket.id.in_(ids)).distinct()
+        if project_access_error(db, current_user, project_id) is None
+    )
+    versions = {
+        project_id: bump_project_version(db, project_id) for project_id in project_ids
+    }
+    rows = {
+        row.id: row
+        for row in db.query(*COUNTED_COLUMNS).filter(Ticket.id.in_(ids))
+    }
+    return rows, versions
+
+
+def _after_write(db: Session, ticket_ids: list[int], event_type: str):
+    """
+    Reload the written tickets in one query, then refresh the search
+    index and notify live boards.
+    """
+    tickets = (
+        db.query(Ticket)
+        .options(*TICKET_LOAD_OPTIONS)
+        .filter(Ticket.id.in_(ticket_ids))
+        .all()
+    )
+    for ticket in tickets:
+        search_index.index_ticket(ticket)
+        publish_ticket(ticket, event_type)
+
+
+# --------------------------------------------------------
+# ➕ BULK CREATE
+# --------------------------------------------------------
+@router.post("/projects/{project_id}", response_model=BulkResult)
+def bulk_create_tickets(
+    project_id: int,
+    data: BulkTicketCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_project_member)
+):
+    project = db.query(Project.id).filter(Project.id == project_id).first()
+
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    results = [None] * len(data.items)
+    rows = []
+    positions = []
+    for i, item in enumerate(data.items):
+        error = ticket_assign_error(current_user, item.assignee_id)
+        if error:
+            results[i] = {"index": i, "ok": False, "error": error}
+            continue
+        rows.append({
+            "title": item.title,
+            "description": item.description,
+            "priority": item.priority,
+            "type": item.type,
+            "status": TicketStatus.todo,
+            "project_id": project_id,
+            "reporter_id": current_user.id,
+            "assignee_id": item.assignee_id,
+        })
+        positions.append(i)
+
+    if rows:
+        version = bump_project_version(db, project_id)
+        ranks = ranks_after(last_rank(db, project_id, TicketStatus.todo), len(rows))
+        for row, rank in zip(rows, ranks):
+            row["version"] = version
+            row["rank"] = rank
+
+        # INSERT ... RETURNING id in batched multi-row statements on
+        # Postgres (SQLite can't order RETURNING, so it goes row by row)
+        ids = db.execute(
+            insert(Ticket).returning(Ticket.id, sort_by_parameter_order=True),
+            rows
+        ).scalars().all()
+
+        deltas = Counter()
+        for row in rows:
+            deltas.update(stats.ticket_counts(SimpleNamespace(**row)))
+        stats.apply_deltas(db, project_id, deltas)
+        for row, ticket_id in zip(rows, ids):
+            enqueue_assignment(db, ticket_id, row["assignee_id"], current_user.id)
+
+        db.commit()
+
+        for i, ticket_id in zip(positions, ids):
+            results[i] = {"index": i, "id": ticket_id, "ok": True}
+            activity_writer.record(ticket_id, project_id, current_user.id, "created")
+        _after_write(db, ids, "ticket.created")
+
+    return _report(results)
+
+
+def _bulk_update(db: Session, current_user, ids: list[int], changes: TicketUpdate, action: str):
+    values = changes.model_dump(exclude_unset=True)
+    if not values:
+        raise HTTPException(status_code=400, detail="No changes given")
+
+    current, versions = _load_for_update(db, current_user, ids)
+
+    results = []
+    accepted = defaultdict(list)  # project_id -> ticket ids
+    seen = set()
+    deltas = defaultdict(Counter)
+    for i, ticket_id in enumerate(ids):
+        row = current.get(ticket_id)
+        if row is None:
+            results.append({"index": i, "id": ticket_id, "ok": False, "error": "Ticket not found"})
+            continue
+        error = (
+            project_access_error(db, current_user, row.project_id)
+            or ticket_update_error(
+                current_user, row.assignee_id, changes.assignee_id is not None
+            )
+        )
+        if error:
+            results.append({"index": i, "id": ticket_id, "ok": False, "error": error})
+            continue
+        results.append({"index": i, "id": ticket_id, "ok": True})
+        if ticket_id in seen:
+            continue
+        seen.add(ticket_id)
+
+        after = SimpleNamespace(**{**row._asdict(), **values})
+        deltas[row.project_id].update(stats.ticket_counts(after))
+        deltas[row.project_id].subtract(stats.ticket_counts(row))
+        accepted[row.project_id].append(ticket_id)
+
+    if not accepted:
+        db.rollback()  # nothing to write: don't bump the versions locked above
+        return _report(results)
+
+    # One UPDATE ... WHERE id IN (...) per project, at that project's version
+    for project_id, ticket_ids in accepted.items():
+        version = versions[project_id]
+        moved = [
+            ticket_id for ticket_id in ticket_ids
+            if "status" in values and current[ticket_id].status != values["status"]
+        ]
+        ranks = []
+        if moved:
+            # Before the UPDATE, so the moved tickets' old ranks don't count
+            ranks = ranks_after(last_rank(db, project_id, values["status"]), len(moved))
+        db.execute(
+            update(Ticket)
+            .where(Ticket.id.in_(ticket_ids))
+            .values(**values, version=version)
+        )
+        if moved:
+            # Tickets changing column join the bottom of the new one, in
+            # request order (ORM bulk UPDATE by primary key: one executemany)
+            db.execute(update(Ticket), [
+                {"id": ticket_id, "rank": rank} for ticket_id, rank in zip(moved, ranks)
+            ])
+        stats.apply_deltas(db, project_id, deltas[project_id])
+        if "assignee_id" in values:
+            for ticket_id in ticket_ids:
+                if current[ticket_id].assignee_id != values["assignee_id"]:
+                    enqueue_assignment(db, ticket_id, values["assignee_id"], current_user.id)
+    db.commit()
+
+    written = [ticket_id for ticket_ids in accepted.values() for ticket_id in ticket_ids]
+    for ticket_id in written:
+        row = current[ticket_id]
+        activity_writer.record_changes(
+            ticket_id, row.project_id, current_user.id, action,
+            {field: getattr(row, field) for field in values}, values,
+        )
+    if written:
+        _after_write(db, written, "ticket.updated")
+
+    return _report(results)
+
+
+# --------------------------------------------------------
+# ✏️ BULK UPDATE (SAME CHANGES TO MANY TICKETS)
+# --------------------------------------------------------
+@router.post("/update", response_model=BulkResult)
+def bulk_update_tickets(
+    data: BulkTicketUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    return _bulk_update(db, current_user, data.ids, data.changes, "updated")
+
+
+# --------------------------------------------------------
+# 🔀 BULK MOVE (KANBAN COLUMN CHANGE)
+# --------------------------------------------------------
+@router.post("/move", response_model=BulkResult)
+def bulk_move_tickets(
+    data: BulkTicketMove,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    return _bulk_update(db, current_user, data.ids, TicketUpdate(status=data.status), "moved")
+
+
+# --------------------------------------------------------
+# 🗑 BULK DELETE (ADMIN ONLY)
+# --------------------------------------------------------
+@router.post("/delete", response_model=BulkResult)
+def bulk_delete_tickets(
+    data: BulkTicketDelete,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin only")
+
+    current, versions = _load_for_update(db, current_user, data.ids)
+
+    results = []
+    accepted = defaultdict(list)
+    seen = set()
+    for i, ticket_id in enumerate(data.ids):
+        row = current.get(ticket_id)
+        if row is None:
+            results.append({"index": i, "id": ticket_id, "ok": False, "error": "Ticket not found"})
+            continue
+        results.append({"index": i, "id": ticket_id, "ok": True})
+        if ticket_id not in seen:
+            seen.add(ticket_id)
+            accepted[row.project_id].append(ticket_id)
+
+    if not accepted:
+        db.rollback()
+        return _report(results)
+
+    for project_id, ticket_ids in accepted.items():
+        version = versions[project_id]
+
+        deltas = Counter()
+        for ticket_id in ticket_ids:
+            deltas.subtract(stats.ticket_counts(current[ticket_id]))
+        stats.apply_deltas(db, project_id, deltas)
+
+        record_tombstones(db, project_id, ticket_ids, version)
+
+        # Detach comments like the single delete does, then drop the rows
+        db.execute(
+            update(Comment)
+            .where(Comment.ticket_id.in_(ticket_ids))
+            .values(ticket_id=None)
+        )
+        db.execute(delete(Ticket).where(Ticket.id.in_(ticket_ids)))
+    deleted = [ticket_id for ticket_ids in accepted.values() for ticket_id in ticket_ids]
+    if deleted:
+        enqueue_cleanup(db, deleted)
+    db.commit()
+
+    for project_id, ticket_ids in accepted.items():
+        for ticket_id in ticket_ids:
+            search_index.remove_ticket(ticket_id)
+            events.publish(project_id, "ticket.deleted", {"id": ticket_id})
+            activity_writer.record(
+                ticket_id, project_id, current_user.id, "deleted",
+                "title", current[ticket_id].title, None
+            )
+
+    return _report(results)
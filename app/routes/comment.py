@@ -1,12 +1,79 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func, literal, select, tuple_
 from sqlalchemy.orm import Session
+from typing import Optional
+import re
 from app.core.database import get_db
+from app.models.archived_comment import ArchivedComment
+from app.models.archived_ticket import ArchivedTicket
 from app.models.comment import Comment
-from app.schemas.comment import CommentCreate, CommentResponse
+from app.models.notification import Notification
+from app.schemas.comment import CommentCreate, CommentResponse, CommentTree
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, encode_cursor, decode_cursor
+from app.core.activity import activity_writer
+from app.core.jobs import job_queue
 from app.core.security import get_current_user
+from app.core.permissions import check_project_access, project_access_error
+from app.core.search import search_index
+from app.core import events
+from app.core.versioning import (
+    bump_project_version,
+    ticket_project_version,
+    make_etag,
+    not_modified,
+)
+from app.core.metrics import TimedRoute
+from app.models.ticket import Ticket
 from app.models.user import User
 
-router = APIRouter(prefix="/comments", tags=["Comments"])
+router = APIRouter(prefix="/comments", tags=["Comments"], route_class=TimedRoute)
+
+
+def get_ticket_project_id(db: Session, ticket_id: int) -> int:
+    project_id = db.query(Ticket.project_id).filter(Ticket.id == ticket_id).scalar()
+    if project_id is None:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    return project_id
+
+
+# "@alice@example.com": users are known by their email
+MENTION = re.compile(r"(?<![\w@])@([\w.+-]+@[\w-]+(?:\.[\w-]+)+)")
+
+
+@job_queue.handler("comment.mentions")
+def notify_mentions(db: Session, payload: dict):
+    comment = (
+        db.query(
+            Comment.content,
+            Comment.user_id,
+            Comment.ticket_id,
+            Ticket.project_id,
+            Ticket.title,
+        )
+        .join(Ticket, Ticket.id == Comment.ticket_id)
+        .filter(Comment.id == payload["comment_id"])
+        .first()
+    )
+    if comment is None:
+        return  # deleted since, or its ticket was
+
+    emails = {email.lower() for email in MENTION.findall(comment.content)}
+    mentioned = db.query(User.id, User.role).filter(
+        func.lower(User.email).in_(emails),
+        User.id != comment.user_id
+    ).all()
+    for user in mentioned:
+        # Only people who can open the ticket
+        if project_access_error(db, user, comment.project_id):
+            continue
+        db.add(Notification(
+            user_id=user.id,
+            project_id=comment.project_id,
+            ticket_id=comment.ticket_id,
+            actor_id=comment.user_id,
+            kind="mentioned",
+            message=f"You were mentioned on #{comment.ticket_id}: {comment.title}",
+        ))
 
 
 # 🔹 Create Comment
@@ -17,6 +84,9 @@ def create_comment(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
+    project_id = get_ticket_project_id(db, ticket_id)
+    check_project_access(db, current_user, project_id)
+
     db_comment = Comment(
         content=comment.content,
         ticket_id=ticket_id,
@@ -25,9 +95,22 @@ def create_comment(
     )
 
     db.add(db_comment)
+    bump_project_version(db, project_id)
+    if MENTION.search(comment.content):
+        db.flush()
+        job_queue.enqueue(db, "comment.mentions", {"comment_id": db_comment.id})
     db.commit()
     db.refresh(db_comment)
 
+    activity_writer.record(
+        ticket_id, project_id, current_user.id, "commented", "comment", None, db_comment.id
+    )
+    search_index.index_comment(db_comment)
+    events.publish(
+        project_id, "comment.created",
+        CommentResponse.model_validate(db_comment).model_dump(mode="json")
+    )
+
     return db_comment
 
 
@@ -35,11 +118,123 @@ def create_comment(
 @router.get("/tickets/{ticket_id}", response_model=list[CommentResponse])
 def get_comments(
     ticket_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    include_archived: bool = Query(False),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
 ):
-    return db.query(Comment).filter(
-        Comment.ticket_id == ticket_id
-    ).all()
+    project_id, version = ticket_project_version(db, ticket_id)
+    if project_id is None and include_archived:
+        # Archived along with its ticket
+        project_id = (
+            db.query(ArchivedTicket.project_id)
+            .filter(ArchivedTicket.id == ticket_id)
+            .scalar()
+        )
+        if project_id is not None:
+            check_project_access(db, current_user, project_id)
+            return (
+                db.query(ArchivedComment)
+                .filter(ArchivedComment.ticket_id == ticket_id)
+                .order_by(ArchivedComment.created_at, ArchivedComment.id)
+                .all()
+            )
+    if project_id is None:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    check_project_access(db, current_user, project_id)
+
+    cached = not_modified(request, response, make_etag(request, version))
+    if cached is not None:
+        return cached
+
+    return (
+        db.query(Comment)
+        .filter(Comment.ticket_id == ticket_id)
+        .order_by(Comment.created_at, Comment.id)
+        .all()
+    )
+
+
+# 🔹 Get Comment Tree (threaded, top-level threads paginated)
+@router.get("/tickets/{ticket_id}/tree", response_model=CommentTree)
+def get_comment_tree(
+    ticket_id: int,
+    request: Request,
+    response: Response,
+    max_depth: int = Query(10, ge=0, le=50),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    project_id, version = ticket_project_version(db, ticket_id)
+    if project_id is None:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    check_project_access(db, current_user, project_id)
+
+    cached = not_modified(request, response, make_etag(request, version))
+    if cached is not None:
+        return cached
+
+    # 1️⃣ One page of top-level comments, oldest first
+    roots = db.query(Comment.id, Comment.created_at).filter(
+        Comment.ticket_id == ticket_id,
+        Comment.parent_id.is_(None)
+    )
+    if cursor:
+        last_created, last_id = decode_cursor(cursor)
+        roots = roots.filter(
+            tuple_(Comment.created_at, Comment.id) > (last_created, last_id)
+        )
+    roots = roots.order_by(Comment.created_at, Comment.id).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(roots) > limit:
+        roots = roots[:limit]
+        next_cursor = encode_cursor(roots[-1].created_at, roots[-1].id)
+
+    if not roots:
+        return {"items": [], "next_cursor": None}
+
+    # 2️⃣ Whole threads under those roots in one recursive query. One level
+    # past max_depth is fetched only to flag nodes that have more replies.
+    tree = (
+        select(Comment.id, literal(0).label("depth"))
+        .where(Comment.id.in_([root.id for root in roots]))
+        .cte("tree", recursive=True)
+    )
+    tree = tree.union_all(
+        select(Comment.id, (tree.c.depth + 1).label("depth"))
+        .join(tree, Comment.parent_id == tree.c.id)
+        .where(Comment.ticket_id == ticket_id, tree.c.depth <= max_depth)
+    )
+    rows = (
+        db.query(Comment, tree.c.depth)
+        .join(tree, Comment.id == tree.c.id)
+        .order_by(Comment.created_at, Comment.id)
+        .all()
+    )
+
+    # 3️⃣ Assemble in a single pass over the rows
+    nodes = {}
+    for comment, depth in rows:
+        if depth > max_depth:
+            continue
+        node = CommentResponse.model_validate(comment).model_dump()
+        node.update(depth=depth, replies=[], has_more_replies=False)
+        nodes[comment.id] = node
+
+    items = []
+    for comment, depth in rows:
+        if depth > max_depth:
+            nodes[comment.parent_id]["has_more_replies"] = True
+        elif depth == 0:
+            items.append(nodes[comment.id])
+        else:
+            nodes[comment.parent_id]["replies"].append(nodes[comment.id])
+
+    return {"items": items, "next_cursor": next_cursor}
 
 
 # 🔹 Delete Comment (RBAC Protected)
@@ -56,6 +251,10 @@ def delete_comment(
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
 
+    ticket_id = comment.ticket_id
+    project_id = get_ticket_project_id(db, ticket_id)
+    check_project_access(db, current_user, project_id)
+
     # 🔐 ROLE-BASED PERMISSION
     if current_user.role == "admin":
         pass  # admin can delete any comment
@@ -69,6 +268,17 @@ def delete_comment(
         raise HTTPException(status_code=403, detail="Not allowed")
 
     db.delete(comment)
+    bump_project_version(db, project_id)
     db.commit()
 
+    activity_writer.record(
+        ticket_id, project_id, current_user.id, "comment_deleted", "comment", comment_id, None
+    )
+
+    search_index.remove_comment(comment_id, ticket_id)
+    events.publish(
+        project_id, "comment.deleted",
+        {"id": comment_id, "ticket_id": ticket_id}
+    )
+
     return {"message": "Comment deleted"}
@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+from fastapi import APIRouter, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from app.core import events
+from app.core.database import SessionLocal
+from app.core.security import principal_from_token
+from app.core.permissions import check_project_access
+from app.core.metrics import TimedRoute
+from app.core.versioning import resync_version
+
+router = APIRouter(prefix="/events", tags=["Events"], route_class=TimedRoute)
+
+HEARTBEAT_SECONDS = 15
+
+
+def _authenticate(token: str, project_id: int) -> int:
+    """
+    Check the token and membership; returns the project's resync version.
+    """
+    db = SessionLocal()
+    try:
+        principal = principal_from_token(token, db)
+        check_project_access(db, principal, project_id)
+        return resync_version(db, project_id)
+    finally:
+        db.close()
+
+
+def _resync_version(project_id: int) -> int:
+    with SessionLocal() as db:
+        return resync_version(db, project_id)
+
+
+# --------------------------------------------------------
+# 📡 PROJECT EVENT STREAM (SERVER-SENT EVENTS)
+# --------------------------------------------------------
+# EventSource cannot set headers, so the JWT comes as ?token=.
+# Events: ticket.created / ticket.updated / ticket.deleted,
+# comment.created / comment.deleted, and resync when the client
+# fell too far behind and should refetch. Bulk changes from other
+# processes (archival, imports) publish nowhere this worker hears, so
+# every HEARTBEAT_SECONDS the stream also checks the project's resync
+# version and sends resync when it moved.
+@router.get("/projects/{project_id}")
+async def project_events(
+    project_id: int,
+    request: Request,
+    token: str = Query(...)
+):
+    resync = await run_in_threadpool(_authenticate, token, project_id)
+
+    subscriber = events.hub.subscribe(project_id)
+
+    async def stream():
+        try:
+            yield ": connected\n\n"
+            check_at = time.monotonic() + HEARTBEAT_SECONDS
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscriber.queue.get(), timeout=max(check_at - time.monotonic(), 0)
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    check_at = time.monotonic() + HEARTBEAT_SECONDS
+                    if await run_in_threadpool(_resync_version, project_id) > resync:
+                        event = {"type": "resync", "data": None}
+                    else:
+                        yield ": ping\n\n"
+                        continue
+
+                yield events.format_sse(event)
+                if event["type"] == "resync":
+                    break
+        finally:
+            events.hub.unsubscribe(project_id, subscriber)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
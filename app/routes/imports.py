@@ -0,0 +1,80 @@
+import io
+import tempfile
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.database import SessionLocal
+from app.core.importer import import_tickets, import_comments, read_rows
+from app.core.security import get_current_user
+from app.core.metrics import TimedRoute
+from app.models.project import Project
+from app.models.user import User
+from app.schemas.imports import ImportResult
+
+# Uploads are spooled to disk past this size instead of held in memory
+SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+router = APIRouter(prefix="/import", tags=["Import"], route_class=TimedRoute)
+
+
+async def _spool_body(request: Request):
+    upload = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    async for chunk in request.stream():
+        upload.write(chunk)
+    upload.seek(0)
+    return upload
+
+
+def _run(importer, project_id: int, user_id: int, upload, format: str, start: int):
+    with SessionLocal() as db, upload:
+        project = db.query(Project.id).filter(Project.id == project_id).first()
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        # Returned as is: a failed write still reports what was committed.
+        # The refs are also stored, so a resumed or later import finds them.
+        id_map = {}
+        stream = io.TextIOWrapper(upload, encoding="utf-8", newline="")
+        report = importer(
+            db, project_id, user_id, read_rows(stream, format), start=start, id_map=id_map
+        )
+        return {**report.as_dict(), "id_map": id_map}
+
+
+async def _import(importer, project_id, request, format, start, current_user):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin only")
+
+    upload = await _spool_body(request)
+    return await run_in_threadpool(
+        _run, importer, project_id, current_user.id, upload, format, start
+    )
+
+
+# --------------------------------------------------------
+# 📥 IMPORT TICKETS (NDJSON / CSV BODY, ADMIN ONLY)
+# --------------------------------------------------------
+@router.post("/projects/{project_id}/tickets", response_model=ImportResult)
+async def import_project_tickets(
+    project_id: int,
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    start: int = Query(0, ge=0),
+    current_user: User = Depends(get_current_user)
+):
+    return await _import(import_tickets, project_id, request, format, start, current_user)
+
+
+# --------------------------------------------------------
+# 📥 IMPORT COMMENTS (NDJSON / CSV BODY, ADMIN ONLY)
+# --------------------------------------------------------
+@router.post("/projects/{project_id}/comments", response_model=ImportResult)
+async def import_project_comments(
+    project_id: int,
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    start: int = Query(0, ge=0),
+    current_user: User = Depends(get_current_user)
+):
+    return await _import(import_comments, project_id, request, format, start, current_user)
@@ -0,0 +1,28 @@
+import secrets
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import settings
+from app.core.metrics import render_metrics
+
+router = APIRouter(tags=["Metrics"])
+
+
+# --------------------------------------------------------
+# 📈 PROMETHEUS METRICS
+# --------------------------------------------------------
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics(authorization: str | None = Header(None)):
+    # Shared secret for the scraper (Authorization: Bearer <token>);
+    # without one, only open if explicitly made public (development)
+    token = settings.metrics_token
+    if not token:
+        if not settings.metrics_public:
+            raise HTTPException(status_code=403, detail="METRICS_TOKEN is not set")
+    elif not secrets.compare_digest(authorization or "", f"Bearer {token}"):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+
+    return PlainTextResponse(
+        render_metrics(), media_type="text/plain; version=0.0.4"
+    )
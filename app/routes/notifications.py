@@ -0,0 +1,68 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.core.database import get_db, get_read_db, read
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, encode_cursor, decode_cursor
+from app.core.security import get_current_user
+from app.core.metrics import TimedRoute
+from app.models.notification import Notification
+from app.models.ticket import utcnow
+from app.models.user import User
+from app.schemas.notification import NotificationPage, NotificationResponse
+
+router = APIRouter(prefix="/notifications", tags=["Notifications"], route_class=TimedRoute)
+
+
+# 🔔 My Notifications (newest first, keyset paginated)
+# Created by background jobs shortly after the change that caused them.
+# Polled by every open client, so it runs on the async engine with
+# ASYNC_DB=true (see get_read_db).
+@router.get("/", response_model=NotificationPage)
+async def get_notifications(
+    unread: bool = Query(False),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    db=Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    query = select(Notification).where(Notification.user_id == current_user.id)
+    if unread:
+        query = query.where(Notification.read_at.is_(None))
+    if cursor:
+        last_created, last_id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(Notification.created_at, Notification.id) < (last_created, last_id)
+        )
+    query = query.order_by(Notification.created_at.desc(), Notification.id.desc()).limit(limit + 1)
+    rows = (await read(db, query)).scalars().all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return {"items": rows, "next_cursor": next_cursor}
+
+
+# ✅ Mark Notification Read
+@router.post("/{notification_id}/read", response_model=NotificationResponse)
+def mark_notification_read(
+    notification_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    notification = db.query(Notification).filter(
+        Notification.id == notification_id,
+        Notification.user_id == current_user.id
+    ).first()
+
+    if not notification:
+        raise HTTPException(status_code=404, detail="Notification not found")
+
+    if notification.read_at is None:
+        notification.read_at = utcnow()
+        db.commit()
+        db.refresh(notification)
+
+    return notification
@@ -1,13 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.models.project import Project
 from app.models.project_member import ProjectMember
-from app.schemas.project import ProjectCreate, ProjectResponse, AddMemberRequest
+from app.schemas.project import ProjectCreate, ProjectResponse, AddMemberRequest, ProjectStats
+from app.schemas.analytics import ProjectAnalytics
 from app.core.security import get_current_user
+from app.core.permissions import invalidate_memberships, require_project_member
 from app.models.user import User
+from app.schemas.user import UserResponse
+from app.core.stats import project_stats
+from app.core.analytics import project_analytics
+from app.core.versioning import bump_project_version, project_version, make_etag, not_modified
+from app.core.metrics import TimedRoute
+from app.models.project_version import ProjectVersion
 
-router = APIRouter(prefix="/projects", tags=["Projects"])
+router = APIRouter(prefix="/projects", tags=["Projects"], route_class=TimedRoute)
 
 
 # 🔐 CREATE PROJECT (ADMIN ONLY)
@@ -39,8 +47,11 @@ def create_project(
         user_id=current_user.id
     )
     db.add(member)
+    bump_project_version(db, new_project.id)
     db.commit()
 
+    invalidate_memberships(current_user.id)
+
     return new_project
 
 
@@ -81,17 +92,35 @@ def add_project_member(
     )
 
     db.add(member)
+    bump_project_version(db, project_id)
     db.commit()
 
+    invalidate_memberships(data.user_id)
+
     return {"message": "User added to project"}
 
 
 # 👀 GET MY PROJECTS (ONLY WHERE USER IS MEMBER)
 @router.get("/my", response_model=list[ProjectResponse])
 def get_my_projects(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
+    # The list changes when a membership or one of the projects changes
+    versions = (
+        db.query(ProjectMember.project_id, ProjectVersion.version)
+        .outerjoin(ProjectVersion, ProjectVersion.project_id == ProjectMember.project_id)
+        .filter(ProjectMember.user_id == current_user.id)
+        .order_by(ProjectMember.project_id)
+        .all()
+    )
+    etag = make_etag(request, current_user.id, [tuple(row) for row in versions])
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
     projects = (
         db.query(Project)
         .join(ProjectMember, Project.id == ProjectMember.project_id)
@@ -102,22 +131,63 @@ def get_my_projects(
     return projects
 
 # 👥 GET PROJECT MEMBERS
-@router.get("/{project_id}/members")
+@router.get("/{project_id}/members", response_model=list[UserResponse])
 def get_project_members(
     project_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_project_member)
 ):
     project = db.query(Project).filter(Project.id == project_id).first()
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
+    cached = not_modified(
+        request, response, make_etag(request, project_version(db, project_id))
+    )
+    if cached is not None:
+        return cached
+
     members = (
-        db.query(User)
+        db.query(User.id, User.email, User.role)
         .join(ProjectMember, User.id == ProjectMember.user_id)
         .filter(ProjectMember.project_id == project_id)
         .all()
     )
 
     return members
+
+
+# 📊 PROJECT STATS (DASHBOARD)
+@router.get("/{project_id}/stats", response_model=ProjectStats)
+def get_project_stats(
+    project_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_project_member)
+):
+    project = db.query(Project.id).filter(Project.id == project_id).first()
+
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    return project_stats(db, project_id)
+
+
+# 📈 PROJECT ANALYTICS (CUMULATIVE FLOW, THROUGHPUT, LEAD / CYCLE TIME)
+# Served from the daily rollups, which scripts/refresh_analytics.py
+# brings up to date on a schedule.
+@router.get("/{project_id}/analytics", response_model=ProjectAnalytics)
+def get_project_analytics(
+    project_id: int,
+    days: int = Query(30, ge=1, le=365),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_project_member)
+):
+    project = db.query(Project.id).filter(Project.id == project_id).first()
+
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    return project_analytics(db, project_id, days)
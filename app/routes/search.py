@@ -0,0 +1,233 @@
+import heapq
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func, literal_column
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.permissions import require_project_member
+from app.core.search import (
+    SEARCH_CONFIG,
+    HIGHLIGHT_START,
+    HIGHLIGHT_STOP,
+    SNIPPET_WORDS,
+    search_vector,
+    html_escaped,
+    build_tsquery,
+    tokenize,
+    highlight,
+    is_postgres,
+    search_index,
+    contains_terms,
+    ticket_text,
+    InvertedIndex,
+)
+from app.core.metrics import TimedRoute
+from app.models.ticket import Ticket
+from app.models.comment import Comment
+from app.models.archived_ticket import ArchivedTicket
+from app.models.archived_comment import ArchivedComment
+from app.models.user import User
+from app.schemas.search import SearchHit
+
+router = APIRouter(prefix="/search", tags=["Search"], route_class=TimedRoute)
+
+HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START},StopSel={HIGHLIGHT_STOP},"
+    f"MaxWords={SNIPPET_WORDS},MinWords={SNIPPET_WORDS // 2}"
+)
+
+
+def _headline(query, text):
+    # Escaped first: the <mark>s added here are the snippet's only markup
+    return func.ts_headline(
+        literal_column(f"'{SEARCH_CONFIG}'"),
+        html_escaped(func.coalesce(text, "")),
+        query,
+        HEADLINE_OPTIONS,
+    )
+
+
+# --------------------------------------------------------
+# 🔍 SEARCH TICKETS + COMMENTS (RANKED, PREFIX, HIGHLIGHTED)
+# --------------------------------------------------------
+@router.get("/", response_model=list[SearchHit])
+def search(
+    project_id: int = Query(...),
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    include_archived: bool = Query(False),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_project_member)
+):
+    if is_postgres(db):
+        hits = _search_postgres(db, project_id, q, limit)
+        if include_archived:
+            hits += _search_postgres(
+                db, project_id, q, limit, ArchivedTicket, ArchivedComment
+            )
+    else:
+        hits = _search_fallback(db, project_id, q, limit)
+        if include_archived:
+            hits += _search_archived_fallback(db, project_id, q, limit)
+
+    if include_archived:
+        # A ticket is either live or archived, never both
+        hits = heapq.nlargest(limit, hits, key=lambda hit: hit["rank"])
+    return hits
+
+
+def _search_postgres(
+    db: Session,
+    project_id: int,
+    q: str,
+    limit: int,
+    ticket_model=Ticket,
+    comment_model=Comment,
+):
+    """
+    Ranked hits from one pair of ticket / comment tables (live or archive).
+    """
+    tsquery = build_tsquery(q)
+    if tsquery is None:
+        return []
+
+    query = func.to_tsquery(literal_column(f"'{SEARCH_CONFIG}'"), tsquery)
+
+    ticket_vector = search_vector(ticket_model.title, ticket_model.description)
+    ticket_rank = func.ts_rank(ticket_vector, query)
+    ticket_rows = (
+        db.query(
+            ticket_model.id,
+            ticket_model.title,
+            ticket_model.status,
+            ticket_rank.label("rank"),
+            # Each field on its own, so a title-only match is highlighted too
+            _headline(query, ticket_model.description).label("snippet"),
+            _headline(query, ticket_model.title).label("title_snippet"),
+        )
+        .filter(ticket_model.project_id == project_id)
+        .filter(ticket_vector.op("@@")(query))
+        .order_by(ticket_rank.desc())
+        .limit(limit)
+        .all()
+    )
+
+    comment_vector = search_vector(comment_model.content)
+    comment_rank = func.ts_rank(comment_vector, query)
+    comment_rows = (
+        db.query(
+            ticket_model.id,
+            ticket_model.title,
+            ticket_model.status,
+            comment_rank.label("rank"),
+            _headline(query, comment_model.content).label("snippet"),
+        )
+        .join(comment_model, comment_model.ticket_id == ticket_model.id)
+        .filter(ticket_model.project_id == project_id)
+        .filter(comment_vector.op("@@")(query))
+        .order_by(comment_rank.desc())
+        .limit(limit)
+        .all()
+    )
+
+    # Keep the best-ranked hit per ticket
+    best = {}
+    for source, rows in (("ticket", ticket_rows), ("comment", comment_rows)):
+        for row in rows:
+            ticket_id, title, status, rank, snippet = row[:5]
+            if source == "ticket" and HIGHLIGHT_START not in snippet:
+                snippet = row.title_snippet  # matched in the title only
+            if ticket_id not in best or rank > best[ticket_id]["rank"]:
+                best[ticket_id] = {
+                    "ticket_id": ticket_id,
+                    "title": title,
+                    "status": status,
+                    "rank": rank,
+                    "snippet": snippet,
+                    "source": source,
+                    "archived": ticket_model is ArchivedTicket,
+                }
+
+    return heapq.nlargest(limit, best.values(), key=lambda hit: hit["rank"])
+
+
+def _search_fallback(db: Session, project_id: int, q: str, limit: int):
+    terms = tokenize(q)
+    if not terms:
+        return []
+
+    matches = search_index.search(db, project_id, terms)
+    return _index_hits(db, matches, terms, limit, Ticket)
+
+
+def _search_archived_fallback(db: Session, project_id: int, q: str, limit: int):
+    """
+    The cached indexes hold live tickets only: narrow the archive down
+    with LIKE, then rank just the matches in a throwaway index.
+    """
+    terms = tokenize(q)
+    if not terms:
+        return []
+
+    index = InvertedIndex()
+    tickets = db.query(
+        ArchivedTicket.id, ArchivedTicket.title, ArchivedTicket.description
+    ).filter(
+        ArchivedTicket.project_id == project_id,
+        contains_terms(terms, ArchivedTicket.title, ArchivedTicket.description),
+    )
+    for ticket_id, title, description in tickets:
+        index.add(("ticket", ticket_id), ticket_id, ticket_text(title, description))
+
+    comments = (
+        db.query(ArchivedComment.id, ArchivedComment.ticket_id, ArchivedComment.content)
+        .join(ArchivedTicket, ArchivedTicket.id == ArchivedComment.ticket_id)
+        .filter(
+            ArchivedTicket.project_id == project_id,
+            contains_terms(terms, ArchivedComment.content),
+        )
+    )
+    for comment_id, ticket_id, content in comments:
+        index.add(("comment", comment_id), ticket_id, content)
+
+    return _index_hits(db, index.matches(terms), terms, limit, ArchivedTicket)
+
+
+def _index_hits(db: Session, matches, terms: list[str], limit: int, ticket_model):
+    """
+    Hits from InvertedIndex.matches() output: a copy, so nothing here
+    reads the shared index.
+    """
+    # Keep the best-scoring document (ticket body or comment) per ticket
+    best = {}
+    for key, (score, ticket_id, _) in matches.items():
+        if ticket_id not in best or score > best[ticket_id][1]:
+            best[ticket_id] = (key, score)
+
+    top = heapq.nlargest(limit, best.items(), key=lambda item: item[1][1])
+    if not top:
+        return []
+
+    tickets = {
+        ticket_id: (title, status)
+        for ticket_id, title, status in db.query(
+            ticket_model.id, ticket_model.title, ticket_model.status
+        ).filter(ticket_model.id.in_([ticket_id for ticket_id, _ in top]))
+    }
+
+    hits = []
+    for ticket_id, (key, score) in top:
+        if ticket_id not in tickets:
+            continue
+        title, status = tickets[ticket_id]
+        hits.append({
+            "ticket_id": ticket_id,
+            "title": title,
+            "status": status,
+            "rank": score,
+            "snippet": highlight(matches[key][2], terms),
+            "source": key[0],
+            "archived": ticket_model is ArchivedTicket,
+        })
+    return hits
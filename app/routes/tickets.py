@@ -1,19 +1,310 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import delete, select, tuple_, update
+from datetime import datetime
 from typing import Optional
-
-from app.core.database import get_db
-from app.models.ticket import Ticket
+import csv
+import enum
+import io
+import json
+
+from app.core.activity import activity_writer
+from app.core.archive import restore_ticket
+from app.core.config import settings
+from app.core.database import get_db, SessionLocal
+from app.core.jobs import job_queue
+from app.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    encode_cursor,
+    decode_cursor,
+)
+from app.core.ranking import (
+    RANK_MAX_LENGTH,
+    last_rank,
+    needs_rebalance,
+    rank_after,
+    rank_between,
+    rebalance_column,
+    rebalance_in_background,
+)
+from app.core.search import search_index, ticket_match_filter
+from app.core.serialization import json_response
+from app.core import events, stats
+from app.core.versioning import (
+    bump_project_version,
+    project_version,
+    record_tombstones,
+    make_etag,
+    not_modified,
+)
+from app.models.archived_ticket import ArchivedTicket
+from app.models.comment import Comment
+from app.models.notification import Notification
+from app.models.project_version import ProjectVersion
+from app.models.ticket import Ticket, TicketStatus, utcnow
+from app.models.ticket_event import TicketEvent
 from app.models.project import Project
-from app.schemas.ticket import TicketCreate, TicketUpdate, TicketResponse
+from app.models.ticket_tombstone import TicketTombstone
+from app.schemas.activity import TicketActivity
+from app.schemas.ticket import (
+    TicketCreate,
+    TicketUpdate,
+    TicketMove,
+    TicketResponse,
+    TicketPage,
+    TicketChanges,
+    ticket_page_json,
+    ticket_changes_json,
+)
 from app.core.security import get_current_user
+from app.core.permissions import (
+    check_project_access,
+    require_project_member,
+    ticket_update_error,
+    ticket_assign_error,
+)
+from app.core.metrics import TimedRoute
 from app.models.user import User
 
 router = APIRouter(
     prefix="/tickets",
-    tags=["Tickets"]
+    tags=["Tickets"],
+    route_class=TimedRoute
+)
+
+# Every ticket response nests the assignee: load it in the same statement,
+# and only the columns UserResponse needs (no password hash).
+TICKET_LOAD_OPTIONS = (
+    joinedload(Ticket.assignee).load_only(User.id, User.email, User.role),
+)
+
+
+# Fast serialization: the same fields as plain column tuples (assignee
+# via an outer join), turned into dicts and encoded without validation.
+TICKET_ROW_COLUMNS = (
+    Ticket.id,
+    Ticket.title,
+    Ticket.description,
+    Ticket.status,
+    Ticket.priority,
+    Ticket.type,
+    Ticket.project_id,
+    Ticket.reporter_id,
+    Ticket.assignee_id,
+    Ticket.rank,
+    Ticket.version,
+    Ticket.created_at,
+    Ticket.updated_at,
+    User.email.label("assignee_email"),
+    User.role.label("assignee_role"),
 )
+ARCHIVED_ROW_COLUMNS = (
+    ArchivedTicket.id,
+    ArchivedTicket.title,
+    ArchivedTicket.description,
+    ArchivedTicket.status,
+    ArchivedTicket.priority,
+    ArchivedTicket.type,
+    ArchivedTicket.project_id,
+    ArchivedTicket.reporter_id,
+    ArchivedTicket.assignee_id,
+    ArchivedTicket.rank,
+    ArchivedTicket.version,
+    ArchivedTicket.created_at,
+    ArchivedTicket.updated_at,
+    User.email.label("assignee_email"),
+    User.role.label("assignee_role"),
+)
+
+
+def ticket_query(db: Session, rows: bool = False):
+    """
+    Query for ticket lists: ORM objects, or column tuples when
+    FAST_SERIALIZATION is on (or ``rows``). Both expose the ticket
+    fields as attributes.
+    """
+    if rows or settings.fast_serialization:
+        return (
+            db.query(*TICKET_ROW_COLUMNS)
+            .outerjoin(User, User.id == Ticket.assignee_id)
+        )
+    return db.query(Ticket).options(*TICKET_LOAD_OPTIONS)
+
+
+def ticket_row(row, archived: bool = False) -> dict:
+    return {
+        "id": row.id,
+        "title": row.title,
+        "description": row.description,
+        "status": row.status,
+        "priority": row.priority,
+        "type": row.type,
+        "project_id": row.project_id,
+        "reporter_id": row.reporter_id,
+        "assignee_id": row.assignee_id,
+        "assignee": {
+            "id": row.assignee_id,
+            "email": row.assignee_email,
+            "role": row.assignee_role,
+        } if row.assignee_email is not None else None,
+        "rank": row.rank,
+        "version": row.version,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+        "archived": archived,
+    }
+
+
+def load_ticket(db: Session, ticket_id: int):
+    return (
+        db.query(Ticket)
+        .options(*TICKET_LOAD_OPTIONS)
+        .filter(Ticket.id == ticket_id)
+        .first()
+    )
+
+
+def lock_ticket(db: Session, ticket_id: int, current_user) -> tuple[Ticket, int]:
+    """
+    Load a ticket to change it: bump (and so lock) its project's version
+    first, then read the row. Concurrent writes to it queue on that lock,
+    so before/after diffs (counters, activity) start from what the last
+    one committed. Returns the ticket and the new version.
+    """
+    project_id = db.query(Ticket.project_id).filter(Ticket.id == ticket_id).scalar()
+    if project_id is None:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+
+    check_project_access(db, current_user, project_id)
+
+    version = bump_project_version(db, project_id)
+    ticket = (
+        db.query(Ticket)
+        .filter(Ticket.id == ticket_id)
+        .populate_existing()
+        .first()
+    )
+    if not ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found")  # deleted meanwhile
+    return ticket, version
+
+
+def publish_ticket(ticket: Ticket, event_type: str):
+    events.publish(
+        ticket.project_id,
+        event_type,
+        TicketResponse.model_validate(ticket).model_dump(mode="json"),
+    )
+
+
+# --------------------------------------------------------
+# 📨 SIDE-EFFECT JOBS (RUN AFTER THE REQUEST COMMITS)
+# --------------------------------------------------------
+def enqueue_assignment(db: Session, ticket_id: int, assignee_id, actor_id: int):
+    """
+    Queue the new assignee's notification, unless they assigned themselves.
+    """
+    if assignee_id is None or assignee_id == actor_id:
+        return
+    job_queue.enqueue(
+        db, "ticket.assigned",
+        {"ticket_id": ticket_id, "assignee_id": assignee_id, "actor_id": actor_id},
+        dedup_key=f"ticket.assigned:{ticket_id}:{assignee_id}",
+    )
+
+
+def enqueue_cleanup(db: Session, ticket_ids: list[int]):
+    """
+    Queue the removal of what deleting ``ticket_ids`` left behind: their
+    detached comments and their notifications.
+    """
+    job_queue.enqueue(
+        db, "tickets.deleted",
+        {"ticket_ids": ticket_ids, "deleted_at": utcnow().isoformat()},
+    )
+
+
+@job_queue.handler("ticket.assigned")
+def notify_assignee(db: Session, payload: dict):
+    ticket = (
+        db.query(Ticket.id, Ticket.project_id, Ticket.title, Ticket.assignee_id)
+        .filter(Ticket.id == payload["ticket_id"])
+        .first()
+    )
+    # Deleted, or reassigned again since (that change queued its own job)
+    if ticket is None or ticket.assignee_id != payload["assignee_id"]:
+        return
+    db.add(Notification(
+        user_id=ticket.assignee_id,
+        project_id=ticket.project_id,
+        ticket_id=ticket.id,
+        actor_id=payload["actor_id"],
+        kind="assigned",
+        message=f"You were assigned #{ticket.id}: {ticket.title}",
+    ))
+
+
+@job_queue.handler("tickets.deleted")
+def clean_up_deleted_tickets(db: Session, payload: dict):
+    # Only rows from before the delete: SQLite may hand the id out again
+    db.execute(
+        delete(Notification).where(
+            Notification.ticket_id.in_(payload["ticket_ids"]),
+            Notification.created_at <= datetime.fromisoformat(payload["deleted_at"]),
+        ),
+        execution_options={"synchronize_session": False},
+    )
+    # Detached comments (of these and any earlier deletes). Replies to
+    # them from a live ticket lose their parent rather than go too.
+    detached = select(Comment.id).where(Comment.ticket_id.is_(None))
+    db.execute(
+        update(Comment)
+        .where(Comment.parent_id.in_(detached), Comment.ticket_id.is_not(None))
+        .values(parent_id=None),
+        execution_options={"synchronize_session": False},
+    )
+    db.execute(
+        delete(Comment).where(Comment.ticket_id.is_(None)),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def apply_ticket_filters(
+    db, query, project_id, status, priority, assignee_id, search, archived=False
+):
+    """
+    The board's filter query params, shared by the list and export routes
+    (on ArchivedTicket when ``archived``).
+    """
+    model = ArchivedTicket if archived else Ticket
+
+    if status:
+        query = query.filter(model.status == status)
+
+    if priority:
+        query = query.filter(model.priority == priority)
+
+    if assignee_id:
+        query = query.filter(model.assignee_id == assignee_id)
+
+    if search:
+        match = ticket_match_filter(db, project_id, search, archived)
+        if match is not None:
+            query = query.filter(match)
+
+    return query
+
+
+# Columns the board can be sorted by, and whether highest comes first
+# (id breaks ties in the same direction)
+SORT_COLUMNS = {
+    "created_at": (Ticket.created_at, True),
+    "updated_at": (Ticket.updated_at, True),
+    "rank": (Ticket.rank, False),  # card order, best with ?status=
+}
+CURSOR_PARSERS = {"rank": str}
 
 # --------------------------------------------------------
 # 🔐 CREATE TICKET
@@ -23,7 +314,7 @@ def create_ticket(
     project_id: int,
     data: TicketCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_project_member)
 ):
     project = db.query(Project).filter(Project.id == project_id).first()
 
@@ -31,12 +322,9 @@ def create_ticket(
         raise HTTPException(status_code=404, detail="Project not found")
 
     # 🔐 Only admin can assign tickets
-    if data.assignee_id is not None:
-        if current_user.role != "admin":
-            raise HTTPException(
-                status_code=403,
-                detail="Only admin can assign tickets"
-            )
+    error = ticket_assign_error(current_user, data.assignee_id)
+    if error:
+        raise HTTPException(status_code=403, detail=error)
 
     ticket = Ticket(
         title=data.title,
@@ -45,49 +333,296 @@ def create_ticket(
         type=data.type,
         project_id=project_id,
         reporter_id=current_user.id,
-        assignee_id=data.assignee_id if current_user.role == "admin" else None
+        assignee_id=data.assignee_id if current_user.role == "admin" else None,
+        version=bump_project_version(db, project_id),
+        rank=rank_after(last_rank(db, project_id, TicketStatus.todo))
     )
 
     db.add(ticket)
+    db.flush()
+    ticket_id = ticket.id
+    stats.record_created(db, ticket)
+    enqueue_assignment(db, ticket_id, ticket.assignee_id, current_user.id)
     db.commit()
-    db.refresh(ticket)
+
+    activity_writer.record(ticket_id, project_id, current_user.id, "created")
+
+    ticket = load_ticket(db, ticket_id)
+    search_index.index_ticket(ticket)
+    publish_ticket(ticket, "ticket.created")
 
     return ticket
 
 
 # --------------------------------------------------------
-# 🔍 GET PROJECT TICKETS (WITH FILTERS)
+# 🔍 GET PROJECT TICKETS (WITH FILTERS, KEYSET PAGINATED)
 # --------------------------------------------------------
-@router.get("/projects/{project_id}", response_model=list[TicketResponse])
+@router.get("/projects/{project_id}", response_model=TicketPage)
 def get_project_tickets(
     project_id: int,
+    request: Request,
+    response: Response,
     status: Optional[str] = Query(None),
     priority: Optional[str] = Query(None),
     assignee_id: Optional[int] = Query(None),
     search: Optional[str] = Query(None),
+    sort: str = Query("created_at"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    include_archived: bool = Query(False),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_project_member)
 ):
-    query = db.query(Ticket).filter(Ticket.project_id == project_id)
+    if sort not in SORT_COLUMNS:
+        raise HTTPException(status_code=400, detail="Invalid sort field")
+    sort_column, descending = SORT_COLUMNS[sort]
+
+    # Unchanged since the client's copy: skip the ticket query entirely
+    # (archiving and restoring bump the version too)
+    version = project_version(db, project_id)
+    etag = make_etag(request, version)
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
+    last_value = last_id = None
+    if cursor:
+        last_value, last_id = decode_cursor(
+            cursor, CURSOR_PARSERS.get(sort, datetime.fromisoformat)
+        )
 
-    if status:
-        query = query.filter(Ticket.status == status)
+    def page(query, model, archived=False):
+        query = apply_ticket_filters(
+            db, query, project_id, status, priority, assignee_id, search, archived
+        )
+        column = getattr(model, sort_column.key)
+
+        # Seek past the last row of the previous page instead of OFFSET,
+        # so every page costs the same no matter how deep the client is.
+        if cursor:
+            position = tuple_(column, model.id)
+            query = query.filter(
+                position < (last_value, last_id) if descending
+                else position > (last_value, last_id)
+            )
 
-    if priority:
-        query = query.filter(Ticket.priority == priority)
+        # Fetch one extra row to know whether another page exists
+        if descending:
+            order = (column.desc(), model.id.desc())
+        else:
+            order = (column, model.id)
+        return query.order_by(*order).limit(limit + 1).all()
 
-    if assignee_id:
-        query = query.filter(Ticket.assignee_id == assignee_id)
+    rows = page(
+        ticket_query(db, rows=include_archived).filter(Ticket.project_id == project_id),
+        Ticket,
+    )
 
-    if search:
-        query = query.filter(
-            or_(
-                Ticket.title.ilike(f"%{search}%"),
-                Ticket.description.ilike(f"%{search}%")
+    if include_archived:
+        # Both tables hold the same key order: merging their next
+        # limit + 1 rows gives the next limit + 1 of the union
+        archived = page(
+            db.query(*ARCHIVED_ROW_COLUMNS)
+            .outerjoin(User, User.id == ArchivedTicket.assignee_id)
+            .filter(ArchivedTicket.project_id == project_id),
+            ArchivedTicket,
+            archived=True,
+        )
+        rows = [ticket_row(row) for row in rows]
+        rows += [ticket_row(row, archived=True) for row in archived]
+        rows.sort(key=lambda row: (row[sort], row["id"]), reverse=descending)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        if include_archived:
+            next_cursor = encode_cursor(last[sort], last["id"])
+        else:
+            next_cursor = encode_cursor(getattr(last, sort), last.id)
+
+    # version was read before the rows, so a client syncing from it may
+    # re-apply a change but can never miss one
+    if settings.fast_serialization:
+        return json_response(ticket_page_json, {
+            "items": rows if include_archived else [ticket_row(row) for row in rows],
+            "next_cursor": next_cursor,
+            "version": version,
+        }, response)
+
+    return {"items": rows, "next_cursor": next_cursor, "version": version}
+
+
+# --------------------------------------------------------
+# 📤 EXPORT PROJECT TICKETS (STREAMED NDJSON / CSV)
+# --------------------------------------------------------
+EXPORT_COLUMNS = (
+    Ticket.id,
+    Ticket.title,
+    Ticket.description,
+    Ticket.status,
+    Ticket.priority,
+    Ticket.type,
+    Ticket.project_id,
+    Ticket.reporter_id,
+    Ticket.assignee_id,
+    User.email.label("assignee_email"),
+    Ticket.created_at,
+    Ticket.updated_at,
+)
+EXPORT_BATCH_SIZE = 1000
+
+
+def _export_value(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+@router.get("/projects/{project_id}/export")
+def export_project_tickets(
+    project_id: int,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    status: Optional[str] = Query(None),
+    priority: Optional[str] = Query(None),
+    assignee_id: Optional[int] = Query(None),
+    search: Optional[str] = Query(None),
+    current_user: User = Depends(require_project_member)
+):
+    names = [column.key for column in EXPORT_COLUMNS]
+
+    def rows():
+        # Own session: the stream outlives the request's dependencies
+        db = SessionLocal()
+        try:
+            query = (
+                db.query(*EXPORT_COLUMNS)
+                .outerjoin(User, User.id == Ticket.assignee_id)
+                .filter(Ticket.project_id == project_id)
             )
+            query = apply_ticket_filters(
+                db, query, project_id, status, priority, assignee_id, search
+            )
+            # Server-side cursor, fetched in batches: memory stays flat
+            result = db.execute(
+                query.order_by(Ticket.id).statement,
+                execution_options={
+                    "stream_results": True,
+                    "yield_per": EXPORT_BATCH_SIZE,
+                },
+            )
+            for partition in result.partitions():
+                yield [[_export_value(value) for value in row] for row in partition]
+        finally:
+            db.close()
+
+    if format == "csv":
+        def body():
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(names)
+            for batch in rows():
+                writer.writerows(batch)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            yield buffer.getvalue()
+
+        media_type = "text/csv"
+    else:
+        def body():
+            for batch in rows():
+                yield "".join(
+                    json.dumps(dict(zip(names, row))) + "\n" for row in batch
+                )
+
+        media_type = "application/x-ndjson"
+
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={
+            "Content-Disposition":
+                f'attachment; filename="project-{project_id}-tickets.{format}"'
+        },
+    )
+
+
+# --------------------------------------------------------
+# 🔄 DELTA SYNC: TICKETS CHANGED SINCE A VERSION
+# --------------------------------------------------------
+@router.get("/projects/{project_id}/changes", response_model=TicketChanges)
+def get_ticket_changes(
+    project_id: int,
+    since: int = Query(..., ge=0),
+    limit: int = Query(500, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_project_member)
+):
+    state = (
+        db.query(ProjectVersion.version, ProjectVersion.pruned_version)
+        .filter(ProjectVersion.project_id == project_id)
+        .first()
+    )
+    current, pruned = state if state else (0, 0)
+
+    if since < pruned:
+        raise HTTPException(
+            status_code=410,
+            detail="Sync token too old, reload the project"
+        )
+
+    changed = (
+        ticket_query(db)
+        .filter(Ticket.project_id == project_id, Ticket.version > since)
+        .order_by(Ticket.version, Ticket.id)
+        .limit(limit + 1)
+        .all()
+    )
+
+    has_more = len(changed) > limit
+    if has_more:
+        # Never split one version (a bulk write) across two responses
+        changed = changed[:limit]
+        upto = changed[-1].version
+        changed += (
+            ticket_query(db)
+            .filter(
+                Ticket.project_id == project_id,
+                Ticket.version == upto,
+                Ticket.id > changed[-1].id,
+            )
+            .order_by(Ticket.id)
+            .all()
+        )
+    else:
+        upto = current
+
+    deleted = [
+        ticket_id
+        for (ticket_id,) in db.query(TicketTombstone.ticket_id).filter(
+            TicketTombstone.project_id == project_id,
+            TicketTombstone.version > since,
+            TicketTombstone.version <= upto,
         )
+    ]
+
+    if settings.fast_serialization:
+        return json_response(ticket_changes_json, {
+            "version": upto,
+            "changed": [ticket_row(row) for row in changed],
+            "deleted": deleted,
+            "has_more": has_more,
+        })
 
-    return query.all()
+    return {
+        "version": upto,
+        "changed": changed,
+        "deleted": deleted,
+        "has_more": has_more,
+    }
 
 
 # --------------------------------------------------------
@@ -100,37 +635,223 @@ def update_ticket(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket, version = lock_ticket(db, ticket_id, current_user)
 
-    if not ticket:
+    # 🔐 ROLE-BASED PERMISSIONS
+    error = ticket_update_error(
+        current_user, ticket.assignee_id, data.assignee_id is not None
+    )
+    if error:
+        raise HTTPException(status_code=403, detail=error)
+
+    # Apply updates
+    changes = data.model_dump(exclude_unset=True)
+    before = {field: getattr(ticket, field) for field in changes}
+    counts_before = stats.ticket_counts(ticket)
+    for field, value in changes.items():
+        setattr(ticket, field, value)
+    stats.record_updated(db, ticket.project_id, counts_before, stats.ticket_counts(ticket))
+    ticket.version = version
+    if "status" in changes and changes["status"] != before["status"]:
+        # Joins the bottom of its new column, like a new ticket
+        ticket.rank = rank_after(last_rank(db, ticket.project_id, ticket.status))
+    if "assignee_id" in changes and changes["assignee_id"] != before["assignee_id"]:
+        enqueue_assignment(db, ticket_id, ticket.assignee_id, current_user.id)
+
+    db.commit()
+
+    activity_writer.record_changes(
+        ticket_id, ticket.project_id, current_user.id, "updated", before, changes
+    )
+
+    ticket = load_ticket(db, ticket_id)
+    search_index.index_ticket(ticket)
+    publish_ticket(ticket, "ticket.updated")
+
+    return ticket
+
+
+# --------------------------------------------------------
+# 🔀 MOVE TICKET (KANBAN DRAG & DROP)
+# --------------------------------------------------------
+# Places the card between two neighbours in a column by giving it a
+# rank between theirs: one UPDATE, however long the column is.
+@router.post("/{ticket_id}/move", response_model=TicketResponse)
+def move_ticket(
+    ticket_id: int,
+    data: TicketMove,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    # The version lock also orders this move after any concurrent move or
+    # rebalance in the project, before the neighbour ranks are read
+    ticket, version = lock_ticket(db, ticket_id, current_user)
+
+    # 🔐 Same rules as changing the status with PATCH
+    error = ticket_update_error(current_user, ticket.assignee_id, False)
+    if error:
+        raise HTTPException(status_code=403, detail=error)
+
+    def neighbour_ranks():
+        ids = [i for i in (data.after_id, data.before_id) if i is not None]
+        rows = {
+            row.id: row
+            for row in db.query(Ticket.id, Ticket.project_id, Ticket.status, Ticket.rank)
+            .filter(Ticket.id.in_(ids))
+        }
+        ranks = []
+        for neighbour_id in (data.after_id, data.before_id):
+            if neighbour_id is None:
+                ranks.append(None)
+                continue
+            row = rows.get(neighbour_id)
+            if (
+                row is None
+                or neighbour_id == ticket_id
+                or row.project_id != ticket.project_id
+                or row.status != data.status
+            ):
+                raise HTTPException(
+                    status_code=409,
+                    detail="Board changed, reload the column"
+                )
+            ranks.append(row.rank)
+        return ranks
+
+    def place():
+        above, below = neighbour_ranks()
+        if above is None and below is None:
+            return rank_after(last_rank(db, ticket.project_id, data.status))
+        if above is not None and below is not None:
+            # The column's order is (rank, id): a respace can untie the
+            # two, but never swap them
+            if (above, data.after_id) > (below, data.before_id):
+                raise HTTPException(
+                    status_code=409,
+                    detail="after_id is below before_id, reload the column"
+                )
+            if above == below:
+                return None
+        rank = rank_between(above, below)
+        return rank if len(rank) <= RANK_MAX_LENGTH else None
+
+    rank = place()
+    if rank is None:
+        # Tied ranks, or no room left between them: respace the column
+        # now and place again
+        version = rebalance_column(db, ticket.project_id, data.status)
+        rank = place()
+        if rank is None:
+            raise HTTPException(status_code=409, detail="Board changed, reload the column")
+
+    old_status = ticket.status
+    counts_before = stats.ticket_counts(ticket)
+    ticket.status = data.status
+    ticket.rank = rank
+    ticket.version = version
+    stats.record_updated(db, ticket.project_id, counts_before, stats.ticket_counts(ticket))
+
+    db.commit()
+
+    # Reordering within a column is not logged, changing column is
+    activity_writer.record_changes(
+        ticket_id, ticket.project_id, current_user.id, "moved",
+        {"status": old_status}, {"status": data.status},
+    )
+
+    if needs_rebalance(rank):
+        background_tasks.add_task(
+            rebalance_in_background, ticket.project_id, data.status
+        )
+
+    ticket = load_ticket(db, ticket_id)
+    publish_ticket(ticket, "ticket.updated")
+
+    return ticket
+
+
+# --------------------------------------------------------
+# 🕓 TICKET ACTIVITY (NEWEST FIRST, KEYSET PAGINATED)
+# --------------------------------------------------------
+# Events are written in batches shortly after the change (see
+# app.core.activity), so the newest may take a moment to appear.
+@router.get("/{ticket_id}/activity", response_model=TicketActivity)
+def get_ticket_activity(
+    ticket_id: int,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    project_id = db.query(Ticket.project_id).filter(Ticket.id == ticket_id).scalar()
+    if project_id is None:
+        # Deleted tickets keep their history
+        project_id = (
+            db.query(TicketEvent.project_id)
+            .filter(TicketEvent.ticket_id == ticket_id)
+            .limit(1)
+            .scalar()
+        )
+    if project_id is None:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
-    # 🔐 ROLE-BASED PERMISSIONS
+    check_project_access(db, current_user, project_id)
 
-    if current_user.role == "admin":
-        pass  # admin can update anything
+    query = db.query(TicketEvent).filter(TicketEvent.ticket_id == ticket_id)
+    if cursor:
+        last_created, last_id = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(TicketEvent.created_at, TicketEvent.id) < (last_created, last_id)
+        )
+    rows = (
+        query.order_by(TicketEvent.created_at.desc(), TicketEvent.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
 
-    elif current_user.role == "developer":
-        # Developer can only update tickets assigned to them
-        if ticket.assignee_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Not allowed")
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
 
-        # 🔐 Developer cannot reassign
-        if data.assignee_id is not None:
-            raise HTTPException(
-                status_code=403,
-                detail="Only admin can reassign tickets"
-            )
+    return {"items": rows, "next_cursor": next_cursor}
 
-    else:  # viewer
-        raise HTTPException(status_code=403, detail="Not allowed")
 
-    # Apply updates
-    for field, value in data.model_dump(exclude_unset=True).items():
-        setattr(ticket, field, value)
+# --------------------------------------------------------
+# ♻️ RESTORE ARCHIVED TICKET
+# --------------------------------------------------------
+@router.post("/{ticket_id}/restore", response_model=TicketResponse)
+def restore_archived_ticket(
+    ticket_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    archived = (
+        db.query(ArchivedTicket.project_id, ArchivedTicket.assignee_id)
+        .filter(ArchivedTicket.id == ticket_id)
+        .first()
+    )
+
+    if not archived:
+        raise HTTPException(status_code=404, detail="Archived ticket not found")
 
+    check_project_access(db, current_user, archived.project_id)
+
+    # 🔐 Same rules as updating it
+    error = ticket_update_error(current_user, archived.assignee_id, False)
+    if error:
+        raise HTTPException(status_code=403, detail=error)
+
+    project_id = restore_ticket(db, ticket_id)
     db.commit()
-    db.refresh(ticket)
+
+    activity_writer.record(ticket_id, project_id, current_user.id, "restored")
+
+    ticket = load_ticket(db, ticket_id)
+    # Its comments came back too
+    search_index.invalidate(project_id)
+    publish_ticket(ticket, "ticket.created")
 
     return ticket
 
@@ -147,12 +868,28 @@ def delete_ticket(
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Admin only")
 
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket, version = lock_ticket(db, ticket_id, current_user)
 
-    if not ticket:
-        raise HTTPException(status_code=404, detail="Ticket not found")
+    project_id = ticket.project_id
+    title = ticket.title
 
+    stats.record_deleted(db, ticket)
+    record_tombstones(db, project_id, [ticket_id], version)
+    # One statement instead of loading every comment to unlink it; the
+    # job deletes them once the response is out
+    db.execute(
+        update(Comment).where(Comment.ticket_id == ticket_id).values(ticket_id=None),
+        execution_options={"synchronize_session": False},
+    )
     db.delete(ticket)
+    enqueue_cleanup(db, [ticket_id])
     db.commit()
 
+    activity_writer.record(
+        ticket_id, project_id, current_user.id, "deleted", "title", title, None
+    )
+
+    search_index.remove_ticket(ticket_id)
+    events.publish(project_id, "ticket.deleted", {"id": ticket_id})
+
     return {"message": "Ticket deleted"}
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+
+class TicketEventResponse(BaseModel):
+    id: int
+    ticket_id: int
+    actor_id: Optional[int]
+    action: str  # created / updated / moved / deleted / commented / comment_deleted
+    field: Optional[str] = None
+    old_value: Optional[str] = None
+    new_value: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class TicketActivity(BaseModel):
+    items: list[TicketEventResponse]  # newest first
+    next_cursor: Optional[str] = None
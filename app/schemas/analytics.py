@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+from datetime import date
+from typing import Optional
+
+
+class FlowDay(BaseModel):
+    day: date
+    counts: dict[str, int]  # tickets in each status at the end of the day
+    completed: int  # tickets that reached done that day
+
+
+class DurationPercentiles(BaseModel):
+    count: int  # finished tickets with a known duration
+    p50: Optional[float] = None
+    p85: Optional[float] = None
+    p95: Optional[float] = None
+
+
+class ProjectAnalytics(BaseModel):
+    start: date
+    end: date
+    cumulative_flow: list[FlowDay]
+    throughput: int  # tickets done in the window
+    lead_time_hours: DurationPercentiles  # created -> done
+    cycle_time_hours: DurationPercentiles  # first in progress -> done
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional
 
@@ -11,7 +11,30 @@ class CommentResponse(BaseModel):
     content: str
     user_id: int
     ticket_id: int
+    parent_id: Optional[int] = None
     created_at: datetime
 
     class Config:
-        orm_mode = True
+        from_attributes = True
+
+
+class CommentNode(CommentResponse):
+    depth: int
+    replies: list["CommentNode"] = []
+    has_more_replies: bool = False  # cut off by max_depth
+
+
+class CommentTree(BaseModel):
+    items: list[CommentNode]
+    next_cursor: Optional[str] = None
+
+
+class CommentImportRow(CommentCreate):
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    ticket_id: Optional[int] = None
+    ticket_ref: Optional[str] = None  # ref of a ticket from a ticket import
+    ref: Optional[str] = None  # id in the source tracker
+    parent_ref: Optional[str] = None  # ref of an earlier comment row
+    user_id: Optional[int] = None  # defaults to the importing user
+    created_at: Optional[datetime] = None
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class ImportRowError(BaseModel):
+    row: int  # 0-based position in the file
+    error: str
+
+
+class ImportResult(BaseModel):
+    imported: int  # committed
+    failed: int
+    errors: list[ImportRowError]  # first MAX_REPORTED_ERRORS only
+    next_offset: int  # pass as ?start= to resume after a failure
+    aborted: Optional[ImportRowError] = None  # the write failed here, nothing after it ran
+    id_map: dict[str, int] = {}  # ref -> new id of the rows committed by this request
+    seconds: float
+    rows_per_second: float
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+
+class NotificationResponse(BaseModel):
+    id: int
+    project_id: int
+    ticket_id: Optional[int]
+    actor_id: Optional[int]
+    kind: str  # assigned / mentioned
+    message: str
+    created_at: datetime
+    read_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class NotificationPage(BaseModel):
+    items: list[NotificationResponse]  # newest first
+    next_cursor: Optional[str] = None
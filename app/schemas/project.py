@@ -15,3 +15,13 @@ class ProjectResponse(BaseModel):
 class AddMemberRequest(BaseModel):
     user_id: int
 
+
+class ProjectStats(BaseModel):
+    total: int  # active + archived
+    active: int  # on the board, what the by_* counts cover
+    archived: int
+    by_status: dict[str, int]
+    by_priority: dict[str, int]
+    by_type: dict[str, int]
+    by_assignee: dict[str, int]  # user id -> count, plus "unassigned"
+    archived_by_status: dict[str, int]
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+from app.models.ticket import TicketStatus
+
+
+class SearchHit(BaseModel):
+    ticket_id: int
+    title: str
+    status: TicketStatus
+    rank: float
+    snippet: str
+    source: str  # "ticket" or "comment"
+    archived: bool = False
@@ -1,5 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional
+from typing_extensions import TypedDict
+from datetime import datetime
 from app.models.ticket import TicketPriority, TicketStatus, TicketType
 from app.schemas.user import UserResponse
 
@@ -21,6 +23,14 @@ class TicketUpdate(BaseModel):
     assignee_id: Optional[int] = None
 
 
+class TicketMove(BaseModel):
+    status: TicketStatus
+    # The cards that will sit directly above and below it (None at the
+    # top/bottom of the column)
+    after_id: Optional[int] = None
+    before_id: Optional[int] = None
+
+
 class TicketResponse(BaseModel):
     id: int
     title: str
@@ -32,6 +42,119 @@ class TicketResponse(BaseModel):
     reporter_id: int
     assignee_id: Optional[int]
     assignee: Optional[UserResponse] = None 
+    rank: Optional[str] = None
+    version: int = 0
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    archived: bool = False  # only in include_archived reads
 
     class Config:
         from_attributes = True
+
+
+class TicketPage(BaseModel):
+    items: list[TicketResponse]
+    next_cursor: Optional[str] = None
+    version: int = 0  # pass as ?since= to /changes
+
+
+class TicketChanges(BaseModel):
+    version: int  # next ?since= token
+    changed: list[TicketResponse]
+    deleted: list[int]
+    has_more: bool = False
+
+
+# =========================
+# Fast serialization (FAST_SERIALIZATION=true)
+# =========================
+#
+# Same JSON as the models above, built from plain dicts of trusted DB
+# rows: the adapters only encode, they never re-validate.
+
+class AssigneeRow(TypedDict):
+    id: int
+    email: str
+    role: str
+
+
+class TicketRow(TypedDict):
+    id: int
+    title: str
+    description: Optional[str]
+    status: TicketStatus
+    priority: TicketPriority
+    type: TicketType
+    project_id: int
+    reporter_id: int
+    assignee_id: Optional[int]
+    assignee: Optional[AssigneeRow]
+    rank: str
+    version: int
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    archived: bool
+
+
+class TicketPageRows(TypedDict):
+    items: list[TicketRow]
+    next_cursor: Optional[str]
+    version: int
+
+
+class TicketChangesRows(TypedDict):
+    version: int
+    changed: list[TicketRow]
+    deleted: list[int]
+    has_more: bool
+
+
+ticket_page_json = TypeAdapter(TicketPageRows)
+ticket_changes_json = TypeAdapter(TicketChangesRows)
+
+
+# =========================
+# Bulk operations
+# =========================
+
+class BulkTicketCreate(BaseModel):
+    items: list[TicketCreate] = Field(..., min_length=1, max_length=1000)
+
+
+class BulkTicketUpdate(BaseModel):
+    ids: list[int] = Field(..., min_length=1, max_length=1000)
+    changes: TicketUpdate
+
+
+class BulkTicketMove(BaseModel):
+    ids: list[int] = Field(..., min_length=1, max_length=1000)
+    status: TicketStatus
+
+
+class BulkTicketDelete(BaseModel):
+    ids: list[int] = Field(..., min_length=1, max_length=1000)
+
+
+class BulkItemResult(BaseModel):
+    index: int  # position in the request
+    id: Optional[int] = None
+    ok: bool
+    error: Optional[str] = None
+
+
+class BulkResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: list[BulkItemResult]
+
+
+# =========================
+# Import
+# =========================
+
+class TicketImportRow(TicketCreate):
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    status: TicketStatus = TicketStatus.todo
+    ref: Optional[str] = None  # id in the source tracker
+    created_at: Optional[datetime] = None
@@ -0,0 +1,240 @@
+"""
+API benchmarks against a seeded database.
+
+    python -m benchmarks run --database-url sqlite:///bench.db --reset --output before.json
+    python -m benchmarks run --url http://localhost:8000 --output live.json
+    python -m benchmarks compare before.json after.json
+    python -m benchmarks serialization --database-url sqlite:///bench.db --limit 200
+
+``run`` drives the app in-process by default, so it can also count SQL
+statements per request. With ``--url`` it load-tests a running server
+that was seeded with the same options instead.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def _login(client, email: str) -> dict:
+    from benchmarks.seed import BENCH_PASSWORD
+
+    response = await client.post(
+        "/auth/login", json={"email": email, "password": BENCH_PASSWORD}
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _run(args, config) -> dict:
+    import httpx
+    from benchmarks.runner import measure_sql, run_scenario
+    from benchmarks.scenarios import SCENARIOS, Context
+    from benchmarks.seed import ADMIN_EMAIL
+
+    engine = None
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=60)
+    else:
+        from app.core.database import engine
+        from app.main import app
+
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60
+        )
+
+    selected = [
+        scenario for scenario in SCENARIOS
+        if (not args.only or scenario.name in args.only)
+        and (args.writes or not scenario.writes)
+    ]
+
+    results = {}
+    async with client:
+        ctx = Context(
+            projects=config.projects,
+            tickets=config.projects * config.tickets_per_project,
+            headers=await _login(client, ADMIN_EMAIL),
+            member_headers=await _login(client, "dev2@bench.example.com"),
+        )
+        for scenario in selected:
+            result = await run_scenario(
+                client, scenario, ctx, args.requests, args.concurrency,
+                args.warmup, config.seed,
+            )
+            if engine is not None:
+                result["sql_per_request"] = round(await measure_sql(
+                    client, scenario, ctx, engine, args.sql_samples, config.seed
+                ), 2)
+            results[scenario.name] = result
+            print(
+                f"  {scenario.name:<24} p50 {result['p50']:>8.2f}ms  "
+                f"p95 {result['p95']:>8.2f}ms  p99 {result['p99']:>8.2f}ms  "
+                f"{result['throughput_rps']:>8.1f} req/s  "
+                f"sql {result.get('sql_per_request', '-')}"
+                + (f"  ({result['errors']} errors)" if result["errors"] else "")
+            )
+    return results
+
+
+def _prepare(args, seed_database: bool = True):
+    if args.database_url:
+        # Must be set before app.core.database creates the engine
+        os.environ["DATABASE_URL"] = args.database_url
+
+    from app.core.database import SessionLocal, Base, get_engine
+    from benchmarks.seed import SeedConfig, is_seeded, reset, seed
+
+    config = SeedConfig(
+        users=args.users,
+        projects=args.projects,
+        members_per_project=args.members,
+        tickets_per_project=args.tickets,
+        comments_per_ticket=args.comments,
+        seed=args.seed,
+    )
+
+    if seed_database:
+        if args.reset:
+            reset(get_engine())
+        else:
+            Base.metadata.create_all(bind=get_engine())
+        with SessionLocal() as db:
+            if is_seeded(db):
+                print("ℹ️  Database already has data, reusing it (--reset to reseed)")
+            else:
+                print(f"🌱 Seeding {seed(db, config)}")
+    return config
+
+
+def _meta(args, config, database: str) -> dict:
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "database": database,
+        "seed": config.as_dict(),
+    }
+
+
+def _write(path: str | None, report: dict):
+    if path:
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Results written to {path}")
+
+
+def run(args):
+    config = _prepare(args, seed_database=not args.url)
+    results = asyncio.run(_run(args, config))
+
+    from app.core.database import get_engine
+
+    report = {
+        "meta": {
+            **_meta(args, config, args.url or get_engine().dialect.name),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "routes": results,
+    }
+    _write(args.output, report)
+
+
+def serialization(args):
+    config = _prepare(args)
+
+    from app.core.database import SessionLocal, get_engine
+    from benchmarks.serialization import measure
+
+    results = measure(SessionLocal, 1, args.limit, args.repeats)
+    for name, result in results.items():
+        print(
+            f"  {name:<24} query {result['query_us_per_ticket']:>7.1f}µs  "
+            f"encode {result['encode_us_per_ticket']:>7.1f}µs  "
+            f"total {result['total_us_per_ticket']:>7.1f}µs per ticket "
+            f"({result['tickets']} tickets, {result['bytes']} bytes)"
+        )
+    _write(args.output, {
+        "meta": _meta(args, config, get_engine().dialect.name),
+        "routes": results,
+    })
+
+
+COMPARED = ("p50", "p95", "p99", "throughput_rps", "sql_per_request")
+
+
+def compare(args):
+    with open(args.before) as f:
+        before = json.load(f)["routes"]
+    with open(args.after) as f:
+        after = json.load(f)["routes"]
+
+    for name in sorted(before.keys() & after.keys()):
+        changes = []
+        for key in COMPARED:
+            if key not in before[name] or key not in after[name]:
+                continue
+            old, new = before[name][key], after[name][key]
+            delta = (new - old) / old * 100 if old else 0.0
+            changes.append(f"{key} {old:g}→{new:g} ({delta:+.0f}%)")
+        print(f"  {name:<24} " + "  ".join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n\n")[0].strip())
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    data = argparse.ArgumentParser(add_help=False)
+    data.add_argument("--database-url", help="defaults to DATABASE_URL")
+    data.add_argument("--reset", action="store_true", help="drop and reseed all tables")
+    data.add_argument("--users", type=int, default=50)
+    data.add_argument("--projects", type=int, default=5)
+    data.add_argument("--members", type=int, default=10, help="members per project")
+    data.add_argument("--tickets", type=int, default=2000, help="tickets per project")
+    data.add_argument("--comments", type=int, default=3, help="average comments per ticket")
+    data.add_argument("--seed", type=int, default=42)
+    data.add_argument("--output", help="JSON results file")
+
+    run_parser = commands.add_parser("run", parents=[data], help="seed (if needed) and benchmark")
+    run_parser.add_argument("--url", help="benchmark a running server instead")
+    run_parser.add_argument("--requests", type=int, default=200, help="per route")
+    run_parser.add_argument("--concurrency", type=int, default=8)
+    run_parser.add_argument("--warmup", type=int, default=10)
+    run_parser.add_argument("--sql-samples", type=int, default=5)
+    run_parser.add_argument("--writes", action="store_true", help="include write routes")
+    run_parser.add_argument("--only", nargs="*", help="route names to run")
+    run_parser.set_defaults(func=run)
+
+    serialization_parser = commands.add_parser(
+        "serialization", parents=[data], help="per-ticket cost of encoding a ticket list"
+    )
+    serialization_parser.add_argument("--limit", type=int, default=200, help="tickets per page")
+    serialization_parser.add_argument("--repeats", type=int, default=20)
+    serialization_parser.set_defaults(func=serialization)
+
+    compare_parser = commands.add_parser("compare", help="diff two result files")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+import asyncio
+import random
+import statistics
+import time
+
+import httpx
+
+from benchmarks.scenarios import Context, Scenario
+
+# =========================
+# Load driver
+# =========================
+
+
+def percentiles(samples: list[float]) -> dict:
+    if len(samples) < 2:
+        value = samples[0] if samples else 0.0
+        return {"p50": value, "p95": value, "p99": value}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": cuts[49], "p95": cuts[94], "p99": cuts[98]}
+
+
+async def _send(client: httpx.AsyncClient, scenario: Scenario, request: dict) -> int:
+    response = await client.request(scenario.method, **request)
+    return response.status_code
+
+
+async def measure_sql(client, scenario: Scenario, ctx: Context, engine, samples: int, seed: int) -> float:
+    """
+    Average statements per request, measured sequentially so concurrent
+    requests don't mix into the count. Needs the in-process app.
+    """
+    from app.core.instrumentation import count_queries
+
+    rng = random.Random(seed)
+    total = 0
+    for _ in range(samples):
+        request = scenario.build(ctx, rng)
+        with count_queries(engine) as counter:
+            await _send(client, scenario, request)
+        total += counter.count
+    return total / samples
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    ctx: Context,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    seed: int,
+) -> dict:
+    rng = random.Random(seed)
+    for _ in range(warmup):
+        await _send(client, scenario, scenario.build(ctx, rng))
+
+    # Requests are built up front so every run sends the same sequence
+    planned = [scenario.build(ctx, rng) for _ in range(requests)]
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        while planned:
+            request = planned.pop()
+            start = time.perf_counter()
+            status_code = await _send(client, scenario, request)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "throughput_rps": round(requests / elapsed, 1),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        **{key: round(value, 3) for key, value in percentiles(latencies).items()},
+    }
@@ -0,0 +1,88 @@
+import random
+from dataclasses import dataclass
+from typing import Callable
+
+from benchmarks.seed import WORDS
+
+# =========================
+# Benchmarked routes
+# =========================
+
+
+@dataclass
+class Context:
+    """
+    What scenarios need to know about the seeded data.
+    """
+    projects: int
+    tickets: int
+    headers: dict  # admin: sees every project
+    member_headers: dict  # developer: the usual caller
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    build: Callable[[Context, random.Random], dict]  # -> httpx request kwargs
+    writes: bool = False
+
+
+def _project(ctx: Context, rng: random.Random) -> int:
+    return rng.randint(1, ctx.projects)
+
+
+def _ticket(ctx: Context, rng: random.Random) -> int:
+    return rng.randint(1, ctx.tickets)
+
+
+SCENARIOS = [
+    Scenario("auth.me", "GET", lambda ctx, rng: {
+        "url": "/auth/me", "headers": ctx.member_headers,
+    }),
+    Scenario("projects.my", "GET", lambda ctx, rng: {
+        "url": "/projects/my", "headers": ctx.member_headers,
+    }),
+    Scenario("projects.stats", "GET", lambda ctx, rng: {
+        "url": f"/projects/{_project(ctx, rng)}/stats", "headers": ctx.headers,
+    }),
+    Scenario("tickets.list", "GET", lambda ctx, rng: {
+        "url": f"/tickets/projects/{_project(ctx, rng)}", "headers": ctx.headers,
+    }),
+    Scenario("tickets.list_filtered", "GET", lambda ctx, rng: {
+        "url": f"/tickets/projects/{_project(ctx, rng)}",
+        "params": {"status": "todo", "priority": "high"},
+        "headers": ctx.headers,
+    }),
+    Scenario("tickets.list_search", "GET", lambda ctx, rng: {
+        "url": f"/tickets/projects/{_project(ctx, rng)}",
+        "params": {"search": rng.choice(WORDS)},
+        "headers": ctx.headers,
+    }),
+    Scenario("tickets.changes", "GET", lambda ctx, rng: {
+        "url": f"/tickets/projects/{_project(ctx, rng)}/changes",
+        "params": {"since": 0, "limit": 200},
+        "headers": ctx.headers,
+    }),
+    Scenario("comments.list", "GET", lambda ctx, rng: {
+        "url": f"/comments/tickets/{_ticket(ctx, rng)}", "headers": ctx.headers,
+    }),
+    Scenario("comments.tree", "GET", lambda ctx, rng: {
+        "url": f"/comments/tickets/{_ticket(ctx, rng)}/tree", "headers": ctx.headers,
+    }),
+    Scenario("search", "GET", lambda ctx, rng: {
+        "url": "/search/",
+        "params": {"project_id": _project(ctx, rng), "q": rng.choice(WORDS)},
+        "headers": ctx.headers,
+    }),
+    Scenario("tickets.update", "PATCH", lambda ctx, rng: {
+        "url": f"/tickets/{_ticket(ctx, rng)}",
+        "json": {"priority": rng.choice(["low", "medium", "high", "critical"])},
+        "headers": ctx.headers,
+    }, writes=True),
+    Scenario("comments.create", "POST", lambda ctx, rng: {
+        "url": f"/comments/tickets/{_ticket(ctx, rng)}",
+        "json": {"content": "benchmark comment"},
+        "headers": ctx.headers,
+    }, writes=True),
+]
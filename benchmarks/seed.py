@@ -0,0 +1,172 @@
+import random
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, insert, text
+
+from app.core.database import Base
+from app.core.security import hash_password
+from app.core.stats import rebuild_project_stats
+from app.models.comment import Comment
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.project_version import ProjectVersion
+from app.models.ticket import Ticket, TicketPriority, TicketStatus, TicketType
+from app.models.user import User
+from app.models import (  # noqa: F401 (register tables)
+    analytics_watermark,
+    archived_comment,
+    archived_ticket,
+    job,
+    notification,
+    project_daily_flow,
+    project_stats,
+    ticket_event,
+    ticket_flow,
+    ticket_tombstone,
+)
+
+# =========================
+# Synthetic data generator
+# =========================
+#
+# Deterministic for a given SeedConfig: the same config always produces
+# the same rows, so results from different commits are comparable.
+
+BENCH_PASSWORD = "benchmark"
+ADMIN_EMAIL = "admin@bench.example.com"
+INSERT_BATCH_SIZE = 5000
+
+WORDS = (
+    "login crash timeout export dashboard kanban payment email search upload "
+    "avatar session token cache report filter sort mobile layout button modal "
+    "webhook import latency memory regression permission invite archive"
+).split()
+
+
+@dataclass
+class SeedConfig:
+    users: int = 50
+    projects: int = 5
+    members_per_project: int = 10
+    tickets_per_project: int = 2000
+    comments_per_ticket: int = 3  # average; threads nest up to a few levels
+    seed: int = 42
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _insert(db, model, rows: list[dict]):
+    for i in range(0, len(rows), INSERT_BATCH_SIZE):
+        db.execute(insert(model), rows[i:i + INSERT_BATCH_SIZE])
+
+
+def is_seeded(db) -> bool:
+    return db.query(func.count(User.id)).scalar() > 0
+
+
+def reset(engine):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def seed(db, config: SeedConfig):
+    """
+    Fill an empty database. Ids are assigned here so comment threads can
+    reference their parents without a round trip per row.
+    """
+    rng = random.Random(config.seed)
+    password = hash_password(BENCH_PASSWORD)
+    now = datetime.now(timezone.utc)
+
+    users = [{"id": 1, "email": ADMIN_EMAIL, "password": password, "role": "admin"}]
+    users += [
+        {"id": i, "email": f"dev{i}@bench.example.com", "password": password, "role": "developer"}
+        for i in range(2, config.users + 1)
+    ]
+    _insert(db, User, users)
+
+    projects, members, versions = [], [], []
+    tickets, comments = [], []
+    ticket_id = comment_id = 0
+    for project_id in range(1, config.projects + 1):
+        projects.append({
+            "id": project_id,
+            "name": f"Project {project_id}",
+            "description": _sentence(rng, 8),
+            "owner_id": 1,
+        })
+        versions.append({"project_id": project_id, "version": 1})
+
+        developers = rng.sample(
+            range(2, config.users + 1), min(config.members_per_project, config.users - 1)
+        )
+        team = [1] + developers
+        members += [
+            {"id": len(members) + i + 1, "user_id": user_id, "project_id": project_id}
+            for i, user_id in enumerate(team)
+        ]
+
+        start = now - timedelta(days=180)
+        step = timedelta(days=180) / max(config.tickets_per_project, 1)
+        for n in range(config.tickets_per_project):
+            ticket_id += 1
+            created_at = start + step * n
+            tickets.append({
+                "id": ticket_id,
+                "title": _sentence(rng, 5),
+                "description": _sentence(rng, 30),
+                "status": rng.choice(list(TicketStatus)),
+                "priority": rng.choice(list(TicketPriority)),
+                "type": rng.choice(list(TicketType)),
+                "project_id": project_id,
+                "reporter_id": rng.choice(team),
+                "assignee_id": rng.choice(developers) if rng.random() < 0.8 else None,
+                "version": 1,
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+
+            thread = []
+            for _ in range(rng.randint(0, config.comments_per_ticket * 2)):
+                comment_id += 1
+                parent_id = rng.choice(thread) if thread and rng.random() < 0.5 else None
+                comments.append({
+                    "id": comment_id,
+                    "content": _sentence(rng, 15),
+                    "ticket_id": ticket_id,
+                    "user_id": rng.choice(team),
+                    "parent_id": parent_id,
+                    "created_at": created_at + timedelta(minutes=len(thread) + 1),
+                })
+                thread.append(comment_id)
+
+    _insert(db, Project, projects)
+    _insert(db, ProjectMember, members)
+    _insert(db, ProjectVersion, versions)
+    _insert(db, Ticket, tickets)
+    _insert(db, Comment, comments)
+    rebuild_project_stats(db)
+
+    # Explicit ids don't advance Postgres sequences
+    if db.get_bind().dialect.name == "postgresql":
+        for model in (User, Project, ProjectMember, Ticket, Comment):
+            table = model.__tablename__
+            db.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"(SELECT MAX(id) FROM {table}))"
+            ))
+
+    db.commit()
+    return {
+        "users": len(users),
+        "projects": len(projects),
+        "members": len(members),
+        "tickets": len(tickets),
+        "comments": len(comments),
+    }
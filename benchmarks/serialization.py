@@ -0,0 +1,97 @@
+import json
+import time
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy.orm import joinedload
+
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.routes.tickets import TICKET_ROW_COLUMNS, ticket_row
+from app.schemas.ticket import TicketPage, ticket_page_json
+
+# =========================
+# Ticket list encoding cost
+# =========================
+#
+# Loads one page of tickets and times each way of turning it into the
+# response body, split into query and encode time per ticket.
+
+page_model = TypeAdapter(TicketPage)
+
+
+def _orm_page(db, project_id: int, limit: int) -> dict:
+    rows = (
+        db.query(Ticket)
+        .options(joinedload(Ticket.assignee).load_only(User.id, User.email, User.role))
+        .filter(Ticket.project_id == project_id)
+        .order_by(Ticket.created_at.desc(), Ticket.id.desc())
+        .limit(limit)
+        .all()
+    )
+    return {"items": rows, "next_cursor": None, "version": 1}
+
+
+def _row_page(db, project_id: int, limit: int) -> dict:
+    rows = (
+        db.query(*TICKET_ROW_COLUMNS)
+        .outerjoin(User, User.id == Ticket.assignee_id)
+        .filter(Ticket.project_id == project_id)
+        .order_by(Ticket.created_at.desc(), Ticket.id.desc())
+        .limit(limit)
+        .all()
+    )
+    return {"items": [ticket_row(row) for row in rows], "next_cursor": None, "version": 1}
+
+
+def _validated_stdlib_json(page: dict) -> bytes:
+    # response_model validation, then jsonable_encoder + json.dumps
+    model = page_model.validate_python(page, from_attributes=True)
+    return json.dumps(jsonable_encoder(model)).encode()
+
+
+def _validated_pydantic_json(page: dict) -> bytes:
+    # response_model validation, then pydantic-core encoding
+    model = page_model.validate_python(page, from_attributes=True)
+    return page_model.dump_json(model)
+
+
+def _trusted_rows_json(page: dict) -> bytes:
+    # FAST_SERIALIZATION: no validation, prebuilt TypedDict adapter
+    return ticket_page_json.dump_json(page)
+
+
+MODES = {
+    "orm+validate+json": (_orm_page, _validated_stdlib_json),
+    "orm+validate+pydantic": (_orm_page, _validated_pydantic_json),
+    "rows+typeadapter": (_row_page, _trusted_rows_json),
+}
+
+
+def measure(SessionLocal, project_id: int, limit: int, repeats: int) -> dict:
+    results = {}
+    for name, (load, encode) in MODES.items():
+        best_query = best_encode = float("inf")
+        tickets = 0
+        size = 0
+        for _ in range(repeats):
+            with SessionLocal() as db:
+                started = time.perf_counter()
+                page = load(db, project_id, limit)
+                loaded = time.perf_counter()
+                body = encode(page)
+                encoded = time.perf_counter()
+            best_query = min(best_query, loaded - started)
+            best_encode = min(best_encode, encoded - loaded)
+            tickets = len(page["items"])
+            size = len(body)
+
+        per_ticket = 1_000_000 / max(tickets, 1)
+        results[name] = {
+            "tickets": tickets,
+            "bytes": size,
+            "query_us_per_ticket": round(best_query * per_ticket, 2),
+            "encode_us_per_ticket": round(best_encode * per_ticket, 2),
+            "total_us_per_ticket": round((best_query + best_encode) * per_ticket, 2),
+        }
+    return results
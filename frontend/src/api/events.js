@@ -0,0 +1,27 @@
+import api from "./axios";
+
+// 🔹 Live project updates (Server-Sent Events).
+// EventSource can't send headers, so the token goes in the query string.
+export const subscribeToProject = (projectId, handlers) => {
+  const token = localStorage.getItem("token");
+  const url = `${api.defaults.baseURL}/events/projects/${projectId}?token=${encodeURIComponent(token)}`;
+  const source = new EventSource(url);
+
+  Object.entries(handlers).forEach(([type, handler]) => {
+    source.addEventListener(type, (e) => handler(JSON.parse(e.data)));
+  });
+
+  return () => source.close();
+};
+
+// 🔹 Apply a ticket event to a local list
+export const applyTicketEvent = (tickets, type, data, matches = () => true) => {
+  const rest = tickets.filter((t) => t.id !== data.id);
+
+  if (type === "ticket.deleted" || !matches(data)) return rest;
+  if (type === "ticket.created") return [data, ...rest];
+
+  return tickets.some((t) => t.id === data.id)
+    ? tickets.map((t) => (t.id === data.id ? data : t))
+    : [data, ...rest];
+};
@@ -0,0 +1,63 @@
+import api from "./axios";
+
+export const PAGE_SIZE = 50;
+
+// 🔹 One page of the keyset-paginated ticket list. Pass the previous page's
+// `next_cursor` to get the next one. Returns { items, next_cursor, version }.
+export const fetchTicketPage = async (projectId, params = {}, cursor = null) => {
+  const res = await api.get(`/tickets/projects/${projectId}`, {
+    params: { ...params, limit: PAGE_SIZE, ...(cursor ? { cursor } : {}) },
+  });
+  return res.data;
+};
+
+// 🔹 First page of each board column, in card order. More cards are loaded
+// per column with its cursor as the user scrolls.
+export const fetchBoard = async (projectId, statuses, params = {}) => {
+  const pages = await Promise.all(
+    statuses.map((status) =>
+      fetchTicketPage(projectId, { ...params, status, sort: "rank" })
+    )
+  );
+
+  return {
+    tickets: pages.flatMap((page) => page.items),
+    cursors: Object.fromEntries(
+      statuses.map((status, i) => [status, pages[i].next_cursor])
+    ),
+    // Columns may be read a few writes apart: sync from the oldest
+    version: Math.min(...pages.map((page) => page.version)),
+  };
+};
+
+// 🔹 Append a page, skipping tickets a live update already added
+export const appendPage = (tickets, items) => {
+  const seen = new Set(tickets.map((t) => t.id));
+  return [...tickets, ...items.filter((t) => !seen.has(t.id))];
+};
+
+// 🔹 Pull only what changed since `version` and merge it into `tickets`.
+// Returns null when the server no longer has that history: reload instead.
+export const syncTickets = async (projectId, tickets, version) => {
+  let merged = tickets;
+  let hasMore = true;
+
+  try {
+    while (hasMore) {
+      const res = await api.get(`/tickets/projects/${projectId}/changes`, {
+        params: { since: version },
+      });
+      const { changed, deleted } = res.data;
+      const dropped = new Set([...deleted, ...changed.map((t) => t.id)]);
+
+      merged = [...changed, ...merged.filter((t) => !dropped.has(t.id))];
+      version = res.data.version;
+      hasMore = res.data.has_more;
+    }
+  } catch (err) {
+    if (err.response?.status !== 410) throw err;
+    return null;
+  }
+
+  return { tickets: merged, version };
+};
@@ -1,9 +1,15 @@
-import { useDraggable } from "@dnd-kit/core";
+import { useDraggable, useDroppable } from "@dnd-kit/core";
 
 export default function Card({ ticket, onOpen }) {
   const { attributes, listeners, setNodeRef, transform } =
     useDraggable({ id: ticket.id });
 
+  // 🔹 Dropping on a card places the dragged card above it
+  const { setNodeRef: setDropRef } = useDroppable({
+    id: `card-${ticket.id}`,
+    data: { ticket }
+  });
+
   const style = transform
     ? {
         transform: `translate3d(${transform.x}px, ${transform.y}px, 0)`
@@ -27,7 +33,10 @@ export default function Card({ ticket, onOpen }) {
 
   return (
     <div
-      ref={setNodeRef}
+      ref={(node) => {
+        setNodeRef(node);
+        setDropRef(node);
+      }}
       style={style}
       {...attributes}
       {...listeners}
@@ -1,8 +1,29 @@
+import { useEffect, useRef } from "react";
 import { useDroppable } from "@dnd-kit/core";
 import Card from "./Card";
 
-export default function Column({ id, title, tickets, onOpenTicket }) {
+export default function Column({
+  id,
+  title,
+  tickets,
+  hasMore = false,
+  onLoadMore,
+  onOpenTicket
+}) {
   const { setNodeRef } = useDroppable({ id });
+  const end = useRef(null);
+
+  // 🔹 Load the next page once the end of the column scrolls into view
+  useEffect(() => {
+    if (!hasMore || !end.current) return;
+
+    const observer = new IntersectionObserver(([entry]) => {
+      if (entry.isIntersecting) onLoadMore();
+    });
+    observer.observe(end.current);
+
+    return () => observer.disconnect();
+  }, [hasMore, onLoadMore]);
 
   return (
     <div ref={setNodeRef} className="bg-gray-100 p-4 rounded-xl min-h-[400px]">
@@ -15,6 +36,12 @@ export default function Column({ id, title, tickets, onOpenTicket }) {
           onOpen={onOpenTicket}   // ✅ pass handler
         />
       ))}
+
+      {hasMore && (
+        <div ref={end} className="text-center text-sm text-gray-400 py-2">
+          Loading more…
+        </div>
+      )}
     </div>
   );
 }
@@ -7,7 +7,12 @@ export default function CommentSection({ ticketId }) {
 
   const fetchComments = async () => {
     const res = await axios.get(
-      `http://localhost:8001/comments/tickets/${ticketId}`
+      `http://localhost:8001/comments/tickets/${ticketId}`,
+      {
+        headers: {
+          Authorization: `Bearer ${localStorage.getItem("token")}`,
+        },
+      }
     );
     setComments(res.data);
   };
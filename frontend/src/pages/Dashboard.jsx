@@ -6,6 +6,7 @@ import api from "../api/axios";
 
 const Dashboard = () => {
   const [tickets, setTickets] = useState([]);
+  const [stats, setStats] = useState(null);
   const [activeProject, setActiveProject] = useState(null);
 
   // 🔹 Get first project automatically
@@ -24,29 +25,33 @@ const Dashboard = () => {
     loadProject();
   }, []);
 
-  // 🔹 Load tickets for active project
+  // 🔹 Load counters + latest tickets for active project
   useEffect(() => {
     if (!activeProject) return;
 
-    const loadTickets = async () => {
+    const loadDashboard = async () => {
       try {
-        const res = await api.get(
-          `/tickets/projects/${activeProject}`
-        );
-        setTickets(res.data);
+        const [statsRes, ticketsRes] = await Promise.all([
+          api.get(`/projects/${activeProject}/stats`),
+          api.get(`/tickets/projects/${activeProject}`, {
+            params: { limit: 3, sort: "updated_at" },
+          }),
+        ]);
+        setStats(statsRes.data);
+        setTickets(ticketsRes.data.items);
       } catch (err) {
         console.error(err);
       }
     };
 
-    loadTickets();
+    loadDashboard();
   }, [activeProject]);
 
-  // 🔹 Calculate progress
-  const total = tickets.length;
-  const completed = tickets.filter(
-    (t) => t.status === "done"
-  ).length;
+  // 🔹 Calculate progress (archived tickets count as part of the total)
+  const total = stats?.total ?? 0;
+  const archived = stats?.archived ?? 0;
+  const completed =
+    (stats?.by_status.done ?? 0) + (stats?.archived_by_status.done ?? 0);
 
   const progress =
     total === 0 ? 0 : Math.round((completed / total) * 100);
@@ -74,7 +79,8 @@ const Dashboard = () => {
               <div className="h-64 flex items-center justify-center text-gray-400">
                 {total === 0
                   ? "No tickets yet"
-                  : `Total Tickets: ${total}`}
+                  : `Total Tickets: ${total}` +
+                    (archived ? ` (${archived} archived)` : "")}
               </div>
             </div>
 
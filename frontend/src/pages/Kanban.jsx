@@ -1,14 +1,29 @@
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import axios from "axios";
 import { DndContext } from "@dnd-kit/core";
 import { useParams } from "react-router-dom";
 import Column from "../components/Column";
+import {
+  appendPage,
+  fetchBoard,
+  fetchTicketPage,
+  syncTickets
+} from "../api/tickets";
+import { subscribeToProject, applyTicketEvent } from "../api/events";
 import TicketModal from "../components/TicketModal";
 
+const STATUSES = ["todo", "in_progress", "done"];
+
 export default function Kanban() {
   const { projectId } = useParams();
 
   const [tickets, setTickets] = useState([]);
+  // Next page of each column, null once it is fully loaded
+  const [cursors, setCursors] = useState({});
+  const loading = useRef({});
+  const reloads = useRef(0);
+  const version = useRef(0);
+  const ticketsRef = useRef([]);
   const [selectedTicket, setSelectedTicket] = useState(null);
 
   // 🔥 Full Filters State
@@ -19,33 +34,53 @@ export default function Kanban() {
     search: ""
   });
 
-  // 🔥 Fetch Tickets With Filters
+  const filterParams = () => {
+    const params = {};
+
+    if (filters.priority) params.priority = filters.priority;
+    if (filters.assignee_id) params.assignee_id = filters.assignee_id;
+    if (filters.search) params.search = filters.search;
+
+    return params;
+  };
+
+  // 🔥 Fetch The First Page Of Each Column With Filters
   const fetchTickets = async () => {
     if (!projectId) return;
 
     try {
-      const token = localStorage.getItem("token");
-
-      const queryParams = new URLSearchParams();
+      const statuses = filters.status ? [filters.status] : STATUSES;
+      reloads.current += 1;
+      const result = await fetchBoard(projectId, statuses, filterParams());
+      version.current = result.version;
+      setCursors(result.cursors);
+      setTickets(result.tickets);
+    } catch (error) {
+      console.error("Error fetching tickets:", error);
+    }
+  };
 
-      if (filters.status) queryParams.append("status", filters.status);
-      if (filters.priority) queryParams.append("priority", filters.priority);
-      if (filters.assignee_id)
-        queryParams.append("assignee_id", filters.assignee_id);
-      if (filters.search) queryParams.append("search", filters.search);
+  // 🔥 Next Page Of One Column (when its end scrolls into view)
+  const loadMore = async (status) => {
+    const cursor = cursors[status];
+    if (!cursor || loading.current[status]) return;
 
-      const res = await axios.get(
-        `http://localhost:8001/tickets/projects/${projectId}?${queryParams.toString()}`,
-        {
-          headers: {
-            Authorization: `Bearer ${token}`
-          }
-        }
+    const reload = reloads.current;
+    loading.current[status] = true;
+    try {
+      const page = await fetchTicketPage(
+        projectId,
+        { ...filterParams(), status, sort: "rank" },
+        cursor
       );
-
-      setTickets(res.data);
+      // A reload while this page was on its way replaced the cursors
+      if (reload !== reloads.current) return;
+      setTickets(prev => appendPage(prev, page.items));
+      setCursors(prev => ({ ...prev, [status]: page.next_cursor }));
     } catch (error) {
-      console.error("Error fetching tickets:", error);
+      console.error("Error loading tickets:", error);
+    } finally {
+      loading.current[status] = false;
     }
   };
 
@@ -54,23 +89,86 @@ export default function Kanban() {
     fetchTickets();
   }, [projectId, filters]);
 
-  // 🔥 Group For Kanban Columns
+  useEffect(() => {
+    ticketsRef.current = tickets;
+  }, [tickets]);
+
+  // 🔥 Live Updates: apply deltas instead of refetching the board
+  useEffect(() => {
+    if (!projectId) return;
+
+    const matches = (t) =>
+      (!filters.status || t.status === filters.status) &&
+      (!filters.priority || t.priority === filters.priority) &&
+      (!filters.assignee_id || t.assignee_id === Number(filters.assignee_id));
+
+    const onTicket = (type) => (data) => {
+      // Text search is ranked server-side; let the server decide
+      if (filters.search) return fetchTickets();
+      setTickets(prev => applyTicketEvent(prev, type, data, matches));
+    };
+
+    // Fell behind the live stream: fetch just the missed changes
+    const resync = async () => {
+      if (filters.search) return fetchTickets();
+      try {
+        const result = await syncTickets(
+          projectId,
+          ticketsRef.current,
+          version.current
+        );
+        if (!result) return fetchTickets();
+        version.current = result.version;
+        setTickets(result.tickets.filter(matches));
+      } catch (error) {
+        console.error("Sync failed:", error);
+      }
+    };
+
+    return subscribeToProject(projectId, {
+      "ticket.created": onTicket("ticket.created"),
+      "ticket.updated": onTicket("ticket.updated"),
+      "ticket.deleted": onTicket("ticket.deleted"),
+      resync
+    });
+  }, [projectId, filters]);
+
+  // 🔥 Group For Kanban Columns (in card order)
+  const byRank = (a, b) =>
+    a.rank < b.rank ? -1 : a.rank > b.rank ? 1 : a.id - b.id;
+  const column = (status) =>
+    tickets.filter(t => t.status === status).sort(byRank);
   const grouped = {
-    todo: tickets.filter(t => t.status === "todo"),
-    in_progress: tickets.filter(t => t.status === "in_progress"),
-    done: tickets.filter(t => t.status === "done")
+    todo: column("todo"),
+    in_progress: column("in_progress"),
+    done: column("done")
   };
 
-  // 🔥 Drag Logic (Unchanged)
+  // 🔥 Drag Logic: drop on a card to go above it, on a column to go last
   const handleDragEnd = async (event) => {
     const { active, over } = event;
     if (!over) return;
 
     const ticketId = Number(active.id);
-    const newStatus = over.id;
+    const target = over.data.current?.ticket;
+    const newStatus = target ? target.status : over.id;
 
     const oldTicket = tickets.find(t => t.id === ticketId);
-    if (!oldTicket || oldTicket.status === newStatus) return;
+    if (!oldTicket || target?.id === ticketId) return;
+    if (!target && oldTicket.status === newStatus) return;
+
+    const cards = grouped[newStatus].filter(t => t.id !== ticketId);
+    const index = target
+      ? cards.findIndex(t => t.id === target.id)
+      : cards.length;
+    // Dropped on a column with unloaded cards: no neighbours, the server
+    // puts it after the real last card
+    const toEnd = !target && cursors[newStatus];
+    const move = {
+      status: newStatus,
+      after_id: toEnd ? null : cards[index - 1]?.id ?? null,
+      before_id: cards[index]?.id ?? null
+    };
 
     const token = localStorage.getItem("token");
 
@@ -84,17 +182,23 @@ export default function Kanban() {
     );
 
     try {
-      await axios.patch(
-        `http://localhost:8001/tickets/${ticketId}`,
-        { status: newStatus },
+      const res = await axios.post(
+        `http://localhost:8001/tickets/${ticketId}/move`,
+        move,
         {
           headers: {
             Authorization: `Bearer ${token}`
           }
         }
       );
+      setTickets(prev =>
+        prev.map(ticket => (ticket.id === ticketId ? res.data : ticket))
+      );
     } catch (error) {
-      console.error("Status update failed:", error);
+      console.error("Move failed:", error);
+
+      // Neighbours moved meanwhile: reload instead of guessing
+      if (error.response?.status === 409) return fetchTickets();
 
       // Rollback
       setTickets(prev =>
@@ -170,18 +274,24 @@ export default function Kanban() {
             id="todo"
             title="Todo"
             tickets={grouped.todo}
+            hasMore={Boolean(cursors.todo)}
+            onLoadMore={() => loadMore("todo")}
             onOpenTicket={setSelectedTicket}
           />
           <Column
             id="in_progress"
             title="In Progress"
             tickets={grouped.in_progress}
+            hasMore={Boolean(cursors.in_progress)}
+            onLoadMore={() => loadMore("in_progress")}
             onOpenTicket={setSelectedTicket}
           />
           <Column
             id="done"
             title="Done"
             tickets={grouped.done}
+            hasMore={Boolean(cursors.done)}
+            onLoadMore={() => loadMore("done")}
             onOpenTicket={setSelectedTicket}
           />
         </div>
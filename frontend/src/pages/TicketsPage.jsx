@@ -1,26 +1,59 @@
 import { useEffect, useState } from "react";
 import { useParams } from "react-router-dom";
-import api from "../api/axios";
+import { appendPage, fetchTicketPage } from "../api/tickets";
+import { subscribeToProject, applyTicketEvent } from "../api/events";
 import TicketForm from "../components/TicketForm";
 
 const TicketsPage = () => {
   const { projectId } = useParams();
   const [tickets, setTickets] = useState([]);
+  const [cursor, setCursor] = useState(null);
+  const [loading, setLoading] = useState(false);
 
+  // 🔹 First page (newest first); later pages on demand
   const fetchTickets = async () => {
     try {
-      const res = await api.get(`/tickets/projects/${projectId}`);
-      setTickets(res.data);
+      const page = await fetchTicketPage(projectId);
+      setTickets(page.items);
+      setCursor(page.next_cursor);
     } catch (err) {
       console.error("Error fetching tickets:", err);
     }
   };
 
+  const loadMore = async () => {
+    setLoading(true);
+    try {
+      const page = await fetchTicketPage(projectId, {}, cursor);
+      setTickets((prev) => appendPage(prev, page.items));
+      setCursor(page.next_cursor);
+    } catch (err) {
+      console.error("Error loading tickets:", err);
+    } finally {
+      setLoading(false);
+    }
+  };
+
   useEffect(() => {
     if (!projectId) return;
     fetchTickets();
   }, [projectId]);
 
+  // 🔹 Live updates from other users
+  useEffect(() => {
+    if (!projectId) return;
+
+    const onTicket = (type) => (data) =>
+      setTickets((prev) => applyTicketEvent(prev, type, data));
+
+    return subscribeToProject(projectId, {
+      "ticket.created": onTicket("ticket.created"),
+      "ticket.updated": onTicket("ticket.updated"),
+      "ticket.deleted": onTicket("ticket.deleted"),
+      resync: fetchTickets,
+    });
+  }, [projectId]);
+
   return (
     <div className="max-w-5xl mx-auto">
       <h1 className="text-2xl font-semibold mb-6">
@@ -50,6 +83,16 @@ const TicketsPage = () => {
           </li>
         )}
       </ul>
+
+      {cursor && (
+        <button
+          onClick={loadMore}
+          disabled={loading}
+          className="mt-4 w-full py-2 text-sm text-blue-600 bg-white rounded border disabled:opacity-50"
+        >
+          {loading ? "Loading…" : "Load more"}
+        </button>
+      )}
     </div>
   );
 };
@@ -0,0 +1,45 @@
+"""
+Move tickets done for more than ARCHIVE_AFTER_DAYS days into the archive.
+
+    python -m scripts.archive_tickets                   # once (cron)
+    python -m scripts.archive_tickets --every 3600      # keep running
+    python -m scripts.archive_tickets --days 90
+
+Archived tickets stay readable with ?include_archived=true and come back
+with POST /tickets/{id}/restore.
+"""
+import argparse
+import time
+
+from app.core.activity import activity_writer
+from app.core.archive import ARCHIVE_BATCH_SIZE, archive_done_tickets
+from app.core.config import settings
+from app.core.database import SessionLocal
+
+
+def run_once(args):
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        archived = archive_done_tickets(db, args.days, args.batch_size)
+    activity_writer.flush()
+    print(f"✅ Archived {archived} tickets in {time.perf_counter() - started:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--every", type=float, help="seconds between runs (default: run once)")
+    parser.add_argument("--days", type=int, default=settings.archive_after_days)
+    parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE)
+    args = parser.parse_args()
+
+    try:
+        run_once(args)
+        while args.every:
+            time.sleep(args.every)
+            run_once(args)
+    finally:
+        activity_writer.close()
+
+
+if __name__ == "__main__":
+    main()
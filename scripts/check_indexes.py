@@ -0,0 +1,203 @@
+"""
+Fail if a hot route's query would scan a whole table instead of an index.
+
+    alembic upgrade head && python -m scripts.check_indexes
+    python -m scripts.check_indexes --database-url sqlite:///ci.db
+
+EXPLAINs the statements behind the board, delta sync, comments,
+activity, notifications, job claims and membership checks against the
+migrated schema. On Postgres sequential scans are disabled for the
+check, so a Seq Scan in the plan means no index can serve the query at
+all (small tables would otherwise be scanned anyway).
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timezone
+
+
+def hot_queries(db) -> dict:
+    """
+    Route -> (statement, table that must be reached through an index).
+    Shaped like the routes' own queries, with sample parameters.
+    """
+    from app.models.archived_ticket import ArchivedTicket
+    from app.models.comment import Comment
+    from app.models.job import Job
+    from app.models.notification import Notification
+    from app.models.project_member import ProjectMember
+    from app.models.ticket import Ticket, TicketPriority, TicketStatus
+    from app.models.ticket_event import TicketEvent
+    from app.models.ticket_tombstone import TicketTombstone
+
+    board = db.query(Ticket).filter(Ticket.project_id == 1)
+    newest = (Ticket.created_at.desc(), Ticket.id.desc())
+    cutoff = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    return {
+        "board": (board.order_by(*newest).limit(51), "tickets"),
+        "board ?status=&priority=": (
+            board.filter(
+                Ticket.status == TicketStatus.todo,
+                Ticket.priority == TicketPriority.high,
+            ).order_by(*newest).limit(51),
+            "tickets",
+        ),
+        "board ?assignee_id=": (
+            board.filter(Ticket.assignee_id == 2).order_by(*newest).limit(51),
+            "tickets",
+        ),
+        "board ?sort=rank&status=": (
+            board.filter(Ticket.status == TicketStatus.todo)
+            .order_by(Ticket.rank, Ticket.id).limit(51),
+            "tickets",
+        ),
+        "board ?sort=updated_at": (
+            board.order_by(Ticket.updated_at.desc(), Ticket.id.desc()).limit(51),
+            "tickets",
+        ),
+        "changes": (
+            board.filter(Ticket.version > 10).order_by(Ticket.version, Ticket.id).limit(501),
+            "tickets",
+        ),
+        "changes (deleted)": (
+            db.query(TicketTombstone.ticket_id).filter(
+                TicketTombstone.project_id == 1,
+                TicketTombstone.version > 10,
+                TicketTombstone.version <= 20,
+            ),
+            "ticket_tombstones",
+        ),
+        "comments": (
+            db.query(Comment).filter(Comment.ticket_id == 1)
+            .order_by(Comment.created_at, Comment.id),
+            "comments",
+        ),
+        "comment tree roots": (
+            db.query(Comment.id, Comment.created_at)
+            .filter(Comment.ticket_id == 1, Comment.parent_id.is_(None))
+            .order_by(Comment.created_at, Comment.id).limit(51),
+            "comments",
+        ),
+        "comment replies": (
+            db.query(Comment.id).filter(Comment.ticket_id == 1, Comment.parent_id == 1),
+            "comments",
+        ),
+        "activity": (
+            db.query(TicketEvent).filter(TicketEvent.ticket_id == 1)
+            .order_by(TicketEvent.created_at.desc(), TicketEvent.id.desc()).limit(51),
+            "ticket_events",
+        ),
+        "membership": (
+            db.query(ProjectMember.project_id).filter(ProjectMember.user_id == 2),
+            "project_members",
+        ),
+        "project members": (
+            db.query(ProjectMember.user_id).filter(ProjectMember.project_id == 1),
+            "project_members",
+        ),
+        "include_archived": (
+            db.query(ArchivedTicket).filter(ArchivedTicket.project_id == 1)
+            .order_by(ArchivedTicket.created_at.desc(), ArchivedTicket.id.desc()).limit(51),
+            "archived_tickets",
+        ),
+        "archive run": (
+            db.query(Ticket.id).filter(
+                Ticket.status == TicketStatus.done,
+                Ticket.updated_at < cutoff,
+            ).order_by(Ticket.id).limit(500),
+            "tickets",
+        ),
+        "notifications": (
+            db.query(Notification).filter(Notification.user_id == 2)
+            .order_by(Notification.created_at.desc(), Notification.id.desc()).limit(51),
+            "notifications",
+        ),
+        "job claim": (
+            db.query(Job.id, Job.run_at).filter(Job.run_at <= cutoff)
+            .order_by(Job.run_at).limit(1),
+            "jobs",
+        ),
+        "deleted ticket cleanup": (
+            db.query(Comment.id).filter(Comment.ticket_id.is_(None)),
+            "comments",
+        ),
+    }
+
+
+def _sql(db, query) -> str:
+    return str(query.statement.compile(
+        dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}
+    ))
+
+
+def _sqlite_scans(db, sql: str, table: str) -> tuple[list[str], list[str]]:
+    details = [row[-1] for row in db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+    # "SCAN t" reads every row; "SEARCH t USING INDEX" / "SCAN t USING
+    # INDEX" (walking an index in ORDER BY order) do not
+    scans = [detail for detail in details if detail == f"SCAN {table}"]
+    return scans, details
+
+
+def _postgres_scans(db, sql: str, table: str) -> tuple[list[str], list[str]]:
+    connection = db.connection()
+    connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar()
+
+    scanned, stack = [], [plan[0]["Plan"]]
+    while stack:
+        node = stack.pop()
+        if "Relation Name" in node:
+            scanned.append(node)
+        stack.extend(node.get("Plans", ()))
+
+    def describe(node):
+        index = f" using {node['Index Name']}" if "Index Name" in node else ""
+        return f"{node['Node Type']} on {node['Relation Name']}{index}"
+
+    scans = [
+        describe(node) for node in scanned
+        if node["Node Type"] == "Seq Scan" and node["Relation Name"] == table
+    ]
+    return scans, [describe(node) for node in scanned]
+
+
+def check(db) -> dict[str, tuple[list[str], list[str]]]:
+    """
+    Route -> (whole-table scans of its table, every step of the plan).
+    Also run by tests/test_indexes.py against a freshly migrated schema.
+    """
+    explain = _postgres_scans if db.get_bind().dialect.name == "postgresql" else _sqlite_scans
+    plans = {}
+    for route, (query, table) in hot_queries(db).items():
+        plans[route] = explain(db, _sql(db, query), table)
+        db.rollback()
+    return plans
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--database-url", help="defaults to DATABASE_URL")
+    parser.add_argument("--verbose", action="store_true", help="print every plan")
+    args = parser.parse_args()
+
+    if args.database_url:
+        # Must be set before app.core.database creates the engine
+        os.environ["DATABASE_URL"] = args.database_url
+
+    from app.core.database import SessionLocal
+
+    failures = 0
+    with SessionLocal() as db:
+        for route, (scans, details) in check(db).items():
+            status = "❌" if scans else "✅"
+            failures += bool(scans)
+            plan = "; ".join(details) if args.verbose or scans else ""
+            print(f"{status} {route:<28} {plan}".rstrip())
+
+    if failures:
+        sys.exit(f"{failures} hot queries scan a whole table")
+
+
+if __name__ == "__main__":
+    main()
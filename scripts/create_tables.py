@@ -1,12 +1,42 @@
-from app.core.database import Base, engine
+"""
+Create or upgrade the database schema (alembic upgrade head).
 
-# Import all models so SQLAlchemy registers them
-from app.models import user
-from app.models import project
-from app.models import project_member
-from app.models import ticket
-from app.models import comment
+    python -m scripts.create_tables
 
-Base.metadata.create_all(bind=engine)
+A database built with create_all before there were migrations is
+stamped at the baseline (the original tables) and upgraded from there.
+"""
+from pathlib import Path
 
-print("✅ Tables created successfully")
\ No newline at end of file
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
+from app.core.database import get_engine
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+BASELINE = "0001"
+
+
+def upgrade(config: Config):
+    """
+    Bring the database to the latest revision. Uses the connection in
+    ``config.attributes["connection"]`` when there is one.
+    """
+    connection = config.attributes.get("connection")
+    tables = inspect(connection or get_engine()).get_table_names()
+    if connection is not None:
+        connection.commit()  # migrations manage their own transactions
+    if "tickets" in tables and "alembic_version" not in tables:
+        # Built with create_all before there were migrations: adopt it
+        command.stamp(config, BASELINE)
+    command.upgrade(config, "head")
+
+
+def main():
+    upgrade(Config(str(ALEMBIC_INI)))
+    print("✅ Tables created successfully")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Bulk-load tickets or comments from an NDJSON/CSV export.
+
+    python -m scripts.import_data tickets old_tickets.ndjson --project 1 --user 1
+    python -m scripts.import_data comments old_comments.csv --project 1 --user 1
+
+Progress is checkpointed to ``<file>.checkpoint`` after every chunk;
+rerunning the same command resumes where the last run stopped. The refs
+of imported rows are stored with each chunk, so comments resolve their
+``ticket_ref`` / ``parent_ref`` across chunks, runs and files.
+"""
+import argparse
+import csv
+import json
+import os
+from itertools import islice
+
+from app.core.database import SessionLocal
+from app.core.importer import (
+    IMPORT_CHUNK_SIZE,
+    IMPORT_FORMATS,
+    import_comments,
+    import_tickets,
+    read_rows,
+)
+
+IMPORTERS = {
+    "tickets": import_tickets,
+    "comments": import_comments,
+}
+
+
+def load_checkpoint(path: str) -> int:
+    if not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        return json.load(f)["offset"]
+
+
+def save_checkpoint(path: str, offset: int):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"offset": offset}, f)
+    os.replace(tmp, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("kind", choices=IMPORTERS)
+    parser.add_argument("path")
+    parser.add_argument("--project", type=int, required=True)
+    parser.add_argument("--user", type=int, required=True, help="reporter / comment author")
+    parser.add_argument("--format", choices=IMPORT_FORMATS)
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    parser.add_argument("--id-map", help="append the ref,id pairs of imported rows to this CSV")
+    args = parser.parse_args()
+
+    format = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+    checkpoint = f"{args.path}.checkpoint"
+    start = load_checkpoint(checkpoint)
+    if start:
+        print(f"↩️  Resuming at row {start}")
+
+    id_map = {}
+    map_file = open(args.id_map, "a", newline="") if args.id_map else None
+    mapped = 0
+
+    def on_chunk(report):
+        nonlocal mapped
+        if map_file is not None:
+            # Refs are only appended, so write the ones added by this chunk
+            csv.writer(map_file).writerows(islice(id_map.items(), mapped, None))
+            map_file.flush()
+            mapped = len(id_map)
+        save_checkpoint(checkpoint, report.next_offset)
+        print(
+            f"  {report.next_offset} rows, {report.imported} imported, "
+            f"{report.failed} failed, {report.rows_per_second:.0f} rows/s"
+        )
+
+    with SessionLocal() as db, open(args.path, newline="", encoding="utf-8") as f:
+        report = IMPORTERS[args.kind](
+            db,
+            args.project,
+            args.user,
+            read_rows(f, format),
+            start=start,
+            chunk_size=args.chunk_size,
+            on_chunk=on_chunk,
+            id_map=id_map if args.id_map else None,
+        )
+
+    if map_file is not None:
+        map_file.close()
+    if not report.aborted and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    for error in report.errors:
+        print(f"  row {error['row']}: {error['error']}")
+    print(
+        f"✅ Imported {report.imported} {args.kind} ({report.failed} failed) "
+        f"in {report.seconds:.1f}s, {report.rows_per_second:.0f} rows/s"
+    )
+    if report.aborted:
+        print(f"❌ Stopped at row {report.aborted['row']}: {report.aborted['error']}")
+        print("   Fix or remove that row and rerun to resume from it")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
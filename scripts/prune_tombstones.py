@@ -0,0 +1,42 @@
+"""
+Drop delete tombstones older than TOMBSTONE_RETENTION_DAYS days.
+
+    python -m scripts.prune_tombstones                  # once (cron)
+    python -m scripts.prune_tombstones --every 86400    # keep running
+    python -m scripts.prune_tombstones --days 7
+
+Delta-sync clients whose token predates the pruned deletes get a 410
+from GET /tickets/projects/{id}/changes and reload the project instead.
+"""
+import argparse
+import time
+from datetime import timedelta
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.versioning import prune_tombstones
+from app.models.ticket import utcnow
+
+
+def run_once(args):
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        pruned = prune_tombstones(db, utcnow() - timedelta(days=args.days))
+        db.commit()
+    print(f"✅ Pruned {pruned} tombstones in {time.perf_counter() - started:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--every", type=float, help="seconds between runs (default: run once)")
+    parser.add_argument("--days", type=int, default=settings.tombstone_retention_days)
+    args = parser.parse_args()
+
+    run_once(args)
+    while args.every:
+        time.sleep(args.every)
+        run_once(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Roll new ticket activity into the analytics tables.
+
+    python -m scripts.refresh_analytics                 # once (cron)
+    python -m scripts.refresh_analytics --every 300     # keep running
+    python -m scripts.refresh_analytics --rebuild       # start over
+
+The first run builds the rollups from the whole activity log. Every run
+then checks them against the project counters and reports any gap: one
+that is still there on the next run means activity events were lost (or
+tickets imported), and --rebuild repairs it, replaying the log again and
+truing the rollups up with the tickets, history kept.
+"""
+import argparse
+import time
+
+from app.core.analytics import REFRESH_BATCH_SIZE, SETTLE_SECONDS, rebuild, reconcile, refresh
+from app.core.database import SessionLocal
+
+
+def run_once(args):
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        if args.rebuild:
+            consumed = rebuild(db, args.batch_size, args.settle_seconds)
+        else:
+            consumed = refresh(db, args.batch_size, args.settle_seconds)
+        gaps = reconcile(db)
+    print(f"✅ Rolled up {consumed} events in {time.perf_counter() - started:.1f}s")
+    for gap in gaps:
+        print(
+            f"⚠️  Project {gap['project_id']} {gap['status']}: {gap['rolled_up']} in "
+            f"{gap['rollup']}, {gap['tickets']} tickets"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--every", type=float, help="seconds between runs (default: run once)")
+    parser.add_argument("--rebuild", action="store_true", help="drop the rollups and replay")
+    parser.add_argument("--batch-size", type=int, default=REFRESH_BATCH_SIZE)
+    parser.add_argument("--settle-seconds", type=float, default=SETTLE_SECONDS)
+    args = parser.parse_args()
+
+    run_once(args)
+    args.rebuild = False
+    while args.every:
+        time.sleep(args.every)
+        run_once(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Run background jobs (notifications, cleanup) outside the API processes.
+
+    python -m scripts.run_jobs                  # keep running
+    python -m scripts.run_jobs --workers 4
+    python -m scripts.run_jobs --once           # drain what is due, then exit
+
+The API runs JOB_WORKERS workers itself; set JOB_WORKERS=0 there to
+leave jobs to this instead. Both can run at once on Postgres.
+"""
+import argparse
+import signal
+import threading
+import time
+
+from app.core.activity import activity_writer
+from app.core.config import settings
+from app.core.jobs import job_queue
+import app.main  # noqa: F401 (the route modules register the handlers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--workers", type=int, default=max(settings.job_workers, 1))
+    parser.add_argument("--once", action="store_true", help="run due jobs, then exit")
+    args = parser.parse_args()
+
+    try:
+        if args.once:
+            started = time.perf_counter()
+            ran = job_queue.run_pending()
+            print(f"✅ Ran {ran} jobs in {time.perf_counter() - started:.1f}s")
+            return
+
+        stopped = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+        job_queue.start(args.workers)
+        print(f"⏳ Running jobs with {args.workers} workers (Ctrl+C to stop)")
+        try:
+            stopped.wait()
+        except KeyboardInterrupt:
+            pass
+        job_queue.stop()
+    finally:
+        activity_writer.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Shared fixtures: the app on a throwaway SQLite database, rebuilt for
+every test, and a TestClient with admin / developer credentials.
+
+    pip install pytest httpx && python -m pytest
+"""
+import os
+import tempfile
+from dataclasses import dataclass
+
+# Before anything imports app.core.config: settings are read once
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='tracker-tests-')}/test.db"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ["JOB_WORKERS"] = "0"  # tests run jobs with job_queue.run_pending()
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.activity import activity_writer
+from app.core.database import Base, SessionLocal, get_engine
+from app.core.permissions import membership_cache
+from app.core.search import search_index
+from app.core.security import create_access_token, principal_cache
+from app.models.user import User
+
+
+@dataclass
+class TestUser:
+    id: int
+    headers: dict
+
+
+@pytest.fixture(autouse=True)
+def database():
+    # Events from the previous test would land in the new tables
+    activity_writer.flush()
+    engine = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    # Ids start over with every database
+    principal_cache.clear()
+    membership_cache.clear()
+    search_index.invalidate()
+    yield
+    activity_writer.flush()
+
+
+@pytest.fixture
+def db():
+    with SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def client():
+    # No ``with``: the lifespan (job workers) stays off
+    return TestClient(app)
+
+
+@pytest.fixture
+def make_user(db):
+    def make(email: str, role: str = "developer") -> TestUser:
+        user = User(email=email, password="unused", role=role)
+        db.add(user)
+        db.commit()
+        token = create_access_token({"sub": str(user.id), "email": email})
+        return TestUser(id=user.id, headers={"Authorization": f"Bearer {token}"})
+    return make
+
+
+@pytest.fixture
+def admin(make_user) -> TestUser:
+    return make_user("admin@example.com", "admin")
+
+
+@pytest.fixture
+def developer(make_user) -> TestUser:
+    return make_user("dev@example.com")
+
+
+@pytest.fixture
+def project(client, admin, developer) -> int:
+    response = client.post("/projects/", json={"name": "Tracker"}, headers=admin.headers)
+    assert response.status_code == 200, response.text
+    project_id = response.json()["id"]
+    response = client.post(
+        f"/projects/{project_id}/members", json={"user_id": developer.id}, headers=admin.headers
+    )
+    assert response.status_code == 200, response.text
+    return project_id
+
+
+@pytest.fixture
+def make_ticket(client, admin, project):
+    def make(**fields) -> dict:
+        body = {"title": "Login page crashes", "description": "500 on submit", **fields}
+        response = client.post(f"/tickets/projects/{project}", json=body, headers=admin.headers)
+        assert response.status_code == 200, response.text
+        return response.json()
+    return make
@@ -0,0 +1,161 @@
+"""
+ActivityWriter: what it drops, what it waits for and what it counts.
+"""
+import logging
+import threading
+import time
+
+import pytest
+
+from app.core import activity
+from app.core.activity import ActivityWriter
+
+
+@pytest.fixture
+def writer():
+    writer = ActivityWriter(
+        max_queue=1, batch_size=1, flush_seconds=0, enqueue_timeout=0.01, flow_timeout=5
+    )
+    yield writer
+    writer.close()
+
+
+def test_full_buffer_drops_comments_but_waits_for_status_changes(writer, monkeypatch):
+    release = threading.Event()
+    real_session = activity.SessionLocal
+
+    def slow_session():
+        release.wait()
+        return real_session()
+
+    monkeypatch.setattr(activity, "SessionLocal", slow_session)
+
+    waiting = threading.Thread(
+        target=writer.record, args=(1, 1, None, "updated", "status", "todo", "done")
+    )
+    try:
+        # One event held by the writer thread, one filling the buffer
+        writer.record(1, 1, None, "commented")
+        while writer.queue.qsize():
+            time.sleep(0.001)
+        writer.record(1, 1, None, "commented")
+
+        writer.record(1, 1, None, "commented")
+        assert writer.stats()["dropped"] == 1
+
+        waiting.start()
+        waiting.join(0.1)
+        assert waiting.is_alive()
+    finally:
+        release.set()
+    waiting.join()
+    writer.flush()
+    assert writer.stats()["dropped"] == 1
+
+
+def test_status_change_is_written_inline_when_the_buffer_stays_full(writer, monkeypatch):
+    writer.flow_timeout = 0.01
+    release = threading.Event()
+    real_session = activity.SessionLocal
+
+    def stuck_writer_thread():
+        if threading.current_thread().name == "activity-writer":
+            release.wait()
+        return real_session()
+
+    monkeypatch.setattr(activity, "SessionLocal", stuck_writer_thread)
+    try:
+        writer.record(1, 1, None, "commented")
+        while writer.queue.qsize():
+            time.sleep(0.001)
+        writer.record(1, 1, None, "commented")
+
+        writer.record(1, 1, None, "updated", "status", "todo", "done")
+        stats = writer.stats()
+        assert (stats["inline"], stats["written"]) == (1, 1)
+    finally:
+        release.set()
+    writer.flush()
+    assert writer.stats()["written"] == 3
+
+
+def test_failed_batch_is_retried(writer, monkeypatch):
+    monkeypatch.setattr(activity, "RETRY_SECONDS", 0)
+    real_insert = writer._insert
+    failures = iter([RuntimeError("connection reset")] * 2)
+
+    def flaky_insert(events):
+        error = next(failures, None)
+        if error:
+            raise error
+        real_insert(events)
+
+    monkeypatch.setattr(writer, "_insert", flaky_insert)
+    writer.record(1, 1, None, "updated", "status", "todo", "done")
+    writer.flush()
+
+    stats = writer.stats()
+    assert (stats["written"], stats["retried"], stats["failed"]) == (1, 2, 0)
+
+
+def test_failed_batch_loses_only_the_event_it_cannot_write(monkeypatch):
+    monkeypatch.setattr(activity, "RETRY_SECONDS", 0)
+    writer = ActivityWriter(
+        max_queue=10, batch_size=3, flush_seconds=1, enqueue_timeout=0.01, flow_timeout=5
+    )
+    real_insert = writer._insert
+
+    def picky_insert(events):
+        if any(event["ticket_id"] == 2 for event in events):
+            raise RuntimeError("value too long")
+        real_insert(events)
+
+    monkeypatch.setattr(writer, "_insert", picky_insert)
+    try:
+        for ticket_id in (1, 2, 3):
+            writer.record(ticket_id, 1, None, "commented")
+        writer.flush()
+    finally:
+        writer.close()
+
+    stats = writer.stats()
+    assert (stats["written"], stats["failed"], stats["flow_lost"]) == (2, 1, 0)
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_dead_writer_thread_is_restarted(writer, monkeypatch):
+    def crash():
+        raise RuntimeError("unexpected")
+
+    writer.record(1, 1, None, "commented")
+    writer.flush()
+    first = writer._thread
+    # Dies once it has written this batch and asks for the next one
+    monkeypatch.setattr(writer, "_next_batch", crash)
+    writer.record(1, 1, None, "commented")
+    first.join(5)
+    assert not first.is_alive()
+    assert writer.stats()["alive"] == 0
+
+    monkeypatch.undo()
+    writer.record(1, 1, None, "updated", "status", "todo", "done")
+    writer.flush()
+    stats = writer.stats()
+    assert (stats["alive"], stats["restarts"], stats["written"]) == (1, 1, 3)
+
+
+def test_failed_writes_count_lost_flow_events(writer, monkeypatch, caplog):
+    def broken_session():
+        raise RuntimeError("database is down")
+
+    monkeypatch.setattr(activity, "RETRY_SECONDS", 0)
+    monkeypatch.setattr(activity, "SessionLocal", broken_session)
+    with caplog.at_level(logging.WARNING, logger="app.activity"):
+        writer.record(1, 1, None, "commented")
+        writer.record(1, 1, None, "updated", "status", "todo", "done")
+        writer.flush()
+
+    stats = writer.stats()
+    assert stats["failed"] == 2
+    assert stats["flow_lost"] == 1
+    assert "--rebuild" in caplog.text
@@ -0,0 +1,115 @@
+"""
+Analytics rollups reconciled against the project counters.
+"""
+from datetime import timedelta
+
+from sqlalchemy import select, update
+
+from app.core.activity import activity_writer
+from app.core.analytics import rebuild, reconcile, refresh
+from app.core.archive import archive_done_tickets
+from app.models.project_daily_flow import ProjectDailyFlow
+from app.models.ticket import utcnow
+from app.models.ticket_event import TicketEvent
+from app.models.ticket_flow import TicketFlow
+
+
+def refreshed(db):
+    activity_writer.flush()
+    refresh(db, settle_seconds=0)
+    return reconcile(db)
+
+
+def test_rollups_match_the_counters(client, admin, db, project, make_ticket):
+    ids = [make_ticket()["id"] for _ in range(3)]
+    assert refreshed(db) == []
+
+    client.patch(f"/tickets/{ids[0]}", json={"status": "in_progress"}, headers=admin.headers)
+    client.patch(f"/tickets/{ids[1]}", json={"status": "done"}, headers=admin.headers)
+    client.delete(f"/tickets/{ids[2]}", headers=admin.headers)
+    assert refreshed(db) == []
+
+    # Archived tickets stay in the rollups as done, also after a rebuild
+    assert archive_done_tickets(db, older_than_days=-1) == 1
+    assert refreshed(db) == []
+    rebuild(db, settle_seconds=0)
+    assert reconcile(db) == []
+
+
+def test_lost_status_change_is_flagged_until_rebuild(
+    client, admin, db, project, make_ticket, monkeypatch
+):
+    ticket_id = make_ticket()["id"]
+    assert refreshed(db) == []
+
+    with monkeypatch.context() as patch:
+        patch.setattr(activity_writer, "record_changes", lambda *args, **kwargs: None)
+        client.patch(f"/tickets/{ticket_id}", json={"status": "done"}, headers=admin.headers)
+
+    gaps = refreshed(db)
+    assert {(gap["rollup"], gap["status"], gap["rolled_up"], gap["tickets"]) for gap in gaps} == {
+        ("project_daily_flow", "todo", 1, 0),
+        ("project_daily_flow", "done", 0, 1),
+        ("ticket_flow", "todo", 1, 0),
+        ("ticket_flow", "done", 0, 1),
+    }
+    assert {gap["project_id"] for gap in gaps} == {project}
+
+    rebuild(db, settle_seconds=0)
+    assert reconcile(db) == []
+
+
+def snapshot(db):
+    daily = db.query(
+        ProjectDailyFlow.project_id, ProjectDailyFlow.day, ProjectDailyFlow.status,
+        ProjectDailyFlow.entered, ProjectDailyFlow.exited,
+    ).order_by(ProjectDailyFlow.day, ProjectDailyFlow.status).all()
+    flows = db.query(
+        TicketFlow.ticket_id, TicketFlow.status, TicketFlow.created_at,
+        TicketFlow.started_at, TicketFlow.done_at, TicketFlow.lead_seconds,
+    ).order_by(TicketFlow.ticket_id).all()
+    return daily, flows
+
+
+def test_rebuild_keeps_the_cumulative_flow_history(client, admin, db, project, make_ticket):
+    ticket_id = make_ticket()["id"]
+    client.patch(f"/tickets/{ticket_id}", json={"status": "in_progress"}, headers=admin.headers)
+    client.patch(f"/tickets/{ticket_id}", json={"status": "done"}, headers=admin.headers)
+    activity_writer.flush()
+
+    # Created three days ago, started two days ago, done yesterday
+    events = db.scalars(
+        select(TicketEvent.id).where(TicketEvent.ticket_id == ticket_id).order_by(TicketEvent.id)
+    ).all()
+    for days_ago, event_id in zip((3, 2, 1), events):
+        db.execute(
+            update(TicketEvent)
+            .where(TicketEvent.id == event_id)
+            .values(created_at=utcnow() - timedelta(days=days_ago))
+        )
+    db.commit()
+
+    assert refreshed(db) == []
+    before = snapshot(db)
+    assert len({row.day for row in before[0]}) == 3
+
+    rebuild(db, settle_seconds=0)
+    assert snapshot(db) == before
+    assert reconcile(db) == []
+
+
+def test_late_batch_waits_until_its_insert_settles(client, admin, db, project, make_ticket):
+    ticket_id = make_ticket()["id"]
+    assert refreshed(db) == []
+
+    # Happened an hour ago, but only written now (a slow batch)
+    db.add(TicketEvent(
+        ticket_id=ticket_id, project_id=project, action="updated", field="status",
+        old_value="todo", new_value="done", created_at=utcnow() - timedelta(hours=1),
+    ))
+    db.commit()
+    assert refresh(db, settle_seconds=60) == 0
+
+    db.execute(update(TicketEvent).values(recorded_at=utcnow() - timedelta(seconds=120)))
+    db.commit()
+    assert refresh(db, settle_seconds=60) == 1
@@ -0,0 +1,134 @@
+"""
+Archiving done tickets and restoring them: the ticket, its comment
+thread, the dashboard counters and search all come back as they were.
+"""
+import asyncio
+
+import pytest
+
+from app.core import archive
+from app.core.activity import activity_writer
+from app.core.archive import archive_done_tickets
+from app.core.search import search_index
+from app.routes import events as event_routes
+
+
+def search(client, headers, project_id, q, **params) -> list[dict]:
+    response = client.get(
+        "/search/", params={"project_id": project_id, "q": q, **params}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def comments(client, headers, ticket_id, **params):
+    response = client.get(f"/comments/tickets/{ticket_id}", params=params, headers=headers)
+    return response.status_code, [
+        (comment["id"], comment["parent_id"], comment["content"])
+        for comment in response.json()
+    ] if response.status_code == 200 else None
+
+
+@pytest.fixture
+def done_ticket(client, admin, project, make_ticket):
+    ticket = make_ticket(title="Flaky upload", description="Times out on large files")
+    root = client.post(
+        f"/comments/tickets/{ticket['id']}", json={"content": "Seen with zipfiles"}, headers=admin.headers
+    ).json()
+    client.post(
+        f"/comments/tickets/{ticket['id']}",
+        json={"content": "Same here", "parent_id": root["id"]},
+        headers=admin.headers,
+    )
+    make_ticket(title="Still open")
+    client.patch(f"/tickets/{ticket['id']}", json={"status": "done"}, headers=admin.headers)
+    return ticket["id"]
+
+
+def test_archive_and_restore_round_trip(client, admin, db, project, done_ticket):
+    board = lambda: {
+        ticket["id"]: ticket["status"]
+        for ticket in client.get(f"/tickets/projects/{project}", headers=admin.headers).json()["items"]
+    }
+    stats = lambda: client.get(f"/projects/{project}/stats", headers=admin.headers).json()
+
+    before_board, before_stats = board(), stats()
+    _, thread = comments(client, admin.headers, done_ticket)
+    assert [hit["ticket_id"] for hit in search(client, admin.headers, project, "zipfiles")] == [done_ticket]
+
+    assert archive_done_tickets(db, older_than_days=-1) == 1
+
+    assert done_ticket not in board()
+    assert comments(client, admin.headers, done_ticket)[0] == 404
+    assert comments(client, admin.headers, done_ticket, include_archived=True) == (200, thread)
+    assert stats()["total"] == before_stats["total"]
+    assert stats()["archived_by_status"] == {"done": 1}
+    assert search(client, admin.headers, project, "zipfiles") == []
+    hits = search(client, admin.headers, project, "zipfiles", include_archived=True)
+    assert [(hit["ticket_id"], hit["archived"]) for hit in hits] == [(done_ticket, True)]
+
+    response = client.post(f"/tickets/{done_ticket}/restore", headers=admin.headers)
+    assert response.status_code == 200, response.text
+
+    assert board() == before_board
+    assert comments(client, admin.headers, done_ticket) == (200, thread)
+    assert stats() == before_stats
+    hits = search(client, admin.headers, project, "zipfiles")
+    assert [(hit["ticket_id"], hit["archived"]) for hit in hits] == [(done_ticket, False)]
+    activity_writer.flush()
+    actions = [
+        event["action"] for event in
+        client.get(f"/tickets/{done_ticket}/activity", headers=admin.headers).json()["items"]
+    ]
+    assert actions[:2] == ["restored", "archived"]
+
+
+def test_restored_tickets_are_not_archived_again_straight_away(client, admin, db, done_ticket):
+    archive_done_tickets(db, older_than_days=-1)
+    client.post(f"/tickets/{done_ticket}/restore", headers=admin.headers)
+
+    assert archive_done_tickets(db, older_than_days=1) == 0
+    assert client.post(f"/tickets/{done_ticket}/restore", headers=admin.headers).status_code == 404
+
+
+@pytest.fixture
+def other_process(monkeypatch):
+    """
+    Archive as the scheduled script does: its resync and search
+    invalidation never reach the API worker.
+    """
+    monkeypatch.setattr(archive.search_index, "invalidate", lambda project_id: None)
+    monkeypatch.setattr(archive.events, "publish", lambda *args: None)
+
+
+def test_workers_drop_search_indexes_archived_elsewhere(
+    client, admin, db, project, done_ticket, other_process
+):
+    assert [hit["ticket_id"] for hit in search(client, admin.headers, project, "zipfiles")] == [done_ticket]
+    assert project in search_index.projects
+
+    archive_done_tickets(db, older_than_days=-1)
+
+    assert search(client, admin.headers, project, "zipfiles") == []
+
+
+def test_event_streams_resync_after_an_archive_elsewhere(
+    admin, db, project, done_ticket, other_process, monkeypatch
+):
+    monkeypatch.setattr(event_routes, "HEARTBEAT_SECONDS", 0.01)
+
+    class Connected:
+        async def is_disconnected(self):
+            return False
+
+    token = admin.headers["Authorization"].split()[1]
+
+    async def stream():
+        response = await event_routes.project_events(project, Connected(), token)
+        chunks = response.body_iterator
+        assert await anext(chunks) == ": connected\n\n"
+        assert await anext(chunks) == ": ping\n\n"
+        await asyncio.to_thread(archive_done_tickets, db, -1)
+        return [chunk async for chunk in chunks]
+
+    assert asyncio.run(stream())[-1] == "event: resync\ndata: null\n\n"
@@ -0,0 +1,47 @@
+"""
+Async read routes (GET /notifications) answer the same on the async
+engine (ASYNC_DB=true, aiosqlite here) as on the threadpool.
+"""
+from dataclasses import replace
+from datetime import timedelta
+
+import pytest
+
+from app.core import database
+from app.models.notification import Notification
+from app.models.ticket import utcnow
+
+
+@pytest.fixture(params=[False, True], ids=["threadpool", "aiosqlite"])
+def async_db(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("aiosqlite")
+    monkeypatch.setattr(database, "settings", replace(database.settings, async_db=request.param))
+    yield request.param
+    if database._async_engine is not None:
+        # Its connections belong to the event loop of the client that made them
+        database._async_engine.sync_engine.dispose()
+        database._async_engine = None
+
+
+def test_notifications_page_and_filter(client, developer, admin, db, project, async_db):
+    now = utcnow()
+    for i in range(5):
+        db.add(Notification(
+            user_id=developer.id, project_id=project, kind="assigned", message=f"#{i}",
+            created_at=now - timedelta(minutes=i), read_at=now if i % 2 else None,
+        ))
+    db.add(Notification(user_id=admin.id, project_id=project, kind="assigned", message="other"))
+    db.commit()
+
+    def page(**params):
+        response = client.get("/notifications/", params=params, headers=developer.headers)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        return [item["message"] for item in body["items"]], body["next_cursor"]
+
+    first, cursor = page(limit=3)
+    assert first == ["#0", "#1", "#2"]
+    assert page(limit=3, cursor=cursor) == (["#3", "#4"], None)
+    assert page(unread=True) == (["#0", "#2", "#4"], None)
+    assert (database._async_engine is not None) == async_db
@@ -0,0 +1,99 @@
+"""
+Bulk ticket routes (/tickets/bulk/...): the single-ticket RBAC, per item.
+"""
+import pytest
+
+
+def board(client, headers, project_id) -> dict:
+    response = client.get(f"/tickets/projects/{project_id}", headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def snapshot(client, admin, project_id):
+    page = board(client, admin.headers, project_id)
+    tickets = sorted(
+        (ticket["id"], ticket["title"], ticket["status"], ticket["assignee_id"])
+        for ticket in page["items"]
+    )
+    stats = client.get(f"/projects/{project_id}/stats", headers=admin.headers).json()
+    return page["version"], tickets, stats
+
+
+@pytest.fixture
+def viewer(client, admin, project, make_user):
+    user = make_user("viewer@example.com", "viewer")
+    client.post(f"/projects/{project}/members", json={"user_id": user.id}, headers=admin.headers)
+    return user
+
+
+@pytest.fixture
+def outsider(make_user):
+    return make_user("outsider@example.com")
+
+
+@pytest.mark.parametrize("route, body", [
+    ("update", {"changes": {"title": "Renamed"}}),
+    ("move", {"status": "done"}),
+])
+@pytest.mark.parametrize("who, error", [
+    ("outsider", "Not a member of this project"),
+    ("viewer", "Not allowed"),
+])
+def test_rejected_items_write_nothing(
+    request, client, admin, project, make_ticket, route, body, who, error
+):
+    user = request.getfixturevalue(who)
+    ids = [make_ticket(assignee_id=user.id)["id"] for _ in range(3)]
+    before = snapshot(client, admin, project)
+
+    response = client.post(f"/tickets/bulk/{route}", json={"ids": ids, **body}, headers=user.headers)
+
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert report["succeeded"] == 0
+    assert [(item["id"], item["ok"], item["error"]) for item in report["results"]] == [
+        (ticket_id, False, error) for ticket_id in ids
+    ]
+    assert snapshot(client, admin, project) == before
+
+
+def test_only_the_permitted_items_are_written(client, admin, developer, project, make_ticket):
+    mine = make_ticket(assignee_id=developer.id)["id"]
+    theirs = make_ticket()["id"]
+
+    response = client.post(
+        "/tickets/bulk/move", json={"ids": [theirs, mine], "status": "done"}, headers=developer.headers
+    )
+
+    report = response.json()
+    assert [(item["ok"], item["error"]) for item in report["results"]] == [
+        (False, "Not allowed"), (True, None)
+    ]
+    statuses = {ticket["id"]: ticket["status"] for ticket in board(client, admin.headers, project)["items"]}
+    assert statuses == {theirs: "todo", mine: "done"}
+
+
+@pytest.mark.parametrize("who", ["outsider", "viewer"])
+def test_create_and_delete_are_refused_outright(request, client, admin, project, make_ticket, who):
+    user = request.getfixturevalue(who)
+    ticket_id = make_ticket()["id"]
+    before = snapshot(client, admin, project)
+
+    response = client.post(
+        "/tickets/bulk/delete", json={"ids": [ticket_id]}, headers=user.headers
+    )
+    assert response.status_code == 403
+
+    response = client.post(
+        f"/tickets/bulk/projects/{project}",
+        json={"items": [{"title": "Sneaked in", "assignee_id": user.id}]},
+        headers=user.headers,
+    )
+    if who == "outsider":
+        assert response.status_code == 403
+    else:
+        assert response.json()["results"] == [
+            {"index": 0, "id": None, "ok": False, "error": "Only admin can assign tickets"}
+        ]
+    assert snapshot(client, admin, project) == before
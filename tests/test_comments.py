@@ -0,0 +1,84 @@
+"""
+GET /comments/tickets/{id}/tree: nesting, max_depth and root pagination.
+"""
+
+
+def reply(client, headers, ticket_id, content, parent_id=None) -> int:
+    response = client.post(
+        f"/comments/tickets/{ticket_id}",
+        json={"content": content, "parent_id": parent_id},
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+
+def shape(nodes) -> list:
+    return [
+        (node["content"], node["depth"], node["has_more_replies"], shape(node["replies"]))
+        for node in nodes
+    ]
+
+
+def tree(client, headers, ticket_id, **params) -> dict:
+    response = client.get(f"/comments/tickets/{ticket_id}/tree", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def thread(client, headers, ticket_id):
+    first = reply(client, headers, ticket_id, "first")
+    second = reply(client, headers, ticket_id, "second")
+    a = reply(client, headers, ticket_id, "a", first)
+    b = reply(client, headers, ticket_id, "b", a)
+    reply(client, headers, ticket_id, "c", b)
+    reply(client, headers, ticket_id, "d", first)
+    reply(client, headers, ticket_id, "e", second)
+    reply(client, headers, ticket_id, "third")
+
+
+def test_replies_nest_under_their_parents_oldest_first(client, admin, make_ticket):
+    ticket_id = make_ticket()["id"]
+    thread(client, admin.headers, ticket_id)
+
+    page = tree(client, admin.headers, ticket_id)
+
+    assert page["next_cursor"] is None
+    assert shape(page["items"]) == [
+        ("first", 0, False, [
+            ("a", 1, False, [
+                ("b", 2, False, [
+                    ("c", 3, False, []),
+                ]),
+            ]),
+            ("d", 1, False, []),
+        ]),
+        ("second", 0, False, [("e", 1, False, [])]),
+        ("third", 0, False, []),
+    ]
+
+
+def test_max_depth_flags_the_cut_off_threads(client, admin, make_ticket):
+    ticket_id = make_ticket()["id"]
+    thread(client, admin.headers, ticket_id)
+
+    page = tree(client, admin.headers, ticket_id, max_depth=1)
+
+    assert shape(page["items"])[0] == ("first", 0, False, [
+        ("a", 1, True, []),
+        ("d", 1, False, []),
+    ])
+
+
+def test_threads_are_paginated_by_their_root(client, admin, make_ticket):
+    ticket_id = make_ticket()["id"]
+    thread(client, admin.headers, ticket_id)
+
+    first = tree(client, admin.headers, ticket_id, limit=2)
+    rest = tree(client, admin.headers, ticket_id, limit=2, cursor=first["next_cursor"])
+
+    assert [node["content"] for node in first["items"]] == ["first", "second"]
+    # Whole threads on the page they start on
+    assert shape(first["items"][0]["replies"])[0][0] == "a"
+    assert [node["content"] for node in rest["items"]] == ["third"]
+    assert rest["next_cursor"] is None
@@ -0,0 +1,38 @@
+"""
+GET /tickets/projects/{id}/changes and tombstone pruning.
+"""
+from datetime import timedelta
+
+from app.core.versioning import prune_tombstones
+from app.models.ticket import utcnow
+
+
+def changes(client, headers, project_id, since):
+    return client.get(
+        f"/tickets/projects/{project_id}/changes", params={"since": since}, headers=headers
+    )
+
+
+def test_deletes_are_reported_until_pruned(client, admin, db, project, make_ticket):
+    kept = make_ticket()["id"]
+    deleted = make_ticket()["id"]
+    since = changes(client, admin.headers, project, 0).json()["version"]
+    client.delete(f"/tickets/{deleted}", headers=admin.headers)
+
+    response = changes(client, admin.headers, project, since)
+    assert response.status_code == 200
+    assert response.json()["deleted"] == [deleted]
+
+    assert prune_tombstones(db, utcnow() - timedelta(days=1)) == 0
+    assert prune_tombstones(db, utcnow() + timedelta(seconds=1)) == 1
+    db.commit()
+
+    # The token predates a delete that is no longer on record
+    response = changes(client, admin.headers, project, since)
+    assert response.status_code == 410
+
+    # A token taken after the pruned delete still syncs
+    current = client.patch(f"/tickets/{kept}", json={"title": "Renamed"}, headers=admin.headers)
+    response = changes(client, admin.headers, project, current.json()["version"] - 1)
+    assert response.status_code == 200
+    assert [ticket["id"] for ticket in response.json()["changed"]] == [kept]
@@ -0,0 +1,70 @@
+"""
+Conditional GETs: If-None-Match answers 304 until a write changes the
+resource, and the ETag follows the query string.
+"""
+import pytest
+
+
+@pytest.fixture
+def seeded(client, admin, project, make_ticket, make_user):
+    ticket = make_ticket()
+    client.post(f"/comments/tickets/{ticket['id']}", json={"content": "First"}, headers=admin.headers)
+    return {"project": project, "ticket": ticket["id"]}
+
+
+def add_comment(client, admin, seeded, make_user):
+    client.post(f"/comments/tickets/{seeded['ticket']}", json={"content": "More"}, headers=admin.headers)
+
+
+def edit_ticket(client, admin, seeded, make_user):
+    client.patch(f"/tickets/{seeded['ticket']}", json={"title": "Renamed"}, headers=admin.headers)
+
+
+def add_member(client, admin, seeded, make_user):
+    user = make_user("new@example.com")
+    client.post(f"/projects/{seeded['project']}/members", json={"user_id": user.id}, headers=admin.headers)
+
+
+# path, a write that must change it
+CACHED_READS = [
+    ("/tickets/projects/{project}", edit_ticket),
+    ("/tickets/projects/{project}", add_comment),  # one version per project covers comments too
+    ("/comments/tickets/{ticket}", add_comment),
+    ("/comments/tickets/{ticket}/tree", add_comment),
+    ("/projects/my", edit_ticket),
+    ("/projects/my", add_member),
+    ("/projects/{project}/members", add_member),
+]
+
+
+@pytest.mark.parametrize("path, write", CACHED_READS)
+def test_304_until_a_write(client, admin, developer, seeded, make_user, path, write):
+    path = path.format(**seeded)
+    headers = developer.headers
+
+    first = client.get(path, headers=headers)
+    assert first.status_code == 200, first.text
+    etag = first.headers["ETag"]
+
+    again = client.get(path, headers={**headers, "If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == etag
+
+    write(client, admin, seeded, make_user)
+
+    changed = client.get(path, headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_etag_covers_the_query_string(client, developer, seeded):
+    path = f"/tickets/projects/{seeded['project']}"
+    etag = client.get(path, headers=developer.headers).headers["ETag"]
+
+    response = client.get(
+        path, params={"status": "done"}, headers={**developer.headers, "If-None-Match": etag}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
@@ -0,0 +1,49 @@
+"""
+Cold-start budget: importing the app must stay under IMPORT_BUDGET_MS
+(default 1500). Runs ``python -X importtime -c "import app.main"`` in
+fresh interpreters, best of three to cut noise; on failure the message
+lists the slowest app modules.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "1500"))
+TARGET = "app.main"
+RUNS = 3
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def measure(target: str) -> dict[str, tuple[int, int]]:
+    """
+    Module -> (self µs, cumulative µs) for one cold import of ``target``.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True, text=True, cwd=ROOT, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        timings[module.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def test_app_imports_within_budget():
+    best = min((measure(TARGET) for _ in range(RUNS)), key=lambda timings: timings[TARGET][1])
+    total_ms = best[TARGET][1] / 1000
+
+    slowest = sorted(
+        ((cumulative_us, module) for module, (_, cumulative_us) in best.items()
+         if module.startswith("app.") and module != TARGET),
+        reverse=True,
+    )[:10]
+    report = "\n".join(f"  {us / 1000:8.1f} ms  {module}" for us, module in slowest)
+    assert total_ms <= BUDGET_MS, (
+        f"import {TARGET}: {total_ms:.0f} ms, over the {BUDGET_MS:.0f} ms budget\n{report}"
+    )
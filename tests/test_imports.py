@@ -0,0 +1,103 @@
+"""
+POST /import/projects/{id}/tickets and /comments: partial reports when a
+write fails, and refs resolved across requests.
+"""
+import json
+
+
+def ndjson(rows):
+    return "\n".join(json.dumps(row) for row in rows)
+
+
+def import_rows(client, headers, project_id, kind, rows, start=0):
+    return client.post(
+        f"/import/projects/{project_id}/{kind}",
+        params={"start": start},
+        content=ndjson(rows),
+        headers=headers,
+    )
+
+
+def import_tickets(client, headers, project_id, rows, start=0):
+    return import_rows(client, headers, project_id, "tickets", rows, start)
+
+
+def test_failed_write_returns_a_partial_report(client, admin, project):
+    rows = [{"ref": f"OLD-{i}", "title": f"Imported {i}"} for i in range(5)]
+    # Valid for the schema, but the database cannot store it
+    rows[2]["assignee_id"] = 2 ** 64
+
+    response = import_tickets(client, admin.headers, project, rows)
+    assert response.status_code == 200
+    report = response.json()
+    assert report["imported"] == 2
+    assert report["next_offset"] == 2
+    assert report["aborted"]["row"] == 2
+    assert report["aborted"]["error"]
+    assert list(report["id_map"]) == ["OLD-0", "OLD-1"]
+
+    tickets = client.get(f"/tickets/projects/{project}", headers=admin.headers).json()["items"]
+    assert sorted(ticket["id"] for ticket in tickets) == sorted(report["id_map"].values())
+
+    # Skip the bad row and resume
+    response = import_tickets(client, admin.headers, project, rows, start=3)
+    report = response.json()
+    assert report["aborted"] is None
+    assert report["imported"] == 2
+    assert report["next_offset"] == 5
+    assert list(report["id_map"]) == ["OLD-3", "OLD-4"]
+
+
+def test_comments_resolve_ticket_refs_of_a_resumed_ticket_import(client, admin, project):
+    rows = [{"ref": f"OLD-{i}", "title": f"Imported {i}"} for i in range(5)]
+    rows[2]["assignee_id"] = 2 ** 64
+    first = import_tickets(client, admin.headers, project, rows).json()
+    second = import_tickets(client, admin.headers, project, rows, start=3).json()
+
+    comments = [
+        {"ticket_ref": "OLD-0", "content": "from the first request"},
+        {"ticket_ref": "OLD-4", "content": "from the resumed one"},
+        {"ticket_ref": "OLD-2", "content": "its ticket was never imported"},
+    ]
+    report = import_rows(client, admin.headers, project, "comments", comments).json()
+
+    assert report["imported"] == 2
+    assert report["errors"] == [{"row": 2, "error": "Ticket not found"}]
+    for ticket_id in (first["id_map"]["OLD-0"], second["id_map"]["OLD-4"]):
+        assert len(client.get(f"/comments/tickets/{ticket_id}", headers=admin.headers).json()) == 1
+
+    # Refs are taken once per project
+    report = import_tickets(client, admin.headers, project, [{"ref": "OLD-0", "title": "Again"}]).json()
+    assert report["errors"] == [{"row": 0, "error": "Duplicate ref"}]
+
+
+def test_comment_parent_refs_resolve_within_a_chunk_and_across_requests(client, admin, project):
+    ticket_id = import_tickets(
+        client, admin.headers, project, [{"ref": "T-1", "title": "Imported"}]
+    ).json()["id_map"]["T-1"]
+
+    comments = [
+        {"ticket_ref": "T-1", "ref": "C-1", "content": "root"},
+        {"ticket_ref": "T-1", "ref": "C-2", "parent_ref": "C-1", "content": "reply"},
+        {"ticket_ref": "T-1", "ref": "C-3", "parent_ref": "C-2", "content": "nested reply"},
+        {"ticket_ref": "T-1", "parent_ref": "C-9", "content": "orphan"},
+        {"ticket_ref": "T-1", "parent_ref": "C-1", "content": "resumed reply"},
+    ]
+    report = import_rows(client, admin.headers, project, "comments", comments[:4]).json()
+    assert report["imported"] == 3
+    assert report["errors"] == [{"row": 3, "error": "Parent comment not found"}]
+    ids = report["id_map"]
+
+    report = import_rows(client, admin.headers, project, "comments", comments, start=4).json()
+    assert report["imported"] == 1
+
+    parents = {
+        comment["content"]: comment["parent_id"]
+        for comment in client.get(f"/comments/tickets/{ticket_id}", headers=admin.headers).json()
+    }
+    assert parents == {
+        "root": None,
+        "reply": ids["C-1"],
+        "nested reply": ids["C-2"],
+        "resumed reply": ids["C-1"],
+    }
@@ -0,0 +1,55 @@
+"""
+The hot routes' queries reach their tables through an index on the
+migrated schema (the checks of scripts/check_indexes.py, on SQLite;
+run the script itself against Postgres).
+"""
+from contextlib import contextmanager
+
+import pytest
+from alembic.config import Config
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from scripts.check_indexes import check, hot_queries
+from scripts.create_tables import ALEMBIC_INI, upgrade
+
+ROUTES = list(hot_queries(Session()))
+
+
+@contextmanager
+def migrated(path, *statements):
+    """
+    A session on a new database upgraded to head, then ``statements``.
+    """
+    engine = create_engine(f"sqlite:///{path}")
+    try:
+        with engine.connect() as connection:
+            config = Config(str(ALEMBIC_INI))
+            config.attributes["connection"] = connection
+            upgrade(config)
+            for statement in statements:
+                connection.exec_driver_sql(statement)
+            connection.commit()
+            with Session(bind=connection) as db:
+                yield db
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def plans(tmp_path_factory):
+    with migrated(tmp_path_factory.mktemp("indexes") / "migrated.db") as db:
+        return check(db)
+
+
+@pytest.mark.parametrize("route", ROUTES)
+def test_hot_query_uses_an_index(plans, route):
+    scans, details = plans[route]
+    assert scans == [], "; ".join(details)
+
+
+def test_a_missing_index_is_caught(tmp_path):
+    with migrated(tmp_path / "unindexed.db", "DROP INDEX ix_ticket_events_ticket_created") as db:
+        scans, _ = check(db)["activity"]
+
+    assert scans == ["SCAN ticket_events"]
@@ -0,0 +1,153 @@
+"""
+The jobs table queue (app.core.jobs): retries with backoff, leases that
+expire with their worker, and dedup_key collapsing queued duplicates.
+Runs a queue of its own, on a clock the tests move by hand.
+"""
+from datetime import timedelta
+
+import pytest
+
+from app.core import jobs
+from app.core.jobs import JobQueue
+from app.models.job import Job
+from app.models.ticket import utcnow
+
+LEASE = 60
+RETRY_BASE = 10
+
+
+class Clock:
+    def __init__(self):
+        self.now = utcnow()
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(jobs, "utcnow", clock)
+    return clock
+
+
+@pytest.fixture
+def queue():
+    return JobQueue(
+        workers=0, poll_seconds=1, lease_seconds=LEASE,
+        max_attempts=3, retry_base_seconds=RETRY_BASE,
+    )
+
+
+def flaky(fail_times: int):
+    calls = []
+
+    def handler(db, payload):
+        calls.append(payload)
+        if len(calls) <= fail_times:
+            raise RuntimeError(f"failure {len(calls)}")
+    return handler, calls
+
+
+def enqueue(db, queue, name, payload=None, **options):
+    queue.enqueue(db, name, payload or {}, **options)
+    db.commit()
+
+
+def only_job(db) -> Job:
+    db.expire_all()
+    (job,) = db.query(Job).all()
+    return job
+
+
+def test_failures_retry_with_exponential_backoff(db, queue, clock):
+    handler, calls = flaky(fail_times=2)
+    queue.handler("flaky")(handler)
+    enqueue(db, queue, "flaky", {"n": 1})
+
+    assert queue.run_pending() == 1
+    job = only_job(db)
+    assert (job.status, job.attempts, job.last_error) == ("queued", 1, "RuntimeError: failure 1")
+
+    clock.advance(RETRY_BASE - 1)
+    assert queue.run_pending() == 0  # not due yet
+    clock.advance(1)
+    assert queue.run_pending() == 1
+    assert only_job(db).attempts == 2
+
+    clock.advance(2 * RETRY_BASE - 1)  # the wait doubled
+    assert queue.run_pending() == 0
+    clock.advance(1)
+    assert queue.run_pending() == 1
+
+    assert db.query(Job).count() == 0
+    assert calls == [{"n": 1}] * 3
+    assert queue.stats() == {"workers": 0, "succeeded": 1, "retried": 2, "failed": 0}
+
+
+def test_jobs_out_of_attempts_stay_failed(db, queue, clock):
+    handler, _ = flaky(fail_times=99)
+    queue.handler("broken", max_attempts=2)(handler)
+    enqueue(db, queue, "broken")
+
+    queue.run_pending()
+    clock.advance(RETRY_BASE)
+    queue.run_pending()
+    clock.advance(jobs.MAX_RETRY_SECONDS)
+
+    assert queue.run_pending() == 0
+    job = only_job(db)
+    assert (job.status, job.attempts, job.run_at) == ("failed", 2, None)
+    assert queue.stats()["failed"] == 1
+
+
+def test_an_expired_lease_hands_the_job_to_another_worker(db, queue, clock):
+    handler, calls = flaky(fail_times=0)
+    queue.handler("slow")(handler)
+    enqueue(db, queue, "slow")
+
+    # A worker claims it, then dies without finishing
+    assert queue._claim(db) is not None
+    assert only_job(db).status == "running"
+
+    clock.advance(LEASE - 1)
+    assert queue.run_pending() == 0
+    clock.advance(1)
+    assert queue.run_pending() == 1
+    assert calls == [{}]
+    assert db.query(Job).count() == 0
+
+
+def test_a_job_whose_lease_expired_every_time_fails(db, queue, clock):
+    queue.handler("doomed")(lambda db, payload: None)
+    enqueue(db, queue, "doomed")
+
+    for _ in range(3):
+        queue._claim(db)
+        clock.advance(LEASE)
+
+    assert queue.run_pending() == 1
+    job = only_job(db)
+    assert job.status == "failed"
+    assert "Lease expired" in job.last_error
+
+
+def test_dedup_key_collapses_queued_duplicates_only(db, queue, clock):
+    handler, calls = flaky(fail_times=0)
+    queue.handler("notify")(handler)
+
+    enqueue(db, queue, "notify", {"n": 1}, dedup_key="ticket:1")
+    enqueue(db, queue, "notify", {"n": 2}, dedup_key="ticket:1")
+    enqueue(db, queue, "notify", {"n": 3}, dedup_key="ticket:2")
+    assert db.query(Job).count() == 2
+
+    # Claimed: a later change needs its own run
+    job = queue._claim(db)
+    enqueue(db, queue, "notify", {"n": 4}, dedup_key="ticket:1")
+    queue._execute(db, job)
+
+    assert queue.run_pending() == 2
+    assert sorted(payload["n"] for payload in calls) == [1, 3, 4]
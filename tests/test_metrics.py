@@ -0,0 +1,38 @@
+"""
+Instrumentation stays private by default: no Server-Timing header, and
+/metrics needs METRICS_TOKEN unless made public.
+"""
+from dataclasses import replace
+
+import pytest
+
+from app.core import metrics as core_metrics
+from app.routes import metrics as metrics_route
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    def configure(**overrides):
+        for module in (core_metrics, metrics_route):
+            monkeypatch.setattr(module, "settings", replace(module.settings, **overrides))
+    return configure
+
+
+def test_server_timing_is_opt_in(client, configure):
+    assert "server-timing" not in client.get("/").headers
+
+    configure(server_timing=True)
+    assert "db;dur=" in client.get("/").headers["server-timing"]
+
+
+def test_metrics_need_a_token_unless_public(client, configure):
+    assert client.get("/metrics").status_code == 403
+
+    configure(metrics_token="scrape")
+    assert client.get("/metrics").status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape"})
+    assert response.status_code == 200
+    assert "activity_writer_written" in response.text
+
+    configure(metrics_token=None, metrics_public=True)
+    assert client.get("/metrics").status_code == 200
@@ -0,0 +1,139 @@
+"""
+Migrations: an original-schema database (create_all before there were
+migrations) and an empty one both upgrade to exactly the models.
+"""
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import (
+    Column, DateTime, Enum, ForeignKey, Integer, MetaData, String, Table, Text,
+    create_engine, func, inspect, text,
+)
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.core.stats import rebuild_project_stats
+from scripts.create_tables import ALEMBIC_INI, upgrade
+import app.main  # noqa: F401 (registers every model)
+
+# The tables as the first release's create_all built them
+original = MetaData()
+Table(
+    "users", original,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("email", String, unique=True, nullable=False),
+    Column("password", String, nullable=False),
+    Column("role", String),
+)
+Table(
+    "projects", original,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("name", String, nullable=False),
+    Column("description", String),
+    Column("owner_id", Integer, ForeignKey("users.id")),
+)
+Table(
+    "project_members", original,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, ForeignKey("users.id")),
+    Column("project_id", Integer, ForeignKey("projects.id")),
+)
+Table(
+    "tickets", original,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("title", String(255), nullable=False),
+    Column("description", Text),
+    Column("status", Enum("todo", "in_progress", "done", name="ticket_status_enum"), nullable=False, index=True),
+    Column("priority", Enum("low", "medium", "high", "critical", name="ticket_priority_enum"), nullable=False, index=True),
+    Column("type", Enum("bug", "task", "feature", name="ticket_type_enum"), nullable=False),
+    Column("project_id", Integer, ForeignKey("projects.id"), nullable=False, index=True),
+    Column("reporter_id", Integer, ForeignKey("users.id"), nullable=False),
+    Column("assignee_id", Integer, ForeignKey("users.id"), index=True),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Table(
+    "comments", original,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("content", Text, nullable=False),
+    Column("created_at", DateTime),
+    Column("ticket_id", Integer, ForeignKey("tickets.id")),
+    Column("user_id", Integer, ForeignKey("users.id")),
+    Column("parent_id", Integer, ForeignKey("comments.id")),
+)
+
+
+def migrate(connection):
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["connection"] = connection
+    upgrade(config)
+    connection.commit()
+    return config
+
+
+def schema_diff(connection) -> list:
+    context = MigrationContext.configure(connection)
+    # Expression (full-text) indexes are Postgres only
+    return [
+        diff for diff in compare_metadata(context, Base.metadata)
+        if not (diff[0] == "add_index" and diff[1].name.endswith("_search"))
+    ]
+
+
+def test_original_schema_upgrades_to_head(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'original.db'}")
+    original.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO users (id, email, password, role) VALUES "
+            "(1, 'admin@example.com', 'x', 'admin'), (2, 'dev@example.com', 'x', 'developer')"
+        ))
+        connection.execute(text("INSERT INTO projects (id, name, owner_id) VALUES (1, 'Old', 1)"))
+        connection.execute(text(
+            "INSERT INTO project_members (user_id, project_id) VALUES (2, 1), (2, 1)"
+        ))
+        connection.execute(text(
+            "INSERT INTO tickets (id, title, status, priority, type, project_id, reporter_id, assignee_id) "
+            "VALUES (1, 'A', 'todo', 'high', 'bug', 1, 1, 2), (2, 'B', 'done', 'low', 'task', 1, 1, NULL)"
+        ))
+        connection.execute(text(
+            "INSERT INTO comments (content, ticket_id, user_id) VALUES ('First', 1, 2)"
+        ))
+
+    with engine.connect() as connection:
+        migrate(connection)
+        assert schema_diff(connection) == []
+
+        tickets = connection.execute(
+            text("SELECT rank, version, created_at, updated_at FROM tickets ORDER BY id")
+        ).all()
+        assert [(row.rank, row.version) for row in tickets] == [("i", 0), ("i", 0)]
+        assert all(row.created_at and row.updated_at for row in tickets)
+        assert connection.execute(text("SELECT COUNT(*) FROM project_members")).scalar() == 1
+
+        backfilled = set(connection.execute(
+            text("SELECT project_id, dimension, value, count FROM project_ticket_counts")
+        ))
+
+    # The migration's counters are what the app would recount
+    with engine.connect() as connection:
+        with Session(connection) as db:
+            rebuild_project_stats(db)
+            recounted = set(connection.execute(
+                text("SELECT project_id, dimension, value, count FROM project_ticket_counts")
+            ))
+            db.rollback()
+    assert backfilled == recounted
+
+
+def test_empty_database_upgrades_and_downgrades(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+    with engine.connect() as connection:
+        config = migrate(connection)
+        assert schema_diff(connection) == []
+
+        connection.commit()
+        command.downgrade(config, "base")
+        connection.commit()
+        assert inspect(connection).get_table_names() == ["alembic_version"]
@@ -0,0 +1,63 @@
+"""
+Kanban moves (POST /tickets/{id}/move).
+"""
+
+
+def column(client, headers, project_id, status="todo") -> list[int]:
+    response = client.get(
+        f"/tickets/projects/{project_id}",
+        params={"sort": "rank", "status": status},
+        headers=headers,
+    )
+    return [ticket["id"] for ticket in response.json()["items"]]
+
+
+def test_move_between_neighbours(client, admin, project, make_ticket):
+    ids = [make_ticket()["id"] for _ in range(4)]
+
+    response = client.post(
+        f"/tickets/{ids[3]}/move",
+        json={"status": "todo", "after_id": ids[0], "before_id": ids[1]},
+        headers=admin.headers,
+    )
+
+    assert response.status_code == 200, response.text
+    assert column(client, admin.headers, project) == [ids[0], ids[3], ids[1], ids[2]]
+
+
+def test_move_with_crossed_neighbours_is_rejected(client, admin, project, make_ticket):
+    ids = [make_ticket()["id"] for _ in range(5)]
+
+    response = client.post(
+        f"/tickets/{ids[4]}/move",
+        json={"status": "todo", "after_id": ids[3], "before_id": ids[0]},
+        headers=admin.headers,
+    )
+
+    assert response.status_code == 409
+    assert column(client, admin.headers, project) == ids
+
+
+def test_status_change_appends_to_new_column(client, admin, project, make_ticket):
+    ids = [make_ticket()["id"] for _ in range(3)]
+    client.patch(f"/tickets/{ids[2]}", json={"status": "done"}, headers=admin.headers)
+
+    # Its todo rank is above ids[2]'s: kept, it would land first
+    response = client.patch(f"/tickets/{ids[0]}", json={"status": "done"}, headers=admin.headers)
+
+    assert response.status_code == 200, response.text
+    assert column(client, admin.headers, project, "done") == [ids[2], ids[0]]
+
+
+def test_bulk_move_appends_to_new_column(client, admin, project, make_ticket):
+    ids = [make_ticket()["id"] for _ in range(4)]
+    client.patch(f"/tickets/{ids[3]}", json={"status": "in_progress"}, headers=admin.headers)
+
+    response = client.post(
+        "/tickets/bulk/move",
+        json={"ids": [ids[1], ids[0], ids[3]], "status": "in_progress"},
+        headers=admin.headers,
+    )
+
+    assert response.status_code == 200, response.text
+    assert column(client, admin.headers, project, "in_progress") == [ids[3], ids[1], ids[0]]
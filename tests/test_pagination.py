@@ -0,0 +1,99 @@
+"""
+Keyset pagination of GET /tickets/projects/{id}: every sort, ties,
+tickets added mid-walk and the include_archived merge.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+
+from app.core.archive import archive_done_tickets
+from app.models.archived_ticket import ArchivedTicket
+from app.models.ticket import Ticket
+
+SORTS = {"created_at": True, "updated_at": True, "rank": False}  # highest first?
+
+
+def walk(client, headers, project_id, between_pages=None, **params) -> list[dict]:
+    """
+    Every ticket, two per page; ``between_pages`` runs after the first.
+    """
+    items, cursor = [], None
+    while True:
+        response = client.get(
+            f"/tickets/projects/{project_id}",
+            params={**params, "limit": 2, **({"cursor": cursor} if cursor else {})},
+            headers=headers,
+        )
+        assert response.status_code == 200, response.text
+        page = response.json()
+        items += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items
+        if between_pages is not None:
+            between_pages()
+            between_pages = None
+
+
+def expected(items: list[dict], sort: str) -> list[int]:
+    ordered = sorted(items, key=lambda item: (item[sort], item["id"]), reverse=SORTS[sort])
+    return [item["id"] for item in ordered]
+
+
+def tie(db, model, ids, **values):
+    db.execute(update(model).where(model.id.in_(ids)).values(**values))
+    db.commit()
+
+
+@pytest.mark.parametrize("sort", SORTS)
+def test_ties_are_broken_by_id(client, admin, project, make_ticket, db, sort):
+    ids = [make_ticket(title=f"Ticket {i}")["id"] for i in range(7)]
+    moment = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    # Two runs of equal values, with a distinct one between them
+    tie(db, Ticket, ids[:3], created_at=moment, updated_at=moment, rank="m")
+    tie(db, Ticket, ids[3:4], created_at=moment + timedelta(days=1),
+        updated_at=moment + timedelta(days=1), rank="n")
+    tie(db, Ticket, ids[4:], created_at=moment, updated_at=moment, rank="m")
+
+    items = walk(client, admin.headers, project, sort=sort)
+
+    assert [item["id"] for item in items] == expected(items, sort)
+    assert sorted(item["id"] for item in items) == ids
+
+
+@pytest.mark.parametrize("sort", SORTS)
+def test_inserts_mid_walk_neither_repeat_nor_skip(client, admin, project, make_ticket, sort):
+    ids = [make_ticket(title=f"Ticket {i}")["id"] for i in range(6)]
+    added = []
+
+    items = walk(
+        client, admin.headers, project,
+        between_pages=lambda: added.extend(make_ticket()["id"] for _ in range(3)),
+        sort=sort,
+    )
+    seen = [item["id"] for item in items]
+
+    assert len(seen) == len(set(seen))
+    assert set(ids) <= set(seen)
+    assert [ticket_id for ticket_id in seen if ticket_id in ids] == expected(
+        [item for item in items if item["id"] in ids], sort
+    )
+
+
+@pytest.mark.parametrize("sort", SORTS)
+def test_archived_tickets_merge_into_the_order(client, admin, project, make_ticket, db, sort):
+    ids = [make_ticket(title=f"Ticket {i}")["id"] for i in range(8)]
+    for ticket_id in ids[1::2]:
+        client.patch(f"/tickets/{ticket_id}", json={"status": "done"}, headers=admin.headers)
+    assert archive_done_tickets(db, older_than_days=-1) == 4
+    # Ties straddling the two tables
+    moment = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for model in (Ticket, ArchivedTicket):
+        tie(db, model, ids[2:6], created_at=moment, updated_at=moment, rank="m")
+
+    items = walk(client, admin.headers, project, sort=sort, include_archived=True)
+
+    assert [item["id"] for item in items] == expected(items, sort)
+    assert sorted(item["id"] for item in items) == ids
+    assert {item["id"] for item in items if item["archived"]} == set(ids[1::2])
@@ -0,0 +1,117 @@
+"""
+Project membership on every project-scoped route: a developer who would
+otherwise be allowed (assignee, comment author) is refused once they
+leave the project.
+"""
+import re
+
+import pytest
+from fastapi.routing import APIRoute
+
+from app.core.archive import archive_done_tickets
+from app.core.permissions import invalidate_memberships
+from app.core.security import create_access_token
+from app.main import app
+from app.models.project_member import ProjectMember
+
+NOT_A_MEMBER = "Not a member of this project"
+
+# method, path, query, body. {project}, {ticket}, {archived}, {comment}
+# are filled in from the fixture below.
+MEMBER_ROUTES = [
+    ("POST", "/tickets/projects/{project}", {}, {"title": "New"}),
+    ("GET", "/tickets/projects/{project}", {}, None),
+    ("GET", "/tickets/projects/{project}/export", {}, None),
+    ("GET", "/tickets/projects/{project}/changes", {"since": "0"}, None),
+    ("PATCH", "/tickets/{ticket}", {}, {"title": "Renamed"}),
+    ("POST", "/tickets/{ticket}/move", {}, {"status": "done"}),
+    ("GET", "/tickets/{ticket}/activity", {}, None),
+    ("POST", "/tickets/{archived}/restore", {}, None),
+    ("POST", "/tickets/bulk/projects/{project}", {}, {"items": [{"title": "New"}]}),
+    ("POST", "/comments/tickets/{ticket}", {}, {"content": "Hi"}),
+    ("GET", "/comments/tickets/{ticket}", {}, None),
+    ("GET", "/comments/tickets/{ticket}/tree", {}, None),
+    ("DELETE", "/comments/{comment}", {}, None),
+    ("GET", "/projects/{project}/members", {}, None),
+    ("GET", "/projects/{project}/stats", {}, None),
+    ("GET", "/projects/{project}/analytics", {}, None),
+    ("GET", "/search/", {"project_id": "{project}", "q": "crash"}, None),
+    ("GET", "/events/projects/{project}", {"token": "{token}"}, None),
+]
+
+# Refused to every non-admin before membership matters
+ADMIN_ROUTES = {
+    ("POST", "/projects/{project_id}/members"),
+    ("DELETE", "/tickets/{ticket_id}"),
+    ("POST", "/tickets/bulk/delete"),
+    ("POST", "/import/projects/{project_id}/tickets"),
+    ("POST", "/import/projects/{project_id}/comments"),
+}
+
+# Per item (see tests/test_bulk.py)
+BULK_ROUTES = {
+    ("POST", "/tickets/bulk/update"),
+    ("POST", "/tickets/bulk/move"),
+}
+
+SCOPED = re.compile(r"\{(project_id|ticket_id|comment_id)\}")
+
+
+def scoped_routes():
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        params = {param.name for param in route.dependant.query_params}
+        if SCOPED.search(route.path) or "project_id" in params or route.path.startswith("/tickets/bulk"):
+            for method in route.methods:
+                yield method, route.path
+
+
+@pytest.fixture
+def former_member(client, admin, developer, project, make_ticket, db):
+    ticket = make_ticket(assignee_id=developer.id)
+    comment = client.post(
+        f"/comments/tickets/{ticket['id']}", json={"content": "Mine"}, headers=developer.headers
+    ).json()
+    archived = make_ticket(assignee_id=developer.id, title="Old crash")
+    client.patch(f"/tickets/{archived['id']}", json={"status": "done"}, headers=developer.headers)
+    assert archive_done_tickets(db, older_than_days=-1) == 1
+
+    # Every route above succeeds for them here; now they leave
+    db.query(ProjectMember).filter(ProjectMember.user_id == developer.id).delete()
+    db.commit()
+    invalidate_memberships(developer.id)
+
+    token = create_access_token({"sub": str(developer.id), "email": "dev@example.com"})
+    return {
+        "project": project,
+        "ticket": ticket["id"],
+        "archived": archived["id"],
+        "comment": comment["id"],
+        "token": token,
+    }
+
+
+def test_every_project_scoped_route_is_covered():
+    covered = {
+        (method, re.sub(r"\{(\w+)\}", lambda m: {
+            "project": "{project_id}", "ticket": "{ticket_id}",
+            "archived": "{ticket_id}", "comment": "{comment_id}",
+        }[m.group(1)], path))
+        for method, path, _, _ in MEMBER_ROUTES
+    }
+    assert set(scoped_routes()) <= covered | ADMIN_ROUTES | BULK_ROUTES
+
+
+@pytest.mark.parametrize("method, path, query, body", MEMBER_ROUTES)
+def test_non_members_are_refused(client, developer, former_member, method, path, query, body):
+    response = client.request(
+        method,
+        path.format(**former_member),
+        params={key: value.format(**former_member) for key, value in query.items()},
+        json=body,
+        headers=developer.headers,
+    )
+
+    assert response.status_code == 403, response.text
+    assert response.json()["detail"] == NOT_A_MEMBER
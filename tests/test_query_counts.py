@@ -0,0 +1,95 @@
+"""
+N+1 guard: each endpoint runs the same number of SQL statements for
+one row as for many.
+"""
+from app.core.activity import activity_writer
+from app.core.database import get_engine
+from app.core.instrumentation import count_queries
+
+MANY = 12
+
+
+def statements(client, method: str, url: str, headers: dict, **kwargs) -> int:
+    # Buffered activity is written by another thread: not this request's
+    activity_writer.flush()
+    with count_queries(get_engine()) as counter:
+        response = client.request(method, url, headers=headers, **kwargs)
+    assert response.status_code == 200, response.text
+    return counter.count
+
+
+def add_assignees(make_user, count: int) -> list[int]:
+    return [make_user(f"dev{i}@example.com").id for i in range(count)]
+
+
+def test_ticket_list(client, admin, project, make_ticket, make_user):
+    url = f"/tickets/projects/{project}"
+    assignees = add_assignees(make_user, MANY)
+    make_ticket(assignee_id=assignees[0])
+    client.get(url, headers=admin.headers)  # warm the auth caches
+    one = statements(client, "GET", url, admin.headers)
+
+    for assignee_id in assignees[1:]:
+        make_ticket(assignee_id=assignee_id)
+    many = statements(client, "GET", url, admin.headers)
+
+    assert one == many
+
+
+def test_dashboard(client, admin, project, make_ticket):
+    url = f"/projects/{project}/stats"
+    make_ticket()
+    client.get(url, headers=admin.headers)
+    one = statements(client, "GET", url, admin.headers)
+
+    for priority in ["low", "medium", "high", "critical"] * 3:
+        make_ticket(priority=priority)
+    many = statements(client, "GET", url, admin.headers)
+
+    assert one == many
+
+
+def test_comment_list(client, admin, project, make_ticket, make_user):
+    ticket_id = make_ticket()["id"]
+    url = f"/comments/tickets/{ticket_id}"
+    authors = [admin] + [make_user(f"author{i}@example.com", "admin") for i in range(MANY)]
+    client.post(url, json={"content": "first"}, headers=authors[0].headers)
+    client.get(url, headers=admin.headers)
+    one = statements(client, "GET", url, admin.headers)
+
+    parent_id = None
+    for i, author in enumerate(authors[1:]):
+        response = client.post(
+            url, json={"content": f"reply {i}", "parent_id": parent_id}, headers=author.headers
+        )
+        parent_id = response.json()["id"]
+    many = statements(client, "GET", url, admin.headers)
+
+    assert one == many
+
+
+def test_ticket_create(client, admin, project, make_ticket, developer):
+    url = f"/tickets/projects/{project}"
+    make_ticket()
+    body = {"title": "New", "assignee_id": developer.id}
+    client.get(url, headers=admin.headers)
+    one = statements(client, "POST", url, admin.headers, json=body)
+
+    for _ in range(MANY):
+        make_ticket(assignee_id=developer.id)
+    many = statements(client, "POST", url, admin.headers, json=body)
+
+    assert one == many
+
+
+def test_ticket_update(client, admin, project, make_ticket, developer):
+    ticket_id = make_ticket()["id"]
+    url = f"/tickets/{ticket_id}"
+    client.get(f"/tickets/projects/{project}", headers=admin.headers)
+    one = statements(client, "PATCH", url, admin.headers, json={"title": "Renamed"})
+
+    for _ in range(MANY):
+        make_ticket(assignee_id=developer.id)
+    many = statements(client, "PATCH", url, admin.headers, json={"title": "Renamed again"})
+
+    assert one == many
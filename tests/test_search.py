@@ -0,0 +1,102 @@
+"""
+GET /search/ (the in-process index on SQLite).
+"""
+
+
+def search(client, headers, project_id, q) -> list[dict]:
+    response = client.get("/search/", params={"project_id": project_id, "q": q}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_snippets_escape_ticket_and_comment_text(client, admin, project, make_ticket):
+    ticket = make_ticket(
+        title="Broken <b>form</b>",
+        description='Crash: <img src=x onerror="alert(1)"> on submit',
+    )
+    client.post(
+        f"/comments/tickets/{ticket['id']}",
+        json={"content": "<script>steal()</script> same crash here, crashing twice"},
+        headers=admin.headers,
+    )
+
+    hits = search(client, admin.headers, project, "crash")
+
+    assert len(hits) == 1
+    snippet = hits[0]["snippet"]
+    assert "<img" not in snippet and "<script" not in snippet
+    assert "&lt;" in snippet
+    assert snippet.replace("<mark>", "").replace("</mark>", "").count("<") == 0
+    assert "<mark>" in snippet
+
+
+def test_title_only_match_is_highlighted(client, admin, project, make_ticket):
+    make_ticket(title="Sidebar flickers", description="Seen on every page load")
+
+    hits = search(client, admin.headers, project, "flicker")
+
+    assert "<mark>flickers</mark>" in hits[0]["snippet"]
+
+
+def test_index_built_during_a_write_is_not_cached(client, admin, project, make_ticket, monkeypatch):
+    from app.core.search import search_index
+
+    make_ticket(title="Login crash")
+    build = search_index._build
+
+    def racing_build(db, project_id):
+        built = build(db, project_id)
+        search_index.invalidate(project_id + 1)  # a write lands mid-build
+        return built
+
+    monkeypatch.setattr(search_index, "_build", racing_build)
+    assert len(search(client, admin.headers, project, "crash")) == 1
+    assert project not in search_index.projects
+
+    monkeypatch.setattr(search_index, "_build", build)
+    assert len(search(client, admin.headers, project, "crash")) == 1
+    assert project in search_index.projects
+
+
+def test_searches_run_while_the_index_is_written(db, project, make_ticket):
+    import sys
+    import threading
+    from types import SimpleNamespace
+
+    from app.core.search import search_index
+
+    for i in range(50):
+        make_ticket(title=f"Crash number {i}", description="crash crash crash")
+    search_index.get(db, project)  # build and cache it
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads as often as possible
+
+    done = threading.Event()
+    errors = []
+
+    def write():
+        try:
+            i = 0
+            while not done.is_set():
+                ticket_id = 10_000 + i % 200
+                if i % 2:
+                    search_index.remove_ticket(ticket_id)
+                else:
+                    search_index.index_ticket(SimpleNamespace(
+                        id=ticket_id, project_id=project,
+                        title=f"crash{i} crashed", description="crash " * 20,
+                    ))
+                i += 1
+        except Exception as exc:  # pragma: no cover - the failure being tested
+            errors.append(exc)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        for _ in range(2000):
+            search_index.search(db, project, ["cra"])
+    finally:
+        done.set()
+        writer.join()
+        sys.setswitchinterval(interval)
+    assert errors == []
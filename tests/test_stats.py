@@ -0,0 +1,68 @@
+"""
+Dashboard counters (project_ticket_counts) stay equal to a recount from
+the tickets and archived_tickets tables.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.archive import archive_done_tickets
+from app.core.stats import project_stats, rebuild_project_stats
+
+
+def recounted(db, project_id: int) -> dict:
+    rebuild_project_stats(db, project_id)
+    db.commit()
+    return project_stats(db, project_id)
+
+
+def test_concurrent_status_changes_keep_counters_exact(client, admin, db, project, make_ticket):
+    ticket_id = make_ticket()["id"]
+    statuses = ["in_progress", "done", "todo"] * 8
+
+    def change(status):
+        return client.patch(
+            f"/tickets/{ticket_id}", json={"status": status}, headers=admin.headers
+        ).status_code
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert set(pool.map(change, statuses)) == {200}
+    counted = client.get(f"/projects/{project}/stats", headers=admin.headers).json()
+
+    assert counted["by_status"] == recounted(db, project)["by_status"]
+    assert counted["total"] == 1
+
+
+def test_counters_follow_moves_and_bulk_writes(client, admin, developer, db, project, make_ticket):
+    ids = [make_ticket(priority="high")["id"] for _ in range(5)]
+    client.post(f"/tickets/{ids[0]}/move", json={"status": "done"}, headers=admin.headers)
+    client.post(
+        "/tickets/bulk/update",
+        json={"ids": ids[1:3], "changes": {"assignee_id": developer.id, "priority": "low"}},
+        headers=admin.headers,
+    )
+    client.post("/tickets/bulk/move", json={"ids": ids[2:], "status": "in_progress"}, headers=admin.headers)
+    client.post("/tickets/bulk/delete", json={"ids": [ids[4]]}, headers=admin.headers)
+    client.delete(f"/tickets/{ids[3]}", headers=admin.headers)
+
+    counted = client.get(f"/projects/{project}/stats", headers=admin.headers).json()
+
+    assert counted == recounted(db, project)
+    assert counted["total"] == 3
+
+
+def test_archiving_keeps_the_total(client, admin, db, project, make_ticket):
+    ids = [make_ticket()["id"] for _ in range(3)]
+    for ticket_id in ids[:2]:
+        client.patch(f"/tickets/{ticket_id}", json={"status": "done"}, headers=admin.headers)
+    assert archive_done_tickets(db, older_than_days=-1) == 2
+
+    counted = client.get(f"/projects/{project}/stats", headers=admin.headers).json()
+    assert counted == recounted(db, project)
+    assert (counted["total"], counted["active"], counted["archived"]) == (3, 1, 2)
+    assert counted["by_status"] == {"todo": 1}
+    assert counted["archived_by_status"] == {"done": 2}
+
+    client.post(f"/tickets/{ids[0]}/restore", headers=admin.headers)
+    counted = client.get(f"/projects/{project}/stats", headers=admin.headers).json()
+    assert counted == recounted(db, project)
+    assert (counted["total"], counted["active"], counted["archived"]) == (3, 2, 1)
+    assert counted["by_status"] == {"todo": 1, "done": 1}